@@ -0,0 +1,174 @@
+"""
+Статистически корректные замеры времени выполнения функций
+
+Каждый замер состоит из прогрева, автоматического подбора числа вызовов на
+выборку (как timeit.autorange), серии выборок и робастной статистики:
+медиана, межквартильный размах и доверительный интервал медианы.
+Результаты сохраняются в JSON, который читают функции построения графиков.
+"""
+
+import gc
+import json
+import math
+import platform
+import statistics
+import time
+
+
+def _calibrate(func, args, min_sample_time):
+    """
+    Подбор числа вызовов на одну выборку
+
+    Число вызовов растет по ряду 1, 2, 5, 10, 20, 50, ... пока одна выборка
+    не займет хотя бы min_sample_time секунд.
+    """
+    loops = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = loops * multiplier
+            start = time.perf_counter()
+            for _ in range(number):
+                func(*args)
+            if time.perf_counter() - start >= min_sample_time:
+                return number
+        loops *= 10
+
+
+def _median_confidence_interval(sorted_samples, confidence):
+    """
+    Доверительный интервал медианы по порядковым статистикам
+
+    Номера границ берутся из нормального приближения биномиального
+    распределения: n/2 -+ z * sqrt(n) / 2.
+    """
+    n = len(sorted_samples)
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * math.sqrt(n) / 2
+    low = max(0, math.floor(n / 2 - half_width))
+    high = min(n - 1, math.ceil(n / 2 + half_width) - 1)
+    return sorted_samples[low], sorted_samples[high]
+
+
+def summarize(samples, confidence=0.95):
+    """
+    Статистика выборок времени
+
+    Args:
+        samples (list): Время одного вызова в каждой выборке (секунды)
+        confidence (float): Уровень доверия интервала медианы
+
+    Returns:
+        dict: median, q1, q3, iqr, mean, stdev, min, max, ci_low, ci_high
+    """
+    ordered = sorted(samples)
+    if len(ordered) >= 2:
+        q1, _, q3 = statistics.quantiles(ordered, n=4, method="inclusive")
+        stdev = statistics.stdev(ordered)
+    else:
+        q1 = q3 = ordered[0]
+        stdev = 0.0
+    ci_low, ci_high = _median_confidence_interval(ordered, confidence)
+    return {
+        "median": statistics.median(ordered),
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "mean": statistics.fmean(ordered),
+        "stdev": stdev,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "confidence": confidence,
+    }
+
+
+def benchmark(
+    func,
+    *args,
+    setup=None,
+    warmup=1,
+    min_repeat=5,
+    max_repeat=1000,
+    max_time=1.0,
+    min_sample_time=0.001,
+    confidence=0.95,
+):
+    """
+    Замер времени одного вызова func(*args)
+
+    Если задан setup, он вызывается перед каждым вызовом вне замера
+    (например, сброс кеша мемоизации), и каждая выборка - ровно один вызов.
+    Иначе число вызовов на выборку подбирается автоматически, чтобы
+    разрешение таймера не искажало результат для быстрых функций.
+    Во время замера сборщик мусора отключается, как в timeit.
+
+    Args:
+        func (callable): Измеряемая функция
+        *args: Аргументы функции
+        setup (callable): Подготовка перед каждым вызовом (не замеряется)
+        warmup (int): Количество прогревочных вызовов
+        min_repeat (int): Минимальное количество выборок
+        max_repeat (int): Максимальное количество выборок
+        max_time (float): Бюджет времени на выборки (секунды)
+        min_sample_time (float): Минимальная длительность выборки без setup
+        confidence (float): Уровень доверия интервала медианы
+
+    Returns:
+        dict: Статистика summarize() плюс samples, loops и repeat
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func(*args)
+
+    loops = 1 if setup is not None else _calibrate(func, args, min_sample_time)
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    started = time.perf_counter()
+    try:
+        while len(samples) < max_repeat:
+            if setup is not None:
+                setup()
+            gc.disable()
+            start = time.perf_counter()
+            for _ in range(loops):
+                func(*args)
+            elapsed = time.perf_counter() - start
+            if gc_enabled:
+                gc.enable()
+            samples.append(elapsed / loops)
+
+            if len(samples) >= min_repeat and time.perf_counter() - started >= max_time:
+                break
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    result = summarize(samples, confidence)
+    result.update({"samples": samples, "loops": loops, "repeat": len(samples)})
+    return result
+
+
+def system_info():
+    """Характеристики системы для сохранения вместе с результатами"""
+    return {
+        "os": f"{platform.system()} {platform.release()}",
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def save_results(results, path):
+    """Сохранение результатов замеров в JSON вместе с характеристиками системы"""
+    payload = {"system": system_info(), "benchmarks": results}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+
+
+def load_results(path):
+    """Загрузка результатов, сохраненных save_results"""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["benchmarks"]
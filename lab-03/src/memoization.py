@@ -2,23 +2,614 @@
 Оптимизация рекурсивных алгоритмов с помощью мемоизации
 """
 
+import asyncio
+import atexit
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
 import time
-from functools import wraps
+from collections import OrderedDict, namedtuple
+from functools import partial, wraps
+import recursion
+from profiler import RecursionProfiler
 from recursion import fibonacci as naive_fibonacci
+from trampoline import MISSING as _MISSING, evaluate
 
+# Статистика кеша мемоизированной функции (аналог functools._CacheInfo)
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
 
-def memoize(func):
+
+class LRUCache:
+    """
+    Кеш с вытеснением давно не использовавшихся записей (Least Recently Used)
+
+    Все операции: O(1)
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def get(self, key, default=_MISSING):
+        """Значение по ключу с отметкой об использовании - O(1)"""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        """Сохранение значения с вытеснением самой старой записи - O(1)"""
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        data[key] = value
+        if self.maxsize is not None and len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+class LFUCache:
+    """
+    Кеш с вытеснением редко используемых записей (Least Frequently Used)
+
+    Записи сгруппированы по частоте обращений; среди записей с минимальной
+    частотой вытесняется самая давняя. Все операции: O(1)
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._data = {}  # ключ -> [значение, частота]
+        self._buckets = {}  # частота -> OrderedDict ключей
+        self._min_freq = 0
+
+    def _touch(self, key, entry):
+        """Увеличение частоты обращений к записи - O(1)"""
+        freq = entry[1]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        entry[1] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def get(self, key, default=_MISSING):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        self._touch(key, entry)
+        return entry[0]
+
+    def set(self, key, value):
+        entry = self._data.get(key)
+        if entry is not None:
+            entry[0] = value
+            self._touch(key, entry)
+            return
+
+        if self.maxsize is not None and len(self._data) >= self.maxsize:
+            if self.maxsize <= 0:
+                return
+            bucket = self._buckets[self._min_freq]
+            evicted, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_freq]
+            del self._data[evicted]
+            self.evictions += 1
+
+        self._data[key] = [value, 1]
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def clear(self):
+        self._data.clear()
+        self.evictions = 0
+        self._buckets.clear()
+        self._min_freq = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TTLCache:
+    """
+    Кеш с ограниченным временем жизни записей (Time To Live)
+
+    Записи хранятся в порядке истечения срока, поэтому устаревшие
+    удаляются с начала очереди. При переполнении вытесняется самая старая.
+    Все операции: O(1) амортизированно
+    """
+
+    def __init__(self, maxsize=None, ttl=60.0, timer=time.monotonic):
+        if ttl is None or ttl <= 0:
+            raise ValueError("ttl должно быть положительным числом секунд")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.evictions = 0
+        self._data = OrderedDict()  # ключ -> (значение, момент истечения)
+
+    def _expire(self, now):
+        """Удаление устаревших записей с начала очереди"""
+        data = self._data
+        while data:
+            key, (_, expires_at) = next(iter(data.items()))
+            if expires_at > now:
+                break
+            del data[key]
+            self.evictions += 1
+
+    def get(self, key, default=_MISSING):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[1] <= self.timer():
+            del self._data[key]
+            self.evictions += 1
+            return default
+        return entry[0]
+
+    def set(self, key, value):
+        now = self.timer()
+        self._expire(now)
+        data = self._data
+        if key in data:
+            del data[key]
+        data[key] = (value, now + self.ttl)
+        if self.maxsize is not None and len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+# Открытые соединения: все кеши одного файла в процессе используют одно
+# соединение, иначе незафиксированная запись одного блокирует другой
+_sqlite_connections = {}
+
+
+def _sqlite_connection(path):
+    """Общее для процесса соединение с файлом кеша"""
+    key = os.path.abspath(path)
+    connection = _sqlite_connections.get(key)
+    if connection is None:
+        connection = sqlite3.connect(key, check_same_thread=False)
+        _sqlite_connections[key] = connection
+    return connection
+
+
+class SQLiteCache:
+    """
+    Постоянный кеш результатов в файле SQLite
+
+    Записи хранятся в таблице по ключу (пространство имен, хеш аргументов),
+    поэтому один файл может обслуживать несколько функций. Значения
+    сериализуются через pickle. Перед диском может стоять кеш в памяти
+    (memory), чтобы повторные обращения не ходили в базу.
+
+    Версионирование: при открытии удаляются записи пространства имен с другой
+    версией - достаточно увеличить version после изменения функции.
+    Ограничение размера: при каждой фиксации на диске удаляются самые старые
+    записи сверх maxsize. Запись на диск выполняется пакетами по commit_every
+    операций и при завершении процесса.
+    """
+
+    # Версия формата таблицы (PRAGMA user_version)
+    SCHEMA_VERSION = 1
+    # Фиксированный протокол pickle - ключи не зависят от версии Python
+    PICKLE_PROTOCOL = 4
+
+    def __init__(
+        self,
+        path,
+        namespace,
+        version=1,
+        maxsize=None,
+        memory=None,
+        commit_every=256,
+    ):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize должно быть неотрицательным")
+        self.path = path
+        self.namespace = namespace
+        self.version = str(version)
+        self.maxsize = maxsize
+        self.memory = memory
+        self.commit_every = commit_every
+        self._disk_evictions = 0
+        self._pending = 0
+
+        self.connection = _sqlite_connection(path)
+        self._create_schema()
+        # Удаляем записи, вычисленные другой версией функции
+        self.connection.execute(
+            "DELETE FROM memo WHERE namespace = ? AND version != ?",
+            (self.namespace, self.version),
+        )
+        self.connection.commit()
+        atexit.register(self.close)
+
+    def _create_schema(self):
+        """Создание таблицы и проверка версии формата файла"""
+        connection = self.connection
+        (schema,) = connection.execute("PRAGMA user_version").fetchone()
+        if schema not in (0, self.SCHEMA_VERSION):
+            # Файл другого формата - пересоздаем таблицу
+            connection.execute("DROP TABLE IF EXISTS memo")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS memo ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " version TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        connection.commit()
+
+    @classmethod
+    def make_key(cls, args):
+        """Стабильный между запусками хеш аргументов - O(размер args)"""
+        payload = pickle.dumps(args, protocol=cls.PICKLE_PROTOCOL)
+        return hashlib.sha256(payload).hexdigest()
+
+    @property
+    def evictions(self):
+        memory_evictions = self.memory.evictions if self.memory is not None else 0
+        return memory_evictions + self._disk_evictions
+
+    def _connect(self):
+        """Соединение с файлом; после close() подключается заново"""
+        if self.connection is None:
+            self.connection = _sqlite_connection(self.path)
+            atexit.register(self.close)
+        return self.connection
+
+    def get(self, key, default=_MISSING):
+        digest = self.make_key(key)
+        if self.memory is not None:
+            value = self.memory.get(digest)
+            if value is not _MISSING:
+                return value
+
+        row = self._connect().execute(
+            "SELECT value FROM memo WHERE namespace = ? AND key = ?",
+            (self.namespace, digest),
+        ).fetchone()
+        if row is None:
+            return default
+        value = pickle.loads(row[0])
+        if self.memory is not None:
+            self.memory.set(digest, value)
+        return value
+
+    def set(self, key, value):
+        digest = self.make_key(key)
+        if self.memory is not None:
+            self.memory.set(digest, value)
+        self._connect().execute(
+            "INSERT OR REPLACE INTO memo (namespace, key, version, value) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                self.namespace,
+                digest,
+                self.version,
+                pickle.dumps(value, protocol=self.PICKLE_PROTOCOL),
+            ),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+    def _enforce_maxsize(self):
+        """Удаление самых старых записей сверх maxsize"""
+        if self.maxsize is None:
+            return
+        excess = len(self) - self.maxsize
+        if excess > 0:
+            self.connection.execute(
+                "DELETE FROM memo WHERE rowid IN ("
+                " SELECT rowid FROM memo WHERE namespace = ?"
+                " ORDER BY rowid LIMIT ?)",
+                (self.namespace, excess),
+            )
+            self._disk_evictions += excess
+
+    def flush(self):
+        """Фиксация накопленных записей на диске"""
+        if self.connection is None:
+            return
+        self._enforce_maxsize()
+        self.connection.commit()
+        self._pending = 0
+
+    def close(self):
+        """
+        Сохранение изменений и отключение от файла; следующее обращение
+        к кешу подключается к файлу заново
+        """
+        if self.connection is None:
+            return
+        self.flush()
+        self.connection = None
+        atexit.unregister(self.close)
+
+    def clear(self):
+        """Удаление всех записей пространства имен (в памяти и на диске)"""
+        if self.memory is not None:
+            self.memory.clear()
+        connection = self._connect()
+        connection.execute(
+            "DELETE FROM memo WHERE namespace = ?", (self.namespace,)
+        )
+        connection.commit()
+        self._pending = 0
+        self._disk_evictions = 0
+
+    def __len__(self):
+        (count,) = self._connect().execute(
+            "SELECT COUNT(*) FROM memo WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        return count
+
+
+# Политики вытеснения, доступные в memoize
+CACHE_POLICIES = {
+    "lru": LRUCache,
+    "lfu": LFUCache,
+    "ttl": TTLCache,
+}
+
+
+def _make_cache(maxsize, policy, ttl):
+    """Создание кеша выбранной политики вытеснения"""
+    if policy not in CACHE_POLICIES:
+        raise ValueError(
+            f"Неизвестная политика кеширования: {policy!r}, "
+            f"допустимые: {', '.join(CACHE_POLICIES)}"
+        )
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize должно быть неотрицательным")
+    if policy == "ttl":
+        # ttl не задан - время жизни по умолчанию из TTLCache
+        return TTLCache(maxsize) if ttl is None else TTLCache(maxsize, ttl)
+    return CACHE_POLICIES[policy](maxsize)
+
+
+class _NoLock:
+    """Пустой контекстный менеджер вместо блокировки в однопоточном режиме"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _Flight:
+    """Вычисление ключа, которого ждут остальные потоки (single-flight)"""
+
+    def __init__(self):
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def memoize(
+    func=None,
+    *,
+    maxsize=None,
+    policy="lru",
+    ttl=None,
+    persist=None,
+    version=1,
+    persist_maxsize=None,
+    thread_safe=False,
+):
     """
     Декоратор для мемоизации функции
+
+    Может применяться как @memoize, так и с параметрами:
+    @memoize(maxsize=1000, policy="lfu") или @memoize(policy="ttl", ttl=30)
+
+    Если func - функция-генератор в стиле trampoline (рекурсивные вызовы
+    через `yield args`), она вычисляется через явный стек, а кеш проверяется
+    на каждом подвызове - без RecursionError на большой глубине.
+
+    С параметром persist результаты дополнительно сохраняются в файл SQLite
+    (ключ - имя функции и хеш аргументов), и следующий запуск процесса
+    получает их без повторного вычисления: @memoize(persist="cache.sqlite").
+
+    С thread_safe=True кеш защищен блокировкой, а одновременные вызовы с
+    одним ключом ждут единственного вычисления (single-flight). Для функций
+    async def одновременные вызовы с одним ключом всегда ожидают одну задачу.
+
+    Args:
+        func (callable): Мемоизируемая функция
+        maxsize (int): Максимальное число записей в кеше (None - без ограничений)
+        policy (str): Политика вытеснения: "lru", "lfu" или "ttl"
+        ttl (float): Время жизни записи в секундах (для политики "ttl";
+            None - 60 секунд, как в TTLCache)
+        persist (str): Путь к файлу постоянного кеша (None - только память)
+        version: Версия функции; записи других версий в файле удаляются
+        persist_maxsize (int): Максимальное число записей функции в файле
+        thread_safe (bool): Потокобезопасный режим с single-flight
+
+    Returns:
+        callable: Обертка с методами cache_info() и cache_clear()
     """
-    cache = {}
+    if func is None:
+        return lambda f: memoize(
+            f,
+            maxsize=maxsize,
+            policy=policy,
+            ttl=ttl,
+            persist=persist,
+            version=version,
+            persist_maxsize=persist_maxsize,
+            thread_safe=thread_safe,
+        )
+
+    cache = _make_cache(maxsize, policy, ttl)
+    if persist is not None:
+        cache = SQLiteCache(
+            persist,
+            f"{func.__module__}.{func.__qualname__}",
+            version=version,
+            maxsize=persist_maxsize,
+            memory=cache,
+        )
+    # Для постоянного кеша currsize - число записей в файле, поэтому и
+    # maxsize в статистике - ограничение файла
+    info_maxsize = maxsize if persist is None else persist_maxsize
+    hits = misses = 0
+    lock = threading.Lock() if thread_safe else _NoLock()
+    in_flight = {}  # Вычисляемые сейчас ключи: args -> _Flight или Task
+
+    def lookup(args):
+        nonlocal hits, misses
+        result = cache.get(args)
+        if result is _MISSING:
+            misses += 1
+        else:
+            hits += 1
+        return result
+
+    store = cache.set
+
+    if thread_safe:
+        unlocked_lookup = lookup
+
+        def lookup(args):
+            with lock:
+                return unlocked_lookup(args)
 
-    @wraps(func)
-    def wrapper(*args):
-        if args not in cache:
-            cache[args] = func(*args)
-        return cache[args]
+        def store(args, result):
+            with lock:
+                cache.set(args, result)
 
+    if inspect.iscoroutinefunction(func):
+
+        def finish(args, task):
+            in_flight.pop(args, None)
+            if not task.cancelled() and task.exception() is None:
+                store(args, task.result())
+
+        @wraps(func)
+        async def wrapper(*args):
+            result = lookup(args)
+            if result is not _MISSING:
+                return result
+            # Single-flight: все сопрограммы ждут одну задачу вычисления
+            task = in_flight.get(args)
+            if task is None:
+                task = asyncio.ensure_future(func(*args))
+                in_flight[args] = task
+                task.add_done_callback(partial(finish, args))
+            # shield: отмена одного ожидающего не отменяет общее вычисление
+            return await asyncio.shield(task)
+
+    else:
+        if inspect.isgeneratorfunction(func):
+
+            def compute(args):
+                return evaluate(func, args, lookup, store)
+
+        else:
+
+            def compute(args):
+                result = func(*args)
+                store(args, result)
+                return result
+
+        if thread_safe:
+
+            @wraps(func)
+            def wrapper(*args):
+                result = lookup(args)
+                if result is not _MISSING:
+                    return result
+
+                with lock:
+                    # Повторная проверка: ключ мог вычислиться после lookup
+                    result = cache.get(args)
+                    if result is not _MISSING:
+                        return result
+                    flight = in_flight.get(args)
+                    leader = flight is None or flight.owner == threading.get_ident()
+                    if flight is None:
+                        flight = in_flight[args] = _Flight()
+                if not leader:
+                    # Ключ уже вычисляется другим потоком - ждем его результат
+                    return flight.wait()
+
+                try:
+                    flight.result = compute(args)
+                except BaseException as exc:
+                    flight.error = exc
+                    raise
+                finally:
+                    with lock:
+                        if in_flight.get(args) is flight:
+                            del in_flight[args]
+                    flight.done.set()
+                return flight.result
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args):
+                result = lookup(args)
+                if result is _MISSING:
+                    result = compute(args)
+                return result
+
+    def cache_info():
+        """Статистика использования кеша"""
+        with lock:
+            return CacheInfo(hits, misses, cache.evictions, info_maxsize, len(cache))
+
+    def cache_clear():
+        """Очистка кеша и сброс статистики"""
+        nonlocal hits, misses
+        with lock:
+            cache.clear()
+            hits = misses = 0
+
+    if inspect.isgeneratorfunction(func):
+        wrapper.step = func  # Как у trampoline.stack_safe
+    wrapper.cache = cache
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
     return wrapper
 
 
@@ -34,7 +625,7 @@ def fibonacci_memoized(n):
         int: n-е число Фибоначчи
 
     Time Complexity: O(n) с мемоизацией
-    Recursion Depth: O(n)
+    Recursion Depth: O(1) - подвызовы выполняются через явный стек
     """
     if n < 0:
         raise ValueError("n должно быть неотрицательным")
@@ -42,7 +633,7 @@ def fibonacci_memoized(n):
         return 0
     if n == 1:
         return 1
-    return fibonacci_memoized(n - 1) + fibonacci_memoized(n - 2)
+    return (yield (n - 1,)) + (yield (n - 2,))
 
 
 # Версия с явным кешированием (альтернативная реализация)
@@ -56,24 +647,23 @@ def fibonacci_explicit_memo(n, cache=None):
 
     Returns:
         int: n-е число Фибоначчи
+
+    Time Complexity: O(n)
+    Recursion Depth: O(1) - подвызовы выполняются через явный стек
     """
     if cache is None:
         cache = {}
 
-    if n in cache:
-        return cache[n]
+    def lookup(args):
+        return cache.get(args[0], _MISSING)
 
-    if n < 0:
-        raise ValueError("n должно быть неотрицательным")
-    if n == 0:
-        return 0
-    if n == 1:
-        return 1
+    def store(args, value):
+        cache[args[0]] = value
 
-    result = fibonacci_explicit_memo(n - 1, cache) + fibonacci_explicit_memo(
-        n - 2, cache
-    )
-    cache[n] = result
+    result = lookup((n,))
+    if result is _MISSING:
+        # Тот же шаг рекурсии, что и у fibonacci_memoized, но с внешним кешем
+        result = evaluate(fibonacci_memoized.__wrapped__, (n,), lookup, store)
     return result
 
 
@@ -107,17 +697,24 @@ def compare_performance():
 
 # Дополнительная функция для подсчета вызовов
 class CallCounter:
-    """Класс для подсчета количества рекурсивных вызовов"""
+    """
+    Класс для подсчета количества рекурсивных вызовов наивного Фибоначчи
+
+    Частный случай profiler.RecursionProfiler, который подходит для любой
+    рекурсивной функции
+    """
 
     def __init__(self):
-        self.count = 0
+        self.profiler = RecursionProfiler(track_arguments=False)
+
+    @property
+    def count(self):
+        return self.profiler.calls
 
     def fibonacci_counted(self, n):
         """Фибоначчи с подсчетом вызовов"""
-        self.count += 1
-        if n <= 1:
-            return n
-        return self.fibonacci_counted(n - 1) + self.fibonacci_counted(n - 2)
+        with self.profiler.patch(recursion, "fibonacci"):
+            return recursion.fibonacci(n)
 
 
 if __name__ == "__main__":
@@ -129,3 +726,13 @@ if __name__ == "__main__":
     result = counter.fibonacci_counted(10)
     print(f"Количество вызовов для наивной реализации (n=10): {counter.count}")
     print(f"Результат: {result}")
+    print(f"Максимальная глубина рекурсии: {counter.profiler.max_depth}")
+
+    # Профиль наивной версии: повторные вызовы - то, что устраняет мемоизация
+    print("\n=== Профиль наивной рекурсии для n=20 ===")
+    with RecursionProfiler().patch(recursion, "fibonacci") as profile:
+        recursion.fibonacci(20)
+    print(profile)
+
+    # Статистика кеша мемоизированной версии
+    print(f"\nСтатистика кеша fibonacci_memoized: {fibonacci_memoized.cache_info()}")
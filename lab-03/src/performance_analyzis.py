@@ -2,103 +2,113 @@
 Анализ производительности и визуализация результатов
 """
 
-import time
 import matplotlib.pyplot as plt
+from benchmark import benchmark, load_results, save_results
 from recursion import fibonacci as naive_fibonacci
 from memoization import fibonacci_memoized
 import platform
 import sys
 from recursion import fast_power
 from recursion import factorial
+from recursion import fib as fast_doubling_fibonacci
 
 
-def measure_performance():
+# Реализации Фибоначчи для замеров: имя -> (функция, сброс кеша перед вызовом)
+FIBONACCI_IMPLEMENTATIONS = {
+    "naive": (naive_fibonacci, None),
+    "memoized": (fibonacci_memoized, fibonacci_memoized.cache_clear),
+    "fast_doubling": (fast_doubling_fibonacci, None),
+}
+
+BENCHMARK_RESULTS_PATH = "fibonacci_benchmark.json"
+
+
+def _format_time(seconds):
+    """Время с учетом очень малых значений"""
+    return f"{seconds:.6f}" if seconds >= 0.000001 else f"{seconds:.2e}"
+
+
+def measure_performance(n_values=None, output_path=BENCHMARK_RESULTS_PATH):
     """
     Замер времени выполнения для разных n
+
+    Мемоизированная версия замеряется с холодным кешем: он сбрасывается
+    перед каждым вызовом, иначе после первого n измерялось бы чтение из кеша.
+
+    Args:
+        n_values (list): Значения n (по умолчанию 10, 15, ..., 35)
+        output_path (str): Путь к JSON с результатами (None - не сохранять)
+
+    Returns:
+        dict: Имя реализации -> список статистик benchmark() с полем n
     """
-    n_values = list(range(10, 36, 5))
-    times_naive = []
-    times_memoized = []
+    if n_values is None:
+        n_values = list(range(10, 36, 5))
+    results = {name: [] for name in FIBONACCI_IMPLEMENTATIONS}
 
     print("=== Измерение производительности ===")
-    print(f"{'n':<5} {'Наивная (с)':<12} {'Мемоизация (с)':<15}")
-    print("-" * 40)
+    print(f"{'n':<5} " + " ".join(f"{name + ' (с)':<22}" for name in results))
+    print("-" * 75)
 
     for n in n_values:
-        # Наивная реализация
-        start_time = time.perf_counter()
-        try:
-            naive_result = naive_fibonacci(n)
-            naive_time = time.perf_counter() - start_time
-        except RecursionError:
-            naive_time = float("inf")
-            naive_result = "Error"
-
-        # Для очень быстрых вычислений делаем несколько итераций
-        if naive_time < 0.001:  # Если время очень мало
-            iterations = 1000
-            start_time = time.perf_counter()
-            try:
-                for _ in range(iterations):
-                    naive_fibonacci(n)
-                naive_time = (time.perf_counter() - start_time) / iterations
-            except RecursionError:
-                pass
-
-        # Мемоизированная реализация
-        start_time = time.perf_counter()
-        memo_result = fibonacci_memoized(n)
-        memo_time = time.perf_counter() - start_time
-
-        # Для очень быстрых вычислений делаем несколько итераций
-        if memo_time < 0.001:  # Если время очень мало
-            iterations = 10000  # Больше итераций для очень быстрой функции
-            start_time = time.perf_counter()
-            for _ in range(iterations):
-                fibonacci_memoized(n)
-            memo_time = (time.perf_counter() - start_time) / iterations
-
-        times_naive.append(naive_time if naive_time != float("inf") else None)
-        times_memoized.append(memo_time)
-
-        # Форматируем вывод для очень малых значений
-        naive_str = (
-            f"{naive_time:.6f}" if naive_time >= 0.000001 else f"{naive_time:.2e}"
-        )
-        memo_str = f"{memo_time:.6f}" if memo_time >= 0.000001 else f"{memo_time:.2e}"
+        cells = []
+        for name, (func, reset) in FIBONACCI_IMPLEMENTATIONS.items():
+            stats = benchmark(func, n, setup=reset)
+            stats["n"] = n
+            results[name].append(stats)
+            cells.append(f"{_format_time(stats['median'])} ±{_format_time(stats['iqr'] / 2)}")
+        print(f"{n:<5} " + " ".join(f"{cell:<22}" for cell in cells))
 
-        print(f"{n:<5} {naive_str:<12} {memo_str:<15}")
+    if output_path is not None:
+        save_results(results, output_path)
+        print(f"Результаты сохранены в {output_path}")
 
-    return n_values, times_naive, times_memoized
+    return results
 
 
-def plot_comparison(n_values, times_naive, times_memoized):
+def plot_comparison(results=BENCHMARK_RESULTS_PATH):
     """
     Построение графика сравнения производительности
+
+    Медианы отображаются точками, межквартильный размах - планками.
+
+    Args:
+        results (dict или str): Результаты measure_performance или путь к JSON
     """
+    if isinstance(results, str):
+        results = load_results(results)
+
+    styles = {
+        "naive": ("ro-", "Наивная рекурсия"),
+        "memoized": ("go-", "С мемоизацией"),
+        "fast_doubling": ("bo-", "Быстрое удвоение (O(log n))"),
+    }
+
     plt.figure(figsize=(12, 6))
 
-    # Фильтруем значения, где наивная реализация не вызвала ошибку
-    valid_indices = [i for i, t in enumerate(times_naive) if t is not None and t > 0]
-    valid_n = [n_values[i] for i in valid_indices]
-    valid_naive = [times_naive[i] for i in valid_indices]
-    valid_memo = [times_memoized[i] for i in valid_indices]
-
-    plt.plot(
-        valid_n, valid_naive, "ro-", label="Наивная рекурсия", linewidth=2, markersize=6
-    )
-    plt.plot(
-        n_values,
-        times_memoized,
-        "go-",
-        label="С мемоизацией",
-        linewidth=2,
-        markersize=6,
-    )
+    for name, series in results.items():
+        style, label = styles.get(name, ("ko-", name))
+        n_values = [point["n"] for point in series]
+        medians = [point["median"] for point in series]
+        errors = [
+            [point["median"] - point["q1"] for point in series],
+            [point["q3"] - point["median"] for point in series],
+        ]
+        plt.errorbar(
+            n_values,
+            medians,
+            yerr=errors,
+            fmt=style,
+            label=label,
+            linewidth=2,
+            markersize=6,
+            capsize=3,
+        )
 
     plt.xlabel("n (номер числа Фибоначчи)")
-    plt.ylabel("Время выполнения (секунды)")
+    plt.ylabel("Время выполнения (секунды, медиана и IQR)")
     plt.title("Сравнение производительности: наивная рекурсия vs мемоизация")
+    plt.yscale("log")
     plt.legend()
     plt.grid(True, alpha=0.3)
 
@@ -116,15 +126,16 @@ def analyze_recursion_depth():
     original_limit = sys.getrecursionlimit()
     print(f"Текущий лимит рекурсии: {original_limit}")
 
-    # Тестирование на разных значениях
-    test_values = [5, 10, 20, 100, 500, 1000]
+    # Тестирование на разных значениях (значения больше лимита рекурсии
+    # проходят благодаря явному стеку trampoline)
+    test_values = [5, 10, 20, 100, 500, 1000, 10000]
 
-    print(f"{'n':<8} {'Факториал':<12} {'Быстрая степень':<18}")
-    print("-" * 45)
+    print(f"{'n':<8} {'Факториал':<12} {'Быстрая степень':<18} {'Фибоначчи (мемо)':<18}")
+    print("-" * 60)
 
     for n in test_values:
         try:
-            # Факториал - глубина рекурсии O(n)
+            # Факториал - O(n) кадров в явном стеке
             factorial(n)
             fact_ok = "✓"
         except RecursionError:
@@ -137,7 +148,14 @@ def analyze_recursion_depth():
         except RecursionError:
             power_ok = "✗"
 
-        print(f"{n:<8} {fact_ok:<12} {power_ok:<18}")
+        try:
+            # Мемоизированный Фибоначчи - O(n) кадров в явном стеке
+            fibonacci_memoized(n)
+            fib_ok = "✓"
+        except RecursionError:
+            fib_ok = "✗"
+
+        print(f"{n:<8} {fact_ok:<12} {power_ok:<18} {fib_ok:<18}")
 
 
 if __name__ == "__main__":
@@ -150,10 +168,10 @@ if __name__ == "__main__":
     print(f"Python: {platform.python_version()}")
 
     # Измерение производительности
-    n_vals, naive_times, memo_times = measure_performance()
+    measure_performance()
 
-    # Построение графиков
-    plot_comparison(n_vals, naive_times, memo_times)
+    # Построение графиков по сохраненному JSON
+    plot_comparison(BENCHMARK_RESULTS_PATH)
 
     # Анализ глубины рекурсии
     analyze_recursion_depth()
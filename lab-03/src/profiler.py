@@ -0,0 +1,185 @@
+"""
+Профилирование рекурсивных функций: количество вызовов, глубина рекурсии,
+попадания в кеш и гистограмма аргументов
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+from trampoline import trace_calls
+
+
+class RecursionProfiler:
+    """
+    Профилировщик вызовов рекурсивной функции
+
+    Рекурсивные вызовы идут через глобальное имя функции (или атрибут
+    класса), поэтому профилировщик подменяет это имя оберткой:
+    - как декоратор при определении функции;
+    - как контекстный менеджер patch(), временно подменяющий атрибут модуля
+      или класса, например patch(recursion, "fibonacci") или
+      patch(BinarySearchTree, "insert_recursive").
+
+    Функции, вычисляемые через trampoline (stack_safe или memoize над
+    функцией-генератором, атрибут step), делают подвызовы через `yield`,
+    минуя имя; их patch() учитывает через trampoline.trace_calls - каждый
+    подвызов с глубиной его кадра в явном стеке.
+
+    Для функций, обернутых memoize, попадания и промахи кеша берутся
+    из разницы cache_info() до и после профилирования.
+    """
+
+    def __init__(self, track_arguments=True):
+        self.track_arguments = track_arguments
+        self.calls = 0
+        self.max_depth = 0
+        self.arguments = Counter()  # аргументы -> количество вызовов
+        self._depth = 0
+        self._cached = None  # функция с cache_info()
+        self._cache_start = None
+        self._cache_end = None
+
+    def wrap(self, func):
+        """Обертка, учитывающая каждый вызов func"""
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            self._depth += 1
+            self._record(args, kwargs, self._depth)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._depth -= 1
+
+        if hasattr(func, "cache_info"):
+            self._cached = func
+            self._cache_start = func.cache_info()
+            wrapper.cache_info = func.cache_info
+            wrapper.cache_clear = func.cache_clear
+        wrapper.profiler = self
+        return wrapper
+
+    def _record(self, args, kwargs, depth):
+        """Учет одного вызова на глубине depth"""
+        self.calls += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if self.track_arguments:
+            key = args if not kwargs else (args, tuple(sorted(kwargs.items())))
+            try:
+                self.arguments[key] += 1
+            except TypeError:  # Нехешируемые аргументы (списки и т.п.)
+                self.arguments[repr(key)] += 1
+
+    def _record_step(self, args, depth):
+        """Учет подвызова trampoline: глубина отсчитывается от обертки"""
+        self._record(args, None, self._depth + depth)
+
+    def __call__(self, func):
+        """Применение профилировщика как декоратора"""
+        return self.wrap(func)
+
+    @contextmanager
+    def patch(self, target, name):
+        """
+        Временная подмена target.name оберткой профилировщика
+
+        Args:
+            target: Модуль или класс, содержащий функцию
+            name (str): Имя функции (через него идут рекурсивные вызовы)
+        """
+        original = target.__dict__[name] if isinstance(target, type) else getattr(target, name)
+        step = getattr(original, "step", None)
+        setattr(target, name, self.wrap(original))
+        try:
+            if step is None:
+                yield self
+            else:
+                with trace_calls(step, self._record_step):
+                    yield self
+        finally:
+            setattr(target, name, original)
+            self._freeze_cache_info()
+
+    def _freeze_cache_info(self):
+        """Фиксация статистики кеша на момент окончания профилирования"""
+        if self._cached is not None:
+            self._cache_end = self._cached.cache_info()
+
+    @property
+    def cache_hits(self):
+        """Попадания в кеш за время профилирования (None - функция без кеша)"""
+        delta = self._cache_delta()
+        return None if delta is None else delta[0]
+
+    @property
+    def cache_misses(self):
+        """Промахи кеша за время профилирования (None - функция без кеша)"""
+        delta = self._cache_delta()
+        return None if delta is None else delta[1]
+
+    def _cache_delta(self):
+        if self._cached is None:
+            return None
+        end = self._cache_end or self._cached.cache_info()
+        start = self._cache_start
+        return end.hits - start.hits, end.misses - start.misses
+
+    def reset(self):
+        """Сброс накопленной статистики"""
+        self.calls = 0
+        self.max_depth = 0
+        self.arguments.clear()
+        if self._cached is not None:
+            self._cache_start = self._cached.cache_info()
+            self._cache_end = None
+
+    def report(self, top=5):
+        """
+        Сводка профилирования
+
+        Returns:
+            dict: calls, max_depth, cache_hits, cache_misses, repeated_calls,
+                most_common (самые частые аргументы)
+        """
+        return {
+            "calls": self.calls,
+            "max_depth": self.max_depth,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            # Вызовы с уже встречавшимися аргументами - то, что убирает мемоизация
+            "repeated_calls": self.calls - len(self.arguments)
+            if self.track_arguments
+            else None,
+            "most_common": self.arguments.most_common(top),
+        }
+
+    def __str__(self):
+        report = self.report()
+        lines = [
+            f"Вызовов: {report['calls']}",
+            f"Максимальная глубина: {report['max_depth']}",
+        ]
+        if report["cache_hits"] is not None:
+            lines.append(
+                f"Кеш: {report['cache_hits']} попаданий, {report['cache_misses']} промахов"
+            )
+        if report["repeated_calls"] is not None:
+            lines.append(f"Повторных вызовов: {report['repeated_calls']}")
+            lines.append(f"Частые аргументы: {report['most_common']}")
+        return "\n".join(lines)
+
+
+def profile_recursion(func=None, *, track_arguments=True):
+    """
+    Декоратор профилирования: статистика доступна как func.profiler
+
+    Пример:
+        @profile_recursion
+        def fibonacci(n): ...
+        fibonacci(20)
+        print(fibonacci.profiler)
+    """
+    if func is None:
+        return lambda f: profile_recursion(f, track_arguments=track_arguments)
+    return RecursionProfiler(track_arguments).wrap(func)
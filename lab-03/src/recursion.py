@@ -2,6 +2,11 @@
 Классические рекурсивные алгоритмы
 """
 
+import operator
+from trampoline import stack_safe
+
+
+@stack_safe
 def factorial(n):
     """
     Вычисление факториала числа n рекурсивным методом
@@ -13,13 +18,13 @@ def factorial(n):
         int: Факториал числа n
     
     Time Complexity: O(n)
-    Recursion Depth: O(n)
+    Recursion Depth: O(1) - рекурсия через явный стек (trampoline)
     """
     if n < 0:
         raise ValueError("Факториал определен только для неотрицательных чисел")
     if n == 0 or n == 1:  # Базовый случай
         return 1
-    return n * factorial(n - 1)  # Рекурсивный шаг
+    return n * (yield (n - 1,))  # Рекурсивный шаг
 
 
 def fibonacci(n):
@@ -44,33 +49,140 @@ def fibonacci(n):
     return fibonacci(n - 1) + fibonacci(n - 2)  # Рекурсивный шаг
 
 
-def fast_power(a, n):
+def fast_power(a, n, multiply=None, identity=1):
     """
-    Быстрое возведение числа a в степень n через степень двойки
+    Быстрое возведение a в степень n через степень двойки
+
+    Работает над любым моноидом: достаточно ассоциативной операции multiply
+    и нейтрального элемента identity (числа, матрицы, вычеты по модулю).
     
     Args:
-        a (float/int): Основание
+        a: Основание (элемент моноида)
         n (int): Показатель степени (неотрицательный)
+        multiply (callable): Ассоциативная операция (по умолчанию a * b)
+        identity: Нейтральный элемент операции (для n = 0)
     
     Returns:
-        float/int: a в степени n
+        a в степени n
     
-    Time Complexity: O(log n)
+    Time Complexity: O(log n) умножений
     Recursion Depth: O(log n)
     """
     if n < 0:
         raise ValueError("Показатель степени должен быть неотрицательным")
     if n == 0:  # Базовый случай
-        return 1
+        return identity
     if n == 1:  # Базовый случай
         return a
+    if multiply is None:
+        multiply = operator.mul
     
-    half_power = fast_power(a, n // 2)  # Рекурсивный шаг
+    half_power = fast_power(a, n // 2, multiply, identity)  # Рекурсивный шаг
+    square = multiply(half_power, half_power)
     
     if n % 2 == 0:
-        return half_power * half_power
+        return square
     else:
-        return a * half_power * half_power
+        return multiply(a, square)
+
+
+def modular_multiply(mod):
+    """
+    Умножение по модулю mod для использования в fast_power
+
+    Returns:
+        callable: Функция (x, y) -> x * y % mod
+    """
+    return lambda x, y: x * y % mod
+
+
+def matrix_multiply(x, y, mod=None):
+    """
+    Произведение матриц 2x2, заданных кортежами (a, b, c, d) = [[a, b], [c, d]]
+
+    Time Complexity: O(1) умножений
+    """
+    a, b, c, d = x
+    e, f, g, h = y
+    result = (a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h)
+    if mod is not None:
+        result = tuple(v % mod for v in result)
+    return result
+
+
+# Единичная матрица 2x2 - нейтральный элемент для matrix_multiply
+IDENTITY_MATRIX = (1, 0, 0, 1)
+
+
+def fibonacci_matrix(n, mod=None):
+    """
+    Вычисление n-го числа Фибоначчи возведением матрицы [[1, 1], [1, 0]]
+    в степень n: [[1, 1], [1, 0]]^n = [[F(n+1), F(n)], [F(n), F(n-1)]]
+
+    Args:
+        n (int): Порядковый номер числа Фибоначчи
+        mod (int): Модуль (None - точное значение)
+
+    Returns:
+        int: F(n) (или F(n) mod mod)
+
+    Time Complexity: O(log n) умножений матриц
+    Recursion Depth: O(log n)
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    power = fast_power(
+        (1, 1, 1, 0),
+        n,
+        lambda x, y: matrix_multiply(x, y, mod),
+        IDENTITY_MATRIX,
+    )
+    return power[1] if mod is None else power[1] % mod
+
+
+def fib(n, mod=None):
+    """
+    Вычисление n-го числа Фибоначчи методом быстрого удвоения (fast doubling)
+
+    Использует тождества:
+        F(2k)     = F(k) * (2 * F(k+1) - F(k))
+        F(2k + 1) = F(k)^2 + F(k+1)^2
+    и проходит по битам n от старшего к младшему.
+
+    Args:
+        n (int): Порядковый номер числа Фибоначчи
+        mod (int): Модуль (None - точное значение)
+
+    Returns:
+        int: F(n) (или F(n) mod mod)
+
+    Time Complexity: O(log n) умножений (3 умножения на бит n)
+    Recursion Depth: O(1) - итеративная реализация
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    if mod is not None and mod <= 0:
+        raise ValueError("Модуль должен быть положительным")
+
+    if n == 0:
+        return 0
+
+    bits = bin(n)[2:]
+    a, b = 0, 1  # (F(k), F(k+1)) для k = 0
+    for bit in bits[:-1]:  # O(log n) итераций
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b  # F(2k + 1)
+        if bit == "1":
+            a, b = d, c + d  # k -> 2k + 1
+        else:
+            a, b = c, d  # k -> 2k
+        if mod is not None:
+            a %= mod
+            b %= mod
+
+    # На последнем (самом дорогом) шаге F(k+1) уже не нужен
+    result = a * a + b * b if bits[-1] == "1" else a * (2 * b - a)
+    return result if mod is None else result % mod
 
 
 if __name__ == "__main__":
@@ -84,4 +196,8 @@ if __name__ == "__main__":
     print(f"Фибоначчи(10): {fibonacci(10)}")  # 55
     
     print(f"2^10: {fast_power(2, 10)}")  # 1024
-    print(f"3^5: {fast_power(3, 5)}")    # 243
\ No newline at end of file
+    print(f"3^5: {fast_power(3, 5)}")    # 243
+    print(f"3^100 mod 7: {fast_power(3, 100, modular_multiply(7))}")  # 4
+
+    print(f"fib(100): {fib(100)}")  # 354224848179261915075
+    print(f"fib(10^18) mod 10^9+7: {fib(10**18, 10**9 + 7)}")
\ No newline at end of file
@@ -3,53 +3,318 @@
 """
 
 import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from trampoline import stack_safe
 
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для пакетного поиска по массивам
+    np = None
 
-def binary_search(arr, target, low=0, high=None):
+
+def lower_bound(arr, target, low=0, high=None, key=None):
     """
-    Рекурсивная реализация бинарного поиска
+    Первая позиция в [low, high), где key(arr[i]) >= target
+
+    Args:
+        arr (list): Массив, отсортированный по key
+        target: Искомое значение ключа
+        low (int): Нижняя граница поиска (включительно)
+        high (int): Верхняя граница поиска (не включительно, по умолчанию len(arr))
+        key (callable): Функция ключа элемента (None - сам элемент)
+
+    Returns:
+        int: Позиция вставки target слева от равных элементов
+
+    Time Complexity: O(log n)
+    Recursion Depth: O(1) - итеративная реализация
+    """
+    if high is None:
+        high = len(arr)
+    while low < high:
+        mid = (low + high) // 2
+        value = arr[mid] if key is None else key(arr[mid])
+        if value < target:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def upper_bound(arr, target, low=0, high=None, key=None):
+    """
+    Первая позиция в [low, high), где key(arr[i]) > target
+
+    Аргументы такие же, как у lower_bound.
+
+    Returns:
+        int: Позиция вставки target справа от равных элементов
+
+    Time Complexity: O(log n)
+    Recursion Depth: O(1) - итеративная реализация
+    """
+    if high is None:
+        high = len(arr)
+    while low < high:
+        mid = (low + high) // 2
+        value = arr[mid] if key is None else key(arr[mid])
+        if target < value:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def binary_search(arr, target, low=0, high=None, key=None):
+    """
+    Итеративная реализация бинарного поиска
 
     Args:
         arr (list): Отсортированный массив
-        target: Искомый элемент
+        target: Искомый элемент (значение ключа, если задан key)
         low (int): Нижняя граница поиска
-        high (int): Верхняя граница поиска
+        high (int): Верхняя граница поиска (включительно)
+        key (callable): Функция ключа элемента (None - сам элемент)
 
     Returns:
-        int: Индекс элемента или -1 если не найден
+        int: Индекс первого подходящего элемента или -1 если не найден
 
     Time Complexity: O(log n)
-    Recursion Depth: O(log n)
+    Recursion Depth: O(1) - итеративная реализация
     """
     if high is None:
         high = len(arr) - 1
 
-    # Базовый случай - элемент не найден
-    if low > high:
-        return -1
+    index = lower_bound(arr, target, low, high + 1, key)
+    if index <= high:
+        value = arr[index] if key is None else key(arr[index])
+        if value == target:
+            return index
+    return -1
+
+
+def search_many(sorted_arr, targets, key=None, side="exact"):
+    """
+    Пакетный бинарный поиск множества значений в отсортированном массиве
+
+    Запросы сортируются, после чего массив проходится один раз слева направо:
+    при большом числе запросов - линейным проходом, при малом - бинарным
+    поиском, каждый раз начиная с позиции предыдущего ответа. Для массивов
+    NumPy без key используется numpy.searchsorted.
+
+    Args:
+        sorted_arr (list): Массив, отсортированный по key
+        targets (iterable): Искомые значения
+        key (callable): Функция ключа элемента (None - сам элемент)
+        side (str): "exact" - индекс совпадения или -1,
+            "left"/"right" - позиция вставки как у lower_bound/upper_bound
+
+    Returns:
+        list: Ответы в порядке targets (numpy.ndarray для входов NumPy)
+
+    Time Complexity: O(m log m + min(n, m log n)) где m - количество запросов
+    """
+    if side not in ("exact", "left", "right"):
+        raise ValueError(f"Неизвестный режим поиска: {side!r}")
+
+    if np is not None and key is None and isinstance(sorted_arr, np.ndarray):
+        return _search_many_numpy(sorted_arr, np.asarray(targets), side)
+
+    targets = list(targets)
+    n = len(sorted_arr)
+    m = len(targets)
+    result = [0] * m
+    order = sorted(range(m), key=targets.__getitem__)  # O(m log m)
+    # Линейный проход дешевле m бинарных поисков, если запросов много
+    sweep = m * max(n.bit_length(), 1) >= n
+
+    position = 0
+    for i in order:
+        target = targets[i]
+        if side == "right":
+            if sweep:
+                while position < n and not target < _key_at(sorted_arr, position, key):
+                    position += 1
+            else:
+                position = upper_bound(sorted_arr, target, position, n, key)
+            result[i] = position
+            continue
+
+        if sweep:
+            while position < n and _key_at(sorted_arr, position, key) < target:
+                position += 1
+        else:
+            position = lower_bound(sorted_arr, target, position, n, key)
+
+        if side == "left":
+            result[i] = position
+        elif position < n and _key_at(sorted_arr, position, key) == target:
+            result[i] = position
+        else:
+            result[i] = -1
+    return result
+
+
+def _key_at(arr, index, key):
+    """Ключ элемента arr[index]"""
+    return arr[index] if key is None else key(arr[index])
+
+
+def _search_many_numpy(sorted_arr, targets, side):
+    """Векторизованный пакетный поиск через numpy.searchsorted"""
+    if side != "exact":
+        return np.searchsorted(sorted_arr, targets, side=side)
+    positions = np.searchsorted(sorted_arr, targets, side="left")
+    if len(sorted_arr) == 0:
+        return np.full(len(positions), -1)
+    clipped = np.minimum(positions, len(sorted_arr) - 1)
+    found = (positions < len(sorted_arr)) & (sorted_arr[clipped] == targets)
+    return np.where(found, positions, -1)
+
+
+# Элемент обхода файловой системы: depth - глубина относительно начального
+# пути (его содержимое имеет глубину 0), is_last - последний среди соседей
+FileSystemEntry = namedtuple(
+    "FileSystemEntry", ["path", "name", "depth", "is_dir", "is_last"]
+)
+
+
+def _list_directory(path, follow_symlinks):
+    """
+    Отсортированное содержимое одной директории
+
+    os.scandir возвращает тип элемента вместе с именем, поэтому отдельный
+    вызов os.path.isdir на каждый элемент не нужен.
+
+    Returns:
+        list: Кортежи (имя, путь, это_директория)
+    """
+    with os.scandir(path) as iterator:
+        items = [
+            (entry.name, entry.path, entry.is_dir(follow_symlinks=follow_symlinks))
+            for entry in iterator
+        ]
+    items.sort()  # Сортировка для единообразного вывода
+    return items
+
+
+def walk_file_system(
+    start_path,
+    max_depth=None,
+    workers=None,
+    include=None,
+    onerror=None,
+    follow_symlinks=True,
+):
+    """
+    Итеративный обход файловой системы с параллельным чтением директорий
+
+    Элементы выдаются лениво в порядке обхода в глубину (как в дереве
+    каталогов). Содержимое поддиректорий читается заранее в пуле потоков,
+    пока обрабатываются предыдущие элементы.
+
+    Args:
+        start_path (str): Начальный путь для обхода
+        max_depth (int): Максимальная глубина (None - без ограничений)
+        workers (int): Количество потоков чтения директорий
+        include (callable): include(name, path, is_dir) -> bool; отброшенные
+            директории не обходятся
+        onerror (callable): Вызывается с OSError для нечитаемых директорий
+        follow_symlinks (bool): Заходить ли в символические ссылки на директории
+            (по умолчанию да, как os.path.isdir)
+
+    Yields:
+        FileSystemEntry: Элементы файловой системы
+
+    Time Complexity: O(n) где n - количество элементов
+    Recursion Depth: O(1) - явный стек итераторов
+    """
+    pool = ThreadPoolExecutor(max_workers=workers)
+
+    def expand(future, depth):
+        """Содержимое директории с запуском чтения ее поддиректорий"""
+        try:
+            items = future.result()
+        except OSError as exc:
+            if onerror is not None:
+                onerror(exc)
+            return None
+
+        if include is not None:
+            items = [item for item in items if include(*item)]
+        descend = max_depth is None or depth < max_depth
+        last = len(items) - 1
+        children = []
+        for i, (name, path, is_dir) in enumerate(items):
+            listing = None
+            if is_dir and descend:
+                listing = pool.submit(_list_directory, path, follow_symlinks)
+            children.append((FileSystemEntry(path, name, depth, is_dir, i == last), listing))
+        return iter(children)
+
+    try:
+        root = expand(pool.submit(_list_directory, start_path, follow_symlinks), 0)
+        stack = [root] if root is not None else []
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+
+            entry, listing = child
+            yield entry
+            if listing is not None:
+                children = expand(listing, entry.depth + 1)
+                if children is not None:
+                    stack.append(children)
+    finally:
+        # Обход мог быть прерван - не дожидаемся заранее запущенных чтений
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _tree_lines(entries, indent):
+    """Пары (элемент, строка дерева) для элементов в порядке обхода в глубину"""
+    last_flags = []  # is_last для директорий-предков текущего элемента
+    for entry in entries:
+        del last_flags[entry.depth:]
+        prefix = indent + "".join("    " if last else "│   " for last in last_flags)
+        connector = "└── " if entry.is_last else "├── "
+        if entry.is_dir:
+            yield entry, f"{prefix}{connector}{entry.name}/"
+            last_flags.append(entry.is_last)
+        else:
+            yield entry, f"{prefix}{connector}{entry.name}"
 
-    mid = (low + high) // 2
 
-    # Базовый случай - элемент найден
-    if arr[mid] == target:
-        return mid
+def render_file_system_tree(entries, indent=""):
+    """
+    Строки дерева каталогов для элементов walk_file_system
+
+    Args:
+        entries (iterable): FileSystemEntry в порядке обхода в глубину
+        indent (str): Отступ слева для всех строк
 
-    # Рекурсивный шаг - поиск в левой или правой половине
-    elif arr[mid] > target:
-        return binary_search(arr, target, low, mid - 1)
-    else:
-        return binary_search(arr, target, mid + 1, high)
+    Yields:
+        str: Строка дерева, например "│   ├── file.txt"
+    """
+    for _, line in _tree_lines(entries, indent):
+        yield line
 
 
 def recursive_file_system_tree(start_path, indent="", max_depth=None, current_depth=0):
     """
-    Рекурсивный обход файловой системы
+    Обход файловой системы с выводом дерева каталогов
+
+    Обход выполняется итеративно через walk_file_system, вывод строится
+    render_file_system_tree.
 
     Args:
         start_path (str): Начальный путь для обхода
         indent (str): Отступ для визуализации иерархии
-        max_depth (int): Максимальная глубина рекурсии
-        current_depth (int): Текущая глубина рекурсии
+        max_depth (int): Максимальная глубина обхода
+        current_depth (int): Глубина, с которой начинается обход
 
     Returns:
         list: Список всех найденных файлов и директорий
@@ -57,45 +322,130 @@ def recursive_file_system_tree(start_path, indent="", max_depth=None, current_de
     if max_depth is not None and current_depth > max_depth:
         return []
 
-    try:
-        items = os.listdir(start_path)
-    except PermissionError:
-        print(f"{indent}[Доступ запрещен] {os.path.basename(start_path)}/")
-        return []
-    except FileNotFoundError:
-        print(f"{indent}[Путь не найден] {start_path}")
-        return []
+    def report_error(exc):
+        if isinstance(exc, FileNotFoundError):
+            print(f"{indent}[Путь не найден] {exc.filename}")
+        else:
+            print(f"{indent}[Доступ запрещен] {os.path.basename(exc.filename)}/")
 
-    items.sort()  # Сортировка для единообразного вывода
+    entries = walk_file_system(
+        start_path,
+        max_depth=None if max_depth is None else max_depth - current_depth,
+        onerror=report_error,
+    )
     result = []
+    for entry, line in _tree_lines(entries, indent):
+        print(line)
+        result.append(entry.path + "/" if entry.is_dir else entry.path)
 
-    for i, item in enumerate(items):
-        item_path = os.path.join(start_path, item)
-        is_last = i == len(items) - 1
+    return result
+
+
+def _hanoi_pegs(n, source, target, auxiliary):
+    """
+    Порядок стержней для итеративной формулы ходов
 
-        if os.path.isdir(item_path):
-            # Директория - рекурсивный обход
-            prefix = "└── " if is_last else "├── "
-            print(f"{indent}{prefix}{item}/")
-            result.append(item_path + "/")
+    Формула ниже переносит башню со стержня 0 на стержень 2 при нечетном n
+    и на стержень 1 при четном n.
+    """
+    if n % 2 == 1:
+        return (source, auxiliary, target)
+    return (source, target, auxiliary)
+
+
+def nth_move(n, k, source="A", target="C", auxiliary="B"):
+    """
+    k-й ход (нумерация с 1) оптимального решения Ханойских башен
+
+    Номер диска равен числу младших нулевых битов k плюс один, а стержни
+    вычисляются по двоичной записи k - без перебора предыдущих ходов.
+
+    Args:
+        n (int): Количество дисков
+        k (int): Номер хода, 1 <= k <= 2^n - 1
+
+    Returns:
+        tuple: (диск, стержень-источник, стержень-назначение)
+
+    Time Complexity: O(1) (битовые операции над k)
+    """
+    if not 1 <= k < (1 << n):
+        raise ValueError(f"Номер хода должен быть в диапазоне [1, {(1 << n) - 1}]")
+    pegs = _hanoi_pegs(n, source, target, auxiliary)
+    disk = (k & -k).bit_length()
+    return disk, pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3]
+
+
+def hanoi_moves(n, source="A", target="C", auxiliary="B"):
+    """
+    Ленивый генератор ходов для Ханойских башен
 
-            new_indent = indent + ("    " if is_last else "│   ")
-            sub_items = recursive_file_system_tree(
-                item_path, new_indent, max_depth, current_depth + 1
+    Ходы вычисляются итеративно по номеру хода, без рекурсии и без
+    хранения списка ходов.
+
+    Args:
+        n (int): Количество дисков
+        source (str): Стержень-источник
+        target (str): Стержень-назначение
+        auxiliary (str): Вспомогательный стержень
+
+    Yields:
+        tuple: (диск, стержень-источник, стержень-назначение)
+
+    Time Complexity: O(2^n) на все ходы, O(1) на ход
+    Memory: O(1)
+    """
+    pegs = _hanoi_pegs(n, source, target, auxiliary)
+    for k in range(1, 1 << n):
+        yield (k & -k).bit_length(), pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3]
+
+
+def write_hanoi_moves(
+    n, file, source="A", target="C", auxiliary="B", chunk_size=65536
+):
+    """
+    Запись всех ходов в файл строками "диск источник назначение"
+
+    Строки собираются в блоки по chunk_size ходов и записываются одним
+    вызовом write, вместо print на каждый ход.
+
+    Args:
+        n (int): Количество дисков
+        file (str или file-like): Путь к файлу или открытый текстовый файл
+        chunk_size (int): Количество ходов в одном блоке записи
+
+    Returns:
+        int: Количество записанных ходов
+
+    Time Complexity: O(2^n)
+    Memory: O(chunk_size)
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding="utf-8") as output:
+            return write_hanoi_moves(
+                n, output, source, target, auxiliary, chunk_size
             )
-            result.extend(sub_items)
-        else:
-            # Файл
-            prefix = "└── " if is_last else "├── "
-            print(f"{indent}{prefix}{item}")
-            result.append(item_path)
 
-    return result
+    count = 0
+    chunk = []
+    for disk, from_peg, to_peg in hanoi_moves(n, source, target, auxiliary):
+        chunk.append(f"{disk} {from_peg} {to_peg}\n")
+        if len(chunk) >= chunk_size:
+            file.write("".join(chunk))
+            count += len(chunk)
+            chunk.clear()
+    if chunk:
+        file.write("".join(chunk))
+        count += len(chunk)
+    return count
 
 
 def hanoi_towers(n, source="A", target="C", auxiliary="B", moves=None):
     """
-    Решение задачи о Ханойских башнях
+    Решение задачи о Ханойских башнях с выводом ходов на экран
+
+    Для больших n используйте hanoi_moves (генератор) или
+    write_hanoi_moves (запись в файл блоками).
 
     Args:
         n (int): Количество дисков
@@ -108,33 +458,20 @@ def hanoi_towers(n, source="A", target="C", auxiliary="B", moves=None):
         list: Список ходов для решения задачи
 
     Time Complexity: O(2^n)
-    Recursion Depth: O(n)
+    Recursion Depth: O(1) - ходы берутся из итеративного генератора
     """
     if moves is None:
         moves = []
 
-    # Базовый случай - перемещение одного диска
-    if n == 1:
-        move = f"Переместить диск 1 со стержня {source} на стержень {target}"
+    for disk, from_peg, to_peg in hanoi_moves(n, source, target, auxiliary):
+        move = f"Переместить диск {disk} со стержня {from_peg} на стержень {to_peg}"
         moves.append(move)
         print(move)
-        return moves
-
-    # Рекурсивный шаг:
-    # 1. Переместить n-1 дисков на вспомогательный стержень
-    hanoi_towers(n - 1, source, auxiliary, target, moves)
-
-    # 2. Переместить самый большой диск на целевой стержень
-    move = f"Переместить диск {n} со стержня {source} на стержень {target}"
-    moves.append(move)
-    print(move)
-
-    # 3. Переместить n-1 дисков с вспомогательного на целевой стержень
-    hanoi_towers(n - 1, auxiliary, target, source, moves)
 
     return moves
 
 
+@stack_safe
 def calculate_hanoi_moves(n):
     """
     Вычисление минимального количества ходов для Ханойских башень
@@ -144,10 +481,14 @@ def calculate_hanoi_moves(n):
 
     Returns:
         int: Минимальное количество ходов
+
+    Recursion Depth: O(1) - рекурсия через явный стек (trampoline)
     """
+    if n < 1:
+        return 0
     if n == 1:
         return 1
-    return 2 * calculate_hanoi_moves(n - 1) + 1
+    return 2 * (yield (n - 1,)) + 1
 
 
 # Экспериментальное исследование
@@ -167,6 +508,13 @@ def experimental_analysis():
     print(f"Общее количество ходов: {len(moves)}")
     print(f"Теоретическое количество ходов: {calculate_hanoi_moves(3)}")
 
+    # Большие n: ходы не хранятся, k-й ход вычисляется за O(1)
+    n = 25
+    middle = 1 << (n - 1)
+    print(f"\nХанойские башни для {n} дисков: {calculate_hanoi_moves(n)} ходов")
+    print(f"Ход {middle}: {nth_move(n, middle)}")
+    print(f"Первые 3 хода: {list(islice(hanoi_moves(n), 3))}")
+
 
 if __name__ == "__main__":
     # Тест бинарного поиска
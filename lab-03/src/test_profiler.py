@@ -0,0 +1,71 @@
+import math
+import unittest
+import memoization
+import recursion
+import recursion_tasks
+from profiler import RecursionProfiler
+
+
+class TestRecursionProfiler(unittest.TestCase):
+    """
+    Тестирование профилировщика на обычной и trampoline-рекурсии
+    """
+
+    def test_plain_recursion(self):
+        """Тест обычной рекурсии через глобальное имя - O(φ^n)"""
+        with RecursionProfiler().patch(recursion, "fibonacci") as profile:
+            recursion.fibonacci(10)  # O(φ^n)
+
+        self.assertEqual(profile.calls, 177)  # O(1) - 2*F(11) - 1 вызовов
+        self.assertEqual(profile.max_depth, 10)  # O(1)
+
+    def test_factorial_trampoline(self):
+        """Тест stack_safe: подвызовы через yield тоже учитываются - O(n)"""
+        with RecursionProfiler().patch(recursion, "factorial") as profile:
+            result = recursion.factorial(50)  # O(n)
+
+        self.assertEqual(result, math.factorial(50))  # O(n)
+        self.assertEqual(profile.calls, 50)  # O(1) - factorial(50)..factorial(1)
+        self.assertEqual(profile.max_depth, 50)  # O(1)
+        self.assertEqual(profile.report()["repeated_calls"], 0)  # O(1)
+
+    def test_fibonacci_memoized_trampoline(self):
+        """Тест memoize над генератором: вызовы, глубина и кеш - O(n)"""
+        memoization.fibonacci_memoized.cache_clear()  # O(1)
+        with RecursionProfiler().patch(memoization, "fibonacci_memoized") as profile:
+            memoization.fibonacci_memoized(30)  # O(n)
+
+        self.assertEqual(profile.cache_misses, 31)  # O(1) - F(0)..F(30)
+        self.assertEqual(profile.max_depth, 30)  # O(1) - до F(1)
+        # Каждый кадр n >= 2 делает два подвызова, второй попадает в кеш
+        self.assertEqual(profile.calls, 59)  # O(1)
+        self.assertEqual(profile.report()["repeated_calls"], profile.cache_hits)
+
+    def test_hanoi_trampoline(self):
+        """Тест stack_safe в recursion_tasks - глубина равна числу дисков"""
+        with RecursionProfiler().patch(
+            recursion_tasks, "calculate_hanoi_moves"
+        ) as profile:
+            recursion_tasks.calculate_hanoi_moves(10)  # O(n)
+
+        self.assertEqual(profile.calls, 10)  # O(1) - по вызову на n = 10..1
+        self.assertEqual(profile.max_depth, 10)  # O(1)
+
+    def test_patch_restores_name(self):
+        """Тест восстановления имени и отписки от trampoline - O(n)"""
+        original = recursion.factorial
+        with RecursionProfiler().patch(recursion, "factorial") as profile:
+            recursion.factorial(5)  # O(n)
+        self.assertIs(recursion.factorial, original)  # O(1)
+
+        recursion.factorial(5)  # O(n) - вне контекста не учитывается
+        self.assertEqual(profile.calls, 5)  # O(1)
+
+
+def run_tests():
+    """Запуск всех тестов - O(все тесты)"""
+    unittest.main(argv=[""], verbosity=2, exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()  # O(все тесты)
@@ -0,0 +1,122 @@
+"""
+Стек-безопасное вычисление рекурсивных функций без рекурсии в Python
+
+Рекурсивная функция записывается как генератор: вместо рекурсивного вызова
+f(*args) она выполняет `yield args` (кортеж аргументов) и получает результат
+подвызова как значение выражения yield. Вычислитель хранит незавершенные
+вызовы в явном стеке (списке), поэтому глубина рекурсии ограничена только
+памятью, а не sys.getrecursionlimit().
+
+Пример:
+    @stack_safe
+    def factorial(n):
+        if n <= 1:
+            return 1
+        return n * (yield (n - 1,))
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+
+# Маркер отсутствия значения в кеше (None - допустимый результат функции)
+MISSING = object()
+
+# Наблюдатели подвызовов: функция-генератор -> callback(args, depth)
+_tracers = {}
+
+
+@contextmanager
+def trace_calls(step, callback):
+    """
+    Временная подписка на подвызовы функции-генератора step
+
+    Пока контекст активен, evaluate вызывает callback(args, depth) для
+    каждого подвызова `yield args` (в том числе найденного в кеше); depth -
+    глубина подвызова относительно верхнего вызова evaluate (его дети - 1).
+    Нужна профилировщику: подвызовы не проходят через имя функции.
+    """
+    previous = _tracers.get(step)
+    _tracers[step] = callback
+    try:
+        yield
+    finally:
+        if previous is None:
+            del _tracers[step]
+        else:
+            _tracers[step] = previous
+
+
+def evaluate(step, args, lookup=None, store=None):
+    """
+    Итеративное вычисление рекурсивной функции-генератора
+
+    Args:
+        step (callable): Функция-генератор, выдающая кортежи аргументов подвызовов
+        args (tuple): Аргументы верхнего вызова
+        lookup (callable): lookup(args) -> значение или MISSING (проверка кеша)
+        store (callable): store(args, value) - сохранение результата в кеш
+
+    Returns:
+        Результат вызова step(*args)
+
+    Time Complexity: O(число вычисленных вызовов)
+    Recursion Depth: O(1) - кадры хранятся в явном стеке (O(глубина) памяти)
+    """
+    stack = []  # Незавершенные вызовы: (генератор, аргументы)
+    tracer = _tracers.get(step)
+    gen = step(*args)
+    key = args
+    value = None
+    error = None
+
+    while True:
+        try:
+            if error is not None:
+                # Исключение подвызова пробрасывается в вызывающий кадр
+                exc, error = error, None
+                call = gen.throw(exc)
+            else:
+                call = gen.send(value)
+        except StopIteration as stop:
+            # Кадр завершился - возвращаем результат вызывающему
+            value = stop.value
+            if store is not None:
+                store(key, value)
+            if not stack:
+                return value
+            gen, key = stack.pop()
+            continue
+        except Exception as exc:
+            if not stack:
+                raise
+            gen, key = stack.pop()
+            error = exc
+            continue
+
+        # Подвызов: сначала проверяем кеш, затем создаем новый кадр
+        if tracer is not None:
+            tracer(call, len(stack) + 1)
+        if lookup is not None:
+            value = lookup(call)
+            if value is not MISSING:
+                continue
+        stack.append((gen, key))
+        gen = step(*call)
+        key = call
+        value = None
+
+
+def stack_safe(step):
+    """
+    Декоратор, превращающий рекурсивную функцию-генератор в обычную функцию,
+    вычисляемую через явный стек
+
+    Исходный генератор доступен как атрибут `step` обертки.
+    """
+
+    @wraps(step)
+    def wrapper(*args):
+        return evaluate(step, args)
+
+    wrapper.step = step
+    return wrapper
@@ -0,0 +1,343 @@
+"""
+Параллельный воспроизводимый прогон сетки замеров
+алгоритмы x размеры x распределения
+
+- Конфигурация задается словарем или JSON-файлом (см. DEFAULT_CONFIG).
+- Наборы данных генерируются один раз с фиксированным зерном на каждую
+  пару (распределение, размер) и передаются рабочим процессам при запуске,
+  поэтому все алгоритмы сортируют одинаковые данные. С cache_dir наборы
+  сохраняются в .npy и читаются повторными запусками (generate_data.load_dataset).
+- Каждая ячейка сетки - repeats замеров одного алгоритма на одном наборе;
+  ячейки выполняются в пуле процессов, по одному процессу на ядро, процесс
+  закрепляется за своим ядром (os.sched_setaffinity, где доступно).
+- Ячейка, не уложившаяся в timeout, прерывается завершением процесса,
+  процесс перезапускается; большие размеры того же алгоритма
+  и распределения после этого пропускаются.
+- Если рабочий процесс погиб (сбой, нехватка памяти, исключение), ячейка
+  получает status = "error", процесс перезапускается, прогон продолжается.
+- Результаты сохраняются в CSV и/или JSON; plot_results.load_grid_results
+  читает оба формата.
+
+Запуск: python benchmark_grid.py [config.json] --csv grid.csv --json grid.json
+"""
+
+import argparse
+import csv
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import time
+import zlib
+from multiprocessing.connection import wait
+
+from generate_data import load_dataset, to_list
+from performance_test import algorithms
+
+# Имя распределения в сетке -> имя в generate_data
+DISTRIBUTIONS = {
+    "random": "random",
+    "sorted": "sorted",
+    "reversed": "reversed",
+    "almost": "almost_sorted",
+}
+
+DEFAULT_CONFIG = {
+    "algorithms": list(algorithms),
+    "sizes": [100, 500, 1000, 2000, 5000, 10000],
+    "distributions": list(DISTRIBUTIONS),
+    "repeats": 5,
+    "seed": 42,
+    "timeout": 30.0,  # секунд на ячейку
+    "workers": None,  # None - по числу доступных ядер
+    "cache_dir": None,  # Каталог кеша наборов .npy (None - без кеша)
+}
+
+# Поля строки результата (порядок столбцов CSV)
+RESULT_FIELDS = [
+    "algorithm", "size", "distribution", "status", "repeats",
+    "median", "min", "mean", "stdev",
+]
+
+
+def load_config(source=None):
+    """
+    Конфигурация сетки: DEFAULT_CONFIG, дополненный словарем
+    или содержимым JSON-файла source
+    """
+    config = dict(DEFAULT_CONFIG)
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as file:
+            source = json.load(file)
+    config.update(source or {})
+
+    unknown = [name for name in config["algorithms"] if name not in algorithms]
+    unknown += [name for name in config["distributions"] if name not in DISTRIBUTIONS]
+    if unknown:
+        raise ValueError(f"Неизвестные алгоритмы или распределения: {unknown}")
+    return config
+
+
+def make_datasets(config):
+    """
+    Наборы данных для всех пар (распределение, размер)
+
+    Зерно каждого набора выводится из общего зерна, распределения и размера,
+    поэтому набор не зависит от состава и порядка остальных ячеек.
+    """
+    datasets = {}
+    for distribution in config["distributions"]:
+        for size in config["sizes"]:
+            seed = zlib.crc32(f"{config['seed']}:{distribution}:{size}".encode())
+            data = load_dataset(
+                DISTRIBUTIONS[distribution], size, seed, config["cache_dir"]
+            )
+            datasets[distribution, size] = to_list(data)
+    return datasets
+
+
+def _available_cores():
+    """Ядра, доступные процессу"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _measure_cell(algo_name, data, repeats):
+    """Замеры одной ячейки: repeats запусков на копиях одного набора"""
+    sort_func = algorithms[algo_name]
+    samples = []
+    gc_enabled = gc.isenabled()
+    try:
+        for _ in range(repeats):
+            arr = data.copy()
+            gc.disable()
+            start = time.perf_counter()
+            sort_func(arr)
+            samples.append(time.perf_counter() - start)
+            if gc_enabled:
+                gc.enable()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+
+def _worker(core, datasets, connection):
+    """
+    Рабочий процесс: закрепляется за ядром core и выполняет ячейки,
+    присылаемые через connection, пока не получит None
+    """
+    if core is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {core})
+        except OSError:  # Ядро недоступно (контейнер, ограничения ОС)
+            pass
+    while True:
+        cell = connection.recv()
+        if cell is None:
+            return
+        algo_name, size, distribution, repeats = cell
+        samples = _measure_cell(algo_name, datasets[distribution, size], repeats)
+        connection.send(samples)
+
+
+class _WorkerSlot:
+    """Рабочий процесс пула, его канал и выполняемая ячейка"""
+
+    def __init__(self, core, datasets, context):
+        self.core = core
+        self._datasets = datasets
+        self._context = context
+        self.cell = None
+        self.deadline = None
+        self._start()
+
+    def _start(self):
+        self.connection, child = self._context.Pipe()
+        self.process = self._context.Process(
+            target=_worker, args=(self.core, self._datasets, child), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def submit(self, cell, timeout):
+        self.cell = cell
+        self.deadline = time.monotonic() + timeout if timeout else None
+        try:
+            self.connection.send(cell)
+        except (BrokenPipeError, ConnectionResetError):
+            # Процесс погиб, пока простаивал - заменяем его и повторяем
+            self.restart()
+            self.cell = cell
+            self.connection.send(cell)
+
+    def restart(self):
+        """
+        Прерывание зависшей ячейки или замена погибшего процесса:
+        процесс завершается и создается заново
+        """
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+        self.cell = None
+        self._start()
+
+    def close(self):
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.connection.close()
+
+
+def _result_row(cell, status, samples=()):
+    algo_name, size, distribution, repeats = cell
+    row = dict.fromkeys(RESULT_FIELDS)
+    row.update(
+        algorithm=algo_name, size=size, distribution=distribution,
+        status=status, repeats=len(samples),
+    )
+    if samples:
+        row.update(
+            median=statistics.median(samples),
+            min=min(samples),
+            mean=statistics.fmean(samples),
+            stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        )
+    return row
+
+
+def run_grid(config=None, progress=print):
+    """
+    Прогон сетки замеров
+
+    Ячейки раздаются свободным процессам по возрастанию размера, поэтому
+    тайм-аут на меньшем размере успевает отменить большие размеры того же
+    алгоритма и распределения (status = "skipped").
+
+    Args:
+        config: Словарь или путь к JSON-конфигурации (см. load_config)
+        progress (callable): Функция вывода прогресса (None - без вывода)
+
+    Returns:
+        list: Строки результатов с полями RESULT_FIELDS;
+            status - "ok", "timeout", "error" (рабочий процесс погиб)
+            или "skipped"
+    """
+    config = load_config(config)
+    datasets = make_datasets(config)
+    cores = _available_cores()
+    workers = config["workers"] or len(cores)
+    timeout = config["timeout"]
+
+    pending = [
+        (algo_name, size, distribution, config["repeats"])
+        for size in sorted(config["sizes"])
+        for algo_name in config["algorithms"]
+        for distribution in config["distributions"]
+    ]
+    pending.reverse()  # pop() с конца - в порядке возрастания размера
+    timed_out = {}  # (алгоритм, распределение) -> размер с тайм-аутом
+    results = []
+
+    def finish(cell, status, samples=()):
+        results.append(_result_row(cell, status, samples))
+        if progress is not None:
+            median = f"{statistics.median(samples):.6f}s" if samples else ""
+            progress(f"  {cell[0]:<14} {cell[2]:<9} size {cell[1]:<7} {status} {median}")
+
+    context = multiprocessing.get_context()
+    slots = [
+        _WorkerSlot(cores[i % len(cores)] if len(cores) >= workers else None,
+                    datasets, context)
+        for i in range(workers)
+    ]
+    try:
+        while pending or any(slot.cell for slot in slots):
+            # Раздача ячеек свободным процессам
+            for slot in slots:
+                while slot.cell is None and pending:
+                    cell = pending.pop()
+                    limit = timed_out.get((cell[0], cell[2]))
+                    if limit is not None and cell[1] >= limit:
+                        finish(cell, "skipped")
+                        continue
+                    slot.submit(cell, timeout)
+
+            busy = [slot for slot in slots if slot.cell]
+            if not busy:
+                continue
+            deadlines = [slot.deadline for slot in busy if slot.deadline]
+            wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            ready = wait([slot.connection for slot in busy], timeout=wait_time)
+
+            for slot in busy:
+                if slot.connection in ready:
+                    try:
+                        samples = slot.connection.recv()
+                    except (EOFError, ConnectionResetError):
+                        # Процесс завершился, не прислав замеры
+                        finish(slot.cell, "error")
+                        slot.restart()
+                        continue
+                    finish(slot.cell, "ok", samples)
+                    slot.cell = None
+                elif slot.deadline and time.monotonic() >= slot.deadline:
+                    cell = slot.cell
+                    key = (cell[0], cell[2])
+                    timed_out[key] = min(cell[1], timed_out.get(key, cell[1]))
+                    finish(cell, "timeout")
+                    slot.restart()
+    finally:
+        for slot in slots:
+            slot.close()
+
+    results.sort(key=lambda row: (row["algorithm"], row["distribution"], row["size"]))
+    return results
+
+
+def save_csv(results, path):
+    """Сохранение строк результатов в CSV"""
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def save_json(results, path, config=None):
+    """Сохранение результатов в JSON вместе с конфигурацией и системой"""
+    payload = {
+        "system": {
+            "os": f"{platform.system()} {platform.release()}",
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "cores": len(_available_cores()),
+        },
+        "config": load_config(config),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сетка замеров алгоритмов сортировки")
+    parser.add_argument("config", nargs="?", help="JSON-файл конфигурации")
+    parser.add_argument("--csv", default="grid_results.csv", help="Файл CSV")
+    parser.add_argument("--json", default="grid_results.json", help="Файл JSON")
+    args = parser.parse_args()
+
+    results = run_grid(args.config)
+    save_csv(results, args.csv)
+    save_json(results, args.json, args.config)
+    print(f"Результаты: {args.csv}, {args.json}")
+
+
+if __name__ == "__main__":
+    main()
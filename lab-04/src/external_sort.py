@@ -0,0 +1,284 @@
+"""
+Внешняя сортировка слиянием для данных, не помещающихся в память
+
+1. Вход читается порциями, пока занятая порцией память не превысит
+   бюджет; каждая порция сортируется алгоритмом из sorts.py.
+2. Отсортированные порции (серии) сбрасываются во временные файлы
+   в компактном двоичном формате.
+3. Серии сливаются k-путевым слиянием (heapq.merge) с буферизованным
+   чтением; если серий больше max_fan_in, слияние идет в несколько проходов.
+
+Результат выдается потоково (итератором), в памяти одновременно находятся
+только буферы чтения серий.
+"""
+
+import heapq
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from functools import partial
+from typing import Callable, Iterable, Iterator, List
+
+from sorts import SORTING_ALGORITHMS
+
+# Бюджет памяти по умолчанию (байты)
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+# Максимальное число серий, сливаемых за один проход
+DEFAULT_MAX_FAN_IN = 64
+# Минимальный размер буфера чтения одной серии (байты)
+_MIN_READ_BUFFER = 4096
+# Стоимость ссылок на элемент: в списке порции, в копии и в буфере слияния
+# merge_sort (алгоритма по умолчанию)
+_POINTER_COST = 3 * struct.calcsize("P")
+
+
+class ArrayRunFormat:
+    """
+    Серии чисел в виде сырых элементов array.array: 'q' - int64, 'd' - double
+
+    Число, не помещающееся в формат, вызывает OverflowError при записи.
+    """
+
+    def __init__(self, typecode: str = "q"):
+        self.typecode = typecode
+        self.itemsize = array(typecode).itemsize
+
+    def write(self, file, items: List):
+        """Запись отсортированной порции"""
+        array(self.typecode, items).tofile(file)  # O(k)
+
+    def read(self, file, buffer_size: int) -> Iterator:
+        """Чтение серии блоками по buffer_size байтов"""
+        count = max(1, buffer_size // self.itemsize)  # Элементов за чтение
+        while True:
+            block = array(self.typecode)
+            try:
+                block.fromfile(file, count)  # O(count)
+            except EOFError:  # Последний неполный блок уже прочитан в block
+                yield from block
+                return
+            yield from block
+
+
+class TextRunFormat:
+    """
+    Серии строк: длина в UTF-8 (4 байта, little-endian) и сами байты строки
+    """
+
+    _LENGTH = struct.Struct("<I")
+
+    def write(self, file, items: List[str]):
+        """Запись отсортированной порции"""
+        pack = self._LENGTH.pack
+        for item in items:  # O(суммарная длина)
+            data = item.encode("utf-8")
+            file.write(pack(len(data)))
+            file.write(data)
+
+    def read(self, file, buffer_size: int) -> Iterator[str]:
+        """Чтение серии; буферизацию обеспечивает открытый файл"""
+        header_size = self._LENGTH.size
+        unpack = self._LENGTH.unpack
+        while True:
+            header = file.read(header_size)
+            if len(header) < header_size:
+                return
+            (length,) = unpack(header)
+            yield file.read(length).decode("utf-8")
+
+
+RUN_FORMATS = {
+    "int": lambda: ArrayRunFormat("q"),
+    "float": lambda: ArrayRunFormat("d"),
+    "str": TextRunFormat,
+}
+
+
+def _read_chunks(items: Iterable, memory_limit: int) -> Iterator[List]:
+    """
+    Разбиение потока на порции, занимающие не больше memory_limit байтов
+
+    Учитывается размер самого объекта и ссылки на него в порции, в копии
+    и в буфере сортировки; каждая порция содержит хотя бы один элемент.
+    """
+    chunk = []
+    used = 0
+    for item in items:  # O(n)
+        size = sys.getsizeof(item) + _POINTER_COST  # O(1)
+        if chunk and used + size > memory_limit:
+            yield chunk
+            chunk = []
+            used = 0
+        chunk.append(item)  # O(1)
+        used += size  # O(1)
+    if chunk:
+        yield chunk
+
+
+def _resolve_algorithm(algorithm) -> Callable:
+    """
+    Алгоритм сортировки порций: имя из SORTING_ALGORITHMS или функция
+
+    Порция принадлежит только сортировке, поэтому алгоритмы из
+    SORTING_ALGORITHMS вызываются с inplace=True - без защитной копии.
+    """
+    if callable(algorithm):
+        return algorithm
+    try:
+        return partial(SORTING_ALGORITHMS[algorithm], inplace=True)
+    except KeyError:
+        raise ValueError(f"Неизвестный алгоритм сортировки: {algorithm!r}") from None
+
+
+class _RunStore:
+    """Временный каталог с файлами серий; удаляется вместе с файлами"""
+
+    def __init__(self, run_format, tmp_dir=None):
+        self.format = run_format
+        self._directory = tempfile.TemporaryDirectory(prefix="external_sort_", dir=tmp_dir)
+        self._counter = 0
+
+    def write(self, items) -> str:
+        """Сброс отсортированной серии в новый файл"""
+        path = os.path.join(self._directory.name, f"run_{self._counter:06d}.bin")
+        self._counter += 1
+        with open(path, "wb") as file:
+            if isinstance(items, list):
+                self.format.write(file, items)
+            else:  # Поток из слияния - записываем частями
+                for chunk in _batched(items, 1 << 14):
+                    self.format.write(file, chunk)
+        return path
+
+    def read(self, path: str, buffer_size: int) -> Iterator:
+        """Буферизованное чтение серии"""
+        with open(path, "rb", buffering=buffer_size) as file:
+            yield from self.format.read(file, buffer_size)
+        os.remove(path)  # Серия прочитана до конца - место освобождается сразу
+
+    def cleanup(self):
+        self._directory.cleanup()
+
+
+def _batched(items: Iterable, size: int) -> Iterator[List]:
+    """Группировка потока в списки по size элементов"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def external_sorted(
+    items: Iterable,
+    *,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    record_type: str = "int",
+    algorithm="merge_sort",
+    max_fan_in: int = DEFAULT_MAX_FAN_IN,
+    tmp_dir: str = None,
+) -> Iterator:
+    """
+    Потоковая внешняя сортировка
+
+    Args:
+        items: Итерируемый источник элементов (может быть больше памяти)
+        memory_limit (int): Бюджет памяти на порцию и на буферы слияния (байты)
+        record_type (str): Формат серий на диске: "int", "float" или "str"
+        algorithm: Имя алгоритма из SORTING_ALGORITHMS или функция сортировки
+        max_fan_in (int): Максимум серий в одном слиянии
+        tmp_dir (str): Каталог для временных файлов (по умолчанию системный)
+
+    Yields:
+        Элементы в порядке возрастания
+
+    Time Complexity: O(n log n) сравнений, O(n * log_f(r)) записи на диск,
+        r - число серий, f = max_fan_in
+    Space Complexity: O(memory_limit) памяти, O(n) на диске
+    """
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in должен быть не меньше 2")
+    sort_func = _resolve_algorithm(algorithm)
+    store = _RunStore(RUN_FORMATS[record_type](), tmp_dir)
+    try:
+        runs = []
+        last_chunk = None
+        for chunk in _read_chunks(items, memory_limit):  # O(n) чтения
+            if last_chunk is not None:
+                runs.append(store.write(last_chunk))  # O(k) записи
+            last_chunk = sort_func(chunk)  # O(k log k)
+
+        if not runs:
+            # Все данные поместились в одну порцию - диск не нужен
+            yield from last_chunk or ()
+            return
+        runs.append(store.write(last_chunk))
+
+        buffer_size = max(_MIN_READ_BUFFER, memory_limit // (max_fan_in + 1))
+        # Промежуточные проходы, пока серий больше max_fan_in
+        while len(runs) > max_fan_in:  # O(log_f(r)) проходов
+            merged = []
+            for start in range(0, len(runs), max_fan_in):
+                group = runs[start:start + max_fan_in]
+                streams = [store.read(path, buffer_size) for path in group]
+                merged.append(store.write(heapq.merge(*streams)))  # O(n log f)
+            runs = merged
+
+        buffer_size = max(_MIN_READ_BUFFER, memory_limit // (len(runs) + 1))
+        yield from heapq.merge(*(store.read(path, buffer_size) for path in runs))
+    finally:
+        store.cleanup()
+
+
+def read_records(path: str, record_type: str = "int") -> Iterator:
+    """
+    Построчное чтение текстового файла: по одному числу или строке на строку
+
+    Для "int" и "float" пустые строки пропускаются; для "str" возвращается
+    каждая строка без перевода строки, пустая - как "".
+    """
+    parse = {"int": int, "float": float}.get(record_type)
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if parse is None:
+                yield line.rstrip("\n")
+            elif line.strip():
+                yield parse(line)
+
+
+def external_sort(
+    input_path: str,
+    output_path: str,
+    *,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    record_type: str = "int",
+    algorithm="merge_sort",
+    max_fan_in: int = DEFAULT_MAX_FAN_IN,
+    tmp_dir: str = None,
+) -> int:
+    """
+    Внешняя сортировка текстового файла (по одной записи на строку)
+
+    Returns:
+        int: Количество отсортированных записей
+    """
+    count = 0
+    sorted_items = external_sorted(
+        read_records(input_path, record_type),
+        memory_limit=memory_limit,
+        record_type=record_type,
+        algorithm=algorithm,
+        max_fan_in=max_fan_in,
+        tmp_dir=tmp_dir,
+    )
+    with open(output_path, "w", encoding="utf-8") as output:
+        for batch in _batched(sorted_items, 1 << 14):
+            output.write("\n".join(map(str, batch)))
+            output.write("\n")
+            count += len(batch)
+    return count
@@ -1,10 +1,82 @@
+import os
 import random
+from collections.abc import Mapping
 from typing import List, Dict
 
+try:
+    import numpy as np
+except ImportError:  # Без NumPy данные генерируются модулем random
+    np = None
 
-def generate_random_array(size: int) -> List[int]:
+# Распределения тестовых данных
+DISTRIBUTIONS = ("random", "sorted", "reversed", "almost_sorted")
+# Доля переставленных пар в почти отсортированном массиве
+ALMOST_SORTED_SWAP_PERCENTAGE = 0.05
+
+
+def generate_array(distribution: str, size: int, seed: int = None,
+                   swap_percentage: float = ALMOST_SORTED_SWAP_PERCENTAGE):
+    """
+    Генерация массива одним векторным вызовом генератора NumPy
+
+    Args:
+        distribution (str): Одно из DISTRIBUTIONS
+        size (int): Размер массива
+        seed (int): Зерно генератора (None - случайное)
+
+    Returns:
+        numpy.ndarray (int64), без NumPy - list
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Неизвестное распределение: {distribution!r}")
+    if np is None:
+        return _generate_list(distribution, size, seed, swap_percentage)
+
+    rng = np.random.default_rng(seed)  # O(1)
+    if distribution == "random":
+        return rng.integers(0, size * 10, size, endpoint=True)  # O(n)
+    if distribution == "reversed":
+        return np.arange(size, 0, -1)  # O(n)
+
+    arr = np.arange(size)  # O(n)
+    if distribution == "almost_sorted" and size > 0:
+        num_swaps = int(size * swap_percentage)  # O(1)
+        # Как в списковой версии: независимые случайные пары (могут
+        # пересекаться и совпадать), переставляемые по очереди; векторно
+        # генерируются только индексы
+        pairs = rng.integers(0, size, (num_swaps, 2)).tolist()  # O(k)
+        for i, j in pairs:  # O(k) итераций
+            arr[i], arr[j] = arr[j], arr[i]  # O(1)
+    return arr  # O(1)
+    # Общая сложность: O(n)
+
+
+def _generate_list(distribution: str, size: int, seed: int,
+                   swap_percentage: float) -> List[int]:
+    """Запасной генератор на модуле random (если NumPy не установлен)"""
+    rng = random.Random(seed)  # O(1)
+    if distribution == "random":
+        return [rng.randint(0, size * 10) for _ in range(size)]  # O(n)
+    if distribution == "reversed":
+        return list(range(size, 0, -1))  # O(n)
+
+    arr = list(range(size))  # O(n)
+    if distribution == "almost_sorted" and size > 0:
+        for _ in range(int(size * swap_percentage)):  # O(n) итераций
+            i, j = rng.randrange(size), rng.randrange(size)  # O(1)
+            arr[i], arr[j] = arr[j], arr[i]  # O(1)
+    return arr  # O(1)
+    # Общая сложность: O(n)
+
+
+def to_list(arr) -> List[int]:
+    """Список Python из numpy.ndarray (одним вызовом) или из списка"""
+    return arr.tolist() if np is not None and isinstance(arr, np.ndarray) else list(arr)
+
+
+def generate_random_array(size: int, seed: int = None) -> List[int]:
     """Генерация случайного массива"""
-    return [random.randint(0, size * 10) for _ in range(size)]  # O(n)
+    return to_list(generate_array("random", size, seed))  # O(n)
 
 
 def generate_sorted_array(size: int) -> List[int]:
@@ -18,38 +90,108 @@ def generate_reversed_array(size: int) -> List[int]:
 
 
 def generate_almost_sorted_array(
-        size: int, swap_percentage: float = 0.05) -> List[int]:
+        size: int, swap_percentage: float = ALMOST_SORTED_SWAP_PERCENTAGE,
+        seed: int = None) -> List[int]:
     """Генерация почти отсортированного массива"""
-    arr = list(range(size))  # O(n)
-    num_swaps = int(size * swap_percentage)  # O(1)
+    return to_list(
+        generate_array("almost_sorted", size, seed, swap_percentage)
+    )  # O(n)
 
-    for _ in range(num_swaps):  # O(n) итераций
-        i = random.randint(0, size - 1)  # O(1)
-        j = random.randint(0, size - 1)  # O(1)
-        arr[i], arr[j] = arr[j], arr[i]  # O(1)
 
-    return arr  # O(1)
-    # Общая сложность: O(n)
+def dataset_path(cache_dir: str, distribution: str, size: int, seed: int) -> str:
+    """Путь к файлу кеша набора данных"""
+    return os.path.join(cache_dir, f"{distribution}_{size}_seed{seed}.npy")
+
 
+def load_dataset(distribution: str, size: int, seed: int = None,
+                 cache_dir: str = None):
+    """
+    Набор данных из кеша на диске или новый (с сохранением в кеш)
+
+    Кешируются только наборы с заданным зерном - только они воспроизводимы.
+    Файл .npy читается через отображение в память, поэтому повторный запуск
+    на 10^7 элементов не тратит время на генерацию.
+
+    Returns:
+        numpy.ndarray (без NumPy - list, кеш не используется)
+    """
+    if np is None or cache_dir is None or seed is None:
+        return generate_array(distribution, size, seed)
+
+    path = dataset_path(cache_dir, distribution, size, seed)
+    if os.path.exists(path):
+        return np.load(path, mmap_mode="r")  # O(1) - чтение по требованию
+
+    arr = generate_array(distribution, size, seed)  # O(n)
+    os.makedirs(cache_dir, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp.npy"
+    np.save(temporary, arr)  # O(n)
+    os.replace(temporary, path)  # Атомарно: параллельные запуски не видят полуфайл
+    return arr
+
+
+class LazyTestData(Mapping):
+    """
+    Тестовые данные тип_данных -> размер -> список, создаваемые при первом
+    обращении
+
+    Каждая пара (тип данных, размер) генерируется (или читается из кеша)
+    только когда она нужна, и хранится как список.
+    """
+
+    def __init__(self, sizes: List[int], seed: int = None, cache_dir: str = None):
+        self.sizes = list(sizes)
+        self.seed = seed
+        self.cache_dir = cache_dir
+        self._views = {
+            distribution: _LazySizes(self, distribution) for distribution in DISTRIBUTIONS
+        }
 
-def generate_test_data(sizes: List[int]) -> Dict[str, Dict[str, List[int]]]:
+    def __getitem__(self, distribution):
+        return self._views[distribution]
+
+    def __iter__(self):
+        return iter(self._views)
+
+    def __len__(self):
+        return len(self._views)
+
+    def materialize(self, distribution: str, size: int) -> List[int]:
+        """Список для пары (тип данных, размер)"""
+        return to_list(load_dataset(distribution, size, self.seed, self.cache_dir))
+
+
+class _LazySizes(Mapping):
+    """Размер -> список для одного типа данных; списки создаются по запросу"""
+
+    def __init__(self, owner: LazyTestData, distribution: str):
+        self._owner = owner
+        self._distribution = distribution
+        self._loaded = {}
+
+    def __getitem__(self, size):
+        if size not in self._owner.sizes:
+            raise KeyError(size)
+        if size not in self._loaded:
+            self._loaded[size] = self._owner.materialize(self._distribution, size)
+        return self._loaded[size]
+
+    def __iter__(self):
+        return iter(self._owner.sizes)
+
+    def __len__(self):
+        return len(self._owner.sizes)
+
+
+def generate_test_data(sizes: List[int], seed: int = None,
+                       cache_dir: str = None) -> Dict[str, Dict[str, List[int]]]:
     """
     Генерация всех тестовых данных
     Возвращает словарь: тип_данных -> размер -> массив
+
+    Массивы создаются лениво при первом обращении (см. LazyTestData);
+    при заданных seed и cache_dir они сохраняются в .npy и повторно
+    используются следующими запусками.
     """
-    test_data = {
-        'random': {},
-        'sorted': {},
-        'reversed': {},
-        'almost_sorted': {}
-    }
-
-    for size in sizes:  # O(k * n) где k - количество размеров
-        test_data['random'][size] = generate_random_array(size)  # O(n)
-        test_data['sorted'][size] = generate_sorted_array(size)  # O(n)
-        test_data['reversed'][size] = generate_reversed_array(size)  # O(n)
-        test_data['almost_sorted'][
-            size] = generate_almost_sorted_array(size)  # O(n)
-
-    return test_data  # O(1)
-    # Общая сложность: O(k * n)
+    return LazyTestData(sizes, seed, cache_dir)  # O(1)
+    # Общая сложность: O(n) на каждую запрошенную пару (тип данных, размер)
@@ -0,0 +1,167 @@
+"""
+Подсчет операций алгоритмов сортировки: сравнения, перемещения элементов
+и временные выделения памяти
+
+Алгоритмы из sorts.py не меняются - они получают инструментированные данные:
+- CountedItem оборачивает элемент и считает каждое сравнение;
+- CountingList считает каждую запись элемента в список (перемещение),
+  а его копии и буферы алгоритмов (sorts._empty_like: буферы слияния и
+  результата, счетчики сортировки подсчетом, корзины поразрядной и блочной
+  сортировки) тоже являются CountingList и считаются как выделения;
+- tracemalloc измеряет пик дополнительной памяти во время сортировки.
+
+Записи в обычные списки, которые алгоритм строит сам в обход
+sorts._empty_like, как перемещения не учитываются.
+"""
+
+import time
+import tracemalloc
+from collections import namedtuple
+
+# Результат подсчета: сравнения, перемещения, выделенные буферы,
+# пик дополнительной памяти (байты) и время инструментированного запуска
+OperationCounts = namedtuple(
+    "OperationCounts",
+    ["comparisons", "moves", "allocations", "peak_bytes", "time"],
+)
+
+
+class OperationCounter:
+    """Счетчики операций одного запуска"""
+
+    __slots__ = ("comparisons", "moves", "allocations")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+        self.allocations = 0
+
+
+class CountedItem:
+    """
+    Элемент, считающий сравнения с другими элементами
+
+    Сумма и разность (нужны распределяющим сортировкам для вычисления
+    корзины) возвращают обычное число и сравнениями не считаются.
+    """
+
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter: OperationCounter):
+        self.value = value
+        self.counter = counter
+
+    @staticmethod
+    def _raw(other):
+        return other.value if isinstance(other, CountedItem) else other
+
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < self._raw(other)
+
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= self._raw(other)
+
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > self._raw(other)
+
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= self._raw(other)
+
+    def __eq__(self, other):
+        self.counter.comparisons += 1
+        return self.value == self._raw(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __sub__(self, other):
+        return self.value - self._raw(other)
+
+    def __rsub__(self, other):
+        return other - self.value
+
+    def __add__(self, other):
+        return self.value + self._raw(other)
+
+    __radd__ = __add__
+
+    def __repr__(self):
+        return f"CountedItem({self.value!r})"
+
+
+class CountingList(list):
+    """Список, считающий записи элементов и собственные копии"""
+
+    def __init__(self, items=(), counter: OperationCounter = None):
+        super().__init__(items)
+        self.counter = counter if counter is not None else OperationCounter()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counter.moves += len(value)
+        else:
+            self.counter.moves += 1
+        super().__setitem__(index, value)
+
+    def append(self, value):
+        self.counter.moves += 1
+        super().append(value)
+
+    def extend(self, values):
+        values = list(values)
+        self.counter.moves += len(values)
+        super().extend(values)
+
+    def copy(self):
+        """Копия - новый буфер: n перемещений и одно выделение"""
+        self.counter.allocations += 1
+        self.counter.moves += len(self)
+        return CountingList(self, self.counter)
+
+    def empty_like(self, n: int, fill=None):
+        """Буфер из n ячеек fill (вызывается из sorts._empty_like)"""
+        self.counter.allocations += 1
+        return CountingList([fill] * n, self.counter)
+
+
+def instrument(values, counter: OperationCounter = None) -> CountingList:
+    """Инструментированная копия values: CountingList из CountedItem"""
+    counter = counter if counter is not None else OperationCounter()
+    return CountingList((CountedItem(value, counter) for value in values), counter)
+
+
+def count_operations(sort_func, values) -> OperationCounts:
+    """
+    Подсчет операций одного запуска sort_func на копии values
+
+    Проверяет, что результат совпадает с sorted(values): счетчики
+    неправильной сортировки бессмысленны.
+    """
+    counter = OperationCounter()
+    data = instrument(values, counter)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    try:
+        result = sort_func(data)
+    finally:
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        if not was_tracing:
+            tracemalloc.stop()
+
+    plain = [item.value if isinstance(item, CountedItem) else item for item in result]
+    if plain != sorted(values):
+        raise AssertionError(f"{sort_func.__name__} вернул неотсортированный результат")
+    return OperationCounts(
+        counter.comparisons, counter.moves, counter.allocations, max(peak, 0), elapsed
+    )
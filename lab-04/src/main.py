@@ -1,7 +1,14 @@
+import sys
+
 from performance_test import (
     run_all_tests,
     print_results,
     analyze_theoretical_vs_practical,
+    compare_backends,
+    print_backend_results,
+    measure_parallel_scaling,
+    run_operation_counts,
+    print_operation_counts,
 )
 from plot_results import plot_time_vs_size, plot_time_vs_datatype, create_summary_table
 
@@ -35,6 +42,21 @@ def main():
     create_summary_table(results)
     analyze_theoretical_vs_practical(results)
 
+    # Сравнение list / array.array / numpy.ndarray: python main.py --backends
+    if "--backends" in sys.argv:
+        backend_results = compare_backends()
+        for data_type in ("random", "sorted"):
+            print_backend_results(backend_results, data_type)
+
+    # Счетчики сравнений, перемещений и выделений: python main.py --counts
+    if "--counts" in sys.argv:
+        print_operation_counts(run_operation_counts())
+
+    # Масштабирование parallel_merge_sort: python main.py --parallel
+    if "--parallel" in sys.argv:
+        print("\nМАСШТАБИРОВАНИЕ parallel_merge_sort:")
+        measure_parallel_scaling()
+
 
 if __name__ == "__main__":
     main()
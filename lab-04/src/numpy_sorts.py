@@ -0,0 +1,368 @@
+"""
+Реализации алгоритмов сортировки для массивов NumPy
+
+Алгоритмы те же, что в sorts.py, но внутренние циклы заменены
+векторными операциями над numpy.ndarray: сравнения и обмены целыми
+срезами, слияние через numpy.searchsorted, разбиение через маски.
+Функции вызываются из sorts.py, когда на вход передан numpy.ndarray.
+"""
+
+import numpy as np
+
+# Ширина отрезков, которые сливаются построчно через сравнение всех пар
+_ROW_MERGE_MAX_WIDTH = 16
+# Ограничение на размер временной матрицы сравнений при построчном слиянии
+_ROW_MERGE_CHUNK = 1 << 20
+# Отрезки быстрой сортировки не длиннее порога досортировываются
+# общим проходом чет-нечетных перестановок
+_QUICK_LEAF_SIZE = 32
+
+
+def bubble_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Сортировка пузырьком в варианте чет-нечетных перестановок
+
+    За один проход сравниваются все пары (0,1), (2,3), ... одной векторной
+    операцией, затем все пары (1,2), (3,4), ...
+    """
+    arr = arr.copy()  # O(n)
+    n = len(arr)  # O(1)
+    for _ in range(n):  # O(n) проходов
+        swapped = False  # O(1)
+        for start in (0, 1):
+            left = arr[start:n - 1:2]  # O(1) - представление
+            right = arr[start + 1:n:2]  # O(1) - представление
+            mask = left > right  # O(n)
+            if mask.any():  # O(n)
+                low = np.minimum(left, right)  # O(n)
+                right[...] = np.maximum(left, right)  # O(n)
+                left[...] = low  # O(n)
+                swapped = True  # O(1)
+        if not swapped:  # O(1)
+            break  # O(1)
+    return arr  # O(1)
+    # Общая временная сложность: O(n²) операций, O(n) векторных проходов
+    # Пространственная сложность: O(n)
+
+
+def selection_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Сортировка выбором: поиск минимума хвоста через numpy.argmin
+    """
+    arr = arr.copy()  # O(n)
+    n = len(arr)  # O(1)
+    for i in range(n - 1):  # O(n) итераций
+        min_idx = i + int(np.argmin(arr[i:]))  # O(n) векторно
+        arr[i], arr[min_idx] = arr[min_idx], arr[i]  # O(1)
+    return arr  # O(1)
+    # Общая временная сложность: O(n²) операций, O(n) векторных шагов
+
+
+def insertion_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Сортировка вставками: позиция вставки ищется бинарным поиском,
+    сдвиг выполняется одним присваиванием среза
+    """
+    arr = arr.copy()  # O(n)
+    for i in range(1, len(arr)):  # O(n) итераций
+        key = arr[i]  # O(1)
+        pos = int(np.searchsorted(arr[:i], key, side="right"))  # O(log n)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]  # O(n) векторно
+            arr[pos] = key  # O(1)
+    return arr  # O(1)
+    # Общая временная сложность: O(n²) перемещений, O(n log n) сравнений
+
+
+def _merge_rows(src: np.ndarray, dst: np.ndarray, width: int):
+    """
+    Слияние всех пар соседних отрезков ширины width одновременно
+
+    Массив рассматривается как матрица строк по 2*width элементов; позиция
+    элемента в результате = его индекс + число меньших элементов соседнего
+    отрезка. Длина src должна быть кратна 2*width.
+    """
+    rows = src.reshape(-1, 2 * width)  # O(1) - представление
+    out = dst.reshape(-1, 2 * width)  # O(1) - представление
+    step = max(1, _ROW_MERGE_CHUNK // (width * width))  # Строк за раз
+    offsets = np.arange(width)  # O(width)
+    for start in range(0, len(rows), step):  # O(n / (step * width)) итераций
+        block = rows[start:start + step]  # O(1)
+        left, right = block[:, :width], block[:, width:]  # O(1)
+        # Устойчивость: левые элементы идут раньше равных правых
+        left_rank = (right[:, None, :] < left[:, :, None]).sum(axis=2)
+        right_rank = (left[:, None, :] <= right[:, :, None]).sum(axis=2)
+        target = out[start:start + step]  # O(1)
+        np.put_along_axis(target, offsets + left_rank, left, axis=1)
+        np.put_along_axis(target, offsets + right_rank, right, axis=1)
+    # Общая сложность: O(n * width)
+
+
+def _merge_pair(src: np.ndarray, dst: np.ndarray, lo: int, mid: int, hi: int):
+    """Устойчивое слияние src[lo:mid] и src[mid:hi] в dst[lo:hi]"""
+    left = src[lo:mid]  # O(1)
+    right = src[mid:hi]  # O(1)
+    if len(right) == 0 or left[-1] <= right[0]:  # O(1) - уже по порядку
+        dst[lo:hi] = src[lo:hi]  # O(hi - lo)
+        return
+    out = dst[lo:hi]  # O(1)
+    out[np.arange(len(left)) + np.searchsorted(right, left, side="left")] = left
+    out[np.arange(len(right)) + np.searchsorted(left, right, side="right")] = right
+    # Общая сложность: O((hi - lo) log(hi - lo))
+
+
+def _pad_value(dtype):
+    """Значение, не меньшее любого элемента типа dtype"""
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).max
+    if np.issubdtype(dtype, np.floating):
+        return np.inf
+    return None
+
+
+def merge_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Восходящая сортировка слиянием с векторным слиянием
+
+    Узкие отрезки сливаются все одновременно построчно, широкие - попарно
+    через numpy.searchsorted. Буферы чередуются, как в списковой версии.
+    """
+    n = len(arr)  # O(1)
+    if n <= 1:
+        return arr.copy()  # O(n)
+
+    width = 1  # O(1)
+    pad = _pad_value(arr.dtype)  # O(1)
+    if pad is not None:
+        # Дополнение до кратного 2 * _ROW_MERGE_MAX_WIDTH для построчных проходов
+        block = 2 * _ROW_MERGE_MAX_WIDTH  # O(1)
+        padded = -(-n // block) * block  # O(1)
+        src = np.full(padded, pad, dtype=arr.dtype)  # O(n)
+        src[:n] = arr  # O(n)
+        dst = np.empty_like(src)  # O(n)
+        while width <= _ROW_MERGE_MAX_WIDTH and width < n:  # O(1) проходов
+            _merge_rows(src, dst, width)  # O(n * width)
+            src, dst = dst, src  # O(1)
+            width *= 2  # O(1)
+        src = src[:n]  # O(1) - дополнение в конце и больше не нужно
+        dst = dst[:n]  # O(1)
+    else:
+        src = arr.copy()  # O(n)
+        dst = np.empty_like(src)  # O(n)
+
+    while width < n:  # O(log n) проходов
+        for lo in range(0, n, 2 * width):  # O(n / width) итераций
+            _merge_pair(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        src, dst = dst, src  # O(1)
+        width *= 2  # O(1)
+    return src.copy() if src.base is not None else src  # O(n)
+    # Общая временная сложность: O(n log n)
+    # Пространственная сложность: O(n)
+
+
+def natural_merge_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Естественная сортировка слиянием: границы неубывающих серий находятся
+    одной векторной операцией, затем серии сливаются попарно
+    """
+    n = len(arr)  # O(1)
+    if n <= 1:
+        return arr.copy()  # O(n)
+
+    breaks = np.flatnonzero(arr[1:] < arr[:-1]) + 1  # O(n)
+    if len(breaks) > n // (4 * _ROW_MERGE_MAX_WIDTH):
+        # Серии короткие - построчное слияние фиксированной ширины выгоднее
+        return merge_sort(arr)
+
+    bounds = [0, *breaks.tolist(), n]  # O(r)
+    src = arr.copy()  # O(n)
+    dst = np.empty_like(src)  # O(n)
+    while len(bounds) > 2:  # O(log r) проходов
+        merged = [0]  # O(1)
+        for i in range(0, len(bounds) - 1, 2):  # O(r) итераций
+            lo = bounds[i]  # O(1)
+            if i + 2 < len(bounds):
+                _merge_pair(src, dst, lo, bounds[i + 1], bounds[i + 2])
+                hi = bounds[i + 2]  # O(1)
+            else:
+                hi = bounds[i + 1]  # O(1)
+                dst[lo:hi] = src[lo:hi]  # O(hi - lo)
+            merged.append(hi)  # O(1)
+        bounds = merged  # O(1)
+        src, dst = dst, src  # O(1)
+    return src  # O(1)
+    # Общая временная сложность: O(n log r), O(n) на отсортированных данных
+
+
+def _transposition_rounds(arr: np.ndarray, rounds: int):
+    """
+    Не более rounds чет-нечетных проходов по всему массиву
+
+    Досортировывает массив, в котором каждый элемент находится в своем
+    отрезке длины не больше rounds, а отрезки упорядочены между собой:
+    соседи из разных отрезков уже стоят по порядку и не меняются.
+    """
+    n = len(arr)  # O(1)
+    for _ in range(rounds):  # O(rounds) проходов
+        swapped = False  # O(1)
+        for start in (0, 1):
+            left = arr[start:n - 1:2]  # O(1) - представление
+            right = arr[start + 1:n:2]  # O(1) - представление
+            mask = left > right  # O(n)
+            if mask.any():  # O(n)
+                low = right[mask]  # O(n)
+                right[mask] = left[mask]  # O(n)
+                left[mask] = low  # O(n)
+                swapped = True  # O(1)
+        if not swapped:  # O(1)
+            break  # O(1)
+    # Общая сложность: O(rounds * n) операций, O(rounds) векторных проходов
+
+
+def quick_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Интроспективная быстрая сортировка с векторным трехпутевым разбиением
+
+    Разбиение отрезка выполняется масками (<, ==, > опорного) за три
+    векторных прохода. Отрезки не длиннее _QUICK_LEAF_SIZE не разбиваются,
+    а досортировываются в конце одним общим проходом чет-нечетных
+    перестановок (векторный аналог итоговой досортировки вставками);
+    отрезки, превысившие лимит глубины, сортируются слиянием merge_sort.
+    """
+    arr = arr.copy()  # O(n)
+    n = len(arr)  # O(1)
+    stack = [(0, n, 2 * max(n, 1).bit_length())]  # Явный стек отрезков
+    while stack:  # O(n / _QUICK_LEAF_SIZE) отрезков в среднем
+        lo, hi, depth_limit = stack.pop()  # O(1)
+        if hi - lo <= _QUICK_LEAF_SIZE:
+            continue  # Досортируется общим проходом
+        segment = arr[lo:hi]  # O(1) - представление
+        if depth_limit == 0:
+            segment[...] = merge_sort(segment)  # O(k log k) - гарантия в худшем
+            continue
+
+        mid = (lo + hi) // 2  # O(1)
+        pivot = sorted((arr[lo], arr[mid], arr[hi - 1]))[1]  # O(1) - медиана трех
+        less = segment[segment < pivot]  # O(k)
+        greater = segment[segment > pivot]  # O(k)
+        equal_end = hi - len(greater)  # O(1)
+        segment[:len(less)] = less  # O(k)
+        arr[lo + len(less):equal_end] = pivot  # O(k)
+        arr[equal_end:hi] = greater  # O(k)
+
+        stack.append((lo, lo + len(less), depth_limit - 1))  # O(1)
+        stack.append((equal_end, hi, depth_limit - 1))  # O(1)
+
+    _transposition_rounds(arr, _QUICK_LEAF_SIZE)  # O(n * _QUICK_LEAF_SIZE)
+    return arr  # O(1)
+    # Общая временная сложность: O(n log n) в среднем и в худшем
+
+
+def _require_integers(arr: np.ndarray):
+    """Сортировки подсчетом и поразрядная определены только для целых"""
+    if not np.issubdtype(arr.dtype, np.integer):
+        raise TypeError(f"Ожидался целочисленный массив, получен {arr.dtype}")
+
+
+def _offset_keys(arr: np.ndarray, lo: int) -> np.ndarray:
+    """
+    Неотрицательные ключи arr - lo типа uint64 с тем же порядком
+
+    Вычитание выполняется по модулю 2**64, поэтому не переполняется
+    даже для всего диапазона int64.
+    """
+    if np.issubdtype(arr.dtype, np.signedinteger):
+        keys = arr.astype(np.int64).view(np.uint64)  # O(n)
+    else:
+        keys = arr.astype(np.uint64)  # O(n)
+    return keys - np.uint64(lo % (1 << 64))  # O(n)
+
+
+def counting_sort(arr: np.ndarray) -> np.ndarray:
+    """Сортировка подсчетом: numpy.bincount и numpy.repeat"""
+    _require_integers(arr)
+    if len(arr) <= 1:
+        return arr.copy()  # O(n)
+    lo = int(arr.min())  # O(n)
+    counts = np.bincount(_offset_keys(arr, lo).astype(np.intp))  # O(n + k)
+    values = np.arange(len(counts), dtype=np.uint64) + np.uint64(lo % (1 << 64))
+    return np.repeat(values, counts).astype(arr.dtype)  # O(n + k)
+    # Общая временная сложность: O(n + k)
+
+
+def radix_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Поразрядная сортировка LSD по байтам
+
+    Каждый проход устойчиво переставляет элементы по очередному байту
+    ключа; устойчивая сортировка numpy для uint8 сама является подсчетом.
+    """
+    _require_integers(arr)
+    if len(arr) <= 1:
+        return arr.copy()  # O(n)
+    lo = int(arr.min())  # O(n)
+    keys = _offset_keys(arr, lo)  # O(n)
+    values = arr.copy()  # O(n)
+    passes = (int(keys.max()).bit_length() + 7) // 8  # O(n)
+    for shift in range(0, 8 * passes, 8):  # O(d) проходов
+        digits = ((keys >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+        order = np.argsort(digits, kind="stable")  # O(n) - подсчет по байту
+        keys = keys[order]  # O(n)
+        values = values[order]  # O(n)
+    return values  # O(1)
+    # Общая временная сложность: O(d * n), d = ceil(log256(max - min + 1))
+
+
+def bucket_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Блочная сортировка: n корзин на диапазоне [min, max]
+
+    Элементы устойчиво группируются по номеру корзины, затем корзины
+    досортировываются чет-нечетными перестановками, которые меняют только
+    соседей из одной корзины. Число проходов равно размеру наибольшей
+    корзины - на равномерных данных это O(log n / log log n).
+    """
+    n = len(arr)  # O(1)
+    if n <= 1:
+        return arr.copy()  # O(n)
+    lo, hi = float(arr.min()), float(arr.max())  # O(n)
+    if lo == hi:
+        return arr.copy()  # O(n)
+
+    scale = (n - 1) / (hi - lo)  # O(1)
+    ids = ((arr.astype(np.float64) - lo) * scale).astype(np.intp)  # O(n)
+    np.clip(ids, 0, n - 1, out=ids)  # O(n) - защита от ошибок округления
+    order = np.argsort(ids, kind="stable")  # Распределение по корзинам
+    values = arr[order]  # O(n)
+    ids = ids[order]  # O(n)
+    same_bucket = ids[1:] == ids[:-1]  # O(n) - пары соседей из одной корзины
+
+    swapped = True  # O(1)
+    while swapped:  # O(размер наибольшей корзины) проходов
+        swapped = False  # O(1)
+        for start in (0, 1):
+            left = values[start:n - 1:2]  # O(1) - представление
+            right = values[start + 1:n:2]  # O(1) - представление
+            mask = (left > right) & same_bucket[start::2]  # O(n)
+            if mask.any():  # O(n)
+                low = right[mask]  # O(n)
+                right[mask] = left[mask]  # O(n)
+                left[mask] = low  # O(n)
+                swapped = True  # O(1)
+    return values  # O(1)
+    # Общая временная сложность: O(n) векторных операций в среднем,
+    # O(n²) в худшем (все элементы в одной корзине)
+
+
+# Реализации для numpy.ndarray по именам из sorts.SORTING_ALGORITHMS
+NUMPY_SORTING_ALGORITHMS = {
+    "bubble_sort": bubble_sort,
+    "selection_sort": selection_sort,
+    "insertion_sort": insertion_sort,
+    "merge_sort": merge_sort,
+    "natural_merge_sort": natural_merge_sort,
+    "quick_sort": quick_sort,
+    "counting_sort": counting_sort,
+    "radix_sort": radix_sort,
+    "bucket_sort": bucket_sort,
+}
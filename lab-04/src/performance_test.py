@@ -1,6 +1,11 @@
+import math
 import timeit
+from array import array
+from instrumentation import count_operations
 from sorts import (bubble_sort, selection_sort, insertion_sort, merge_sort,
-                   quick_sort)
+                   natural_merge_sort, quick_sort, counting_sort, radix_sort,
+                   bucket_sort, integer_sort, parallel_merge_sort,
+                   adaptive_sort, np)
 from generate_data import (
     generate_random_array,
     generate_sorted_array,
@@ -14,7 +19,13 @@ algorithms = {
     "selection": selection_sort,
     "insertion": insertion_sort,
     "merge": merge_sort,
+    "natural_merge": natural_merge_sort,
     "quick": quick_sort,
+    "counting": counting_sort,
+    "radix": radix_sort,
+    "bucket": bucket_sort,
+    "integer": integer_sort,
+    "adaptive": adaptive_sort,
 }
 
 
@@ -25,6 +36,148 @@ def test_one_algorithm(algo_name, algo_func, arr):
     return time_taken
 
 
+# Квадратичные алгоритмы: в compare_backends они пропускаются для размеров
+# больше quadratic_limit
+QUADRATIC_ALGORITHMS = ("bubble", "selection", "insertion")
+
+
+def make_backends(data):
+    """
+    Одни и те же данные в разных представлениях: list, array.array
+    и numpy.ndarray (если NumPy установлен)
+    """
+    backends = {"list": list(data), "array": array("q", data)}
+    if np is not None:
+        backends["numpy"] = np.array(data, dtype=np.int64)
+    return backends
+
+
+def compare_backends(sizes=(1000, 10000), quadratic_limit=2000):
+    """
+    Сравнение списковых и векторных реализаций на одинаковых данных
+
+    Для каждого размера наборы данных генерируются один раз и передаются
+    каждому алгоритму во всех представлениях из make_backends().
+
+    Returns:
+        dict: {алгоритм: {размер: {тип данных: {представление: время}}}}
+    """
+    results = {}
+    for size in sizes:
+        datasets = {
+            "random": generate_random_array(size),
+            "sorted": generate_sorted_array(size),
+            "reversed": generate_reversed_array(size),
+            "almost": generate_almost_sorted_array(size),
+        }
+        for algo_name, algo_func in algorithms.items():
+            if algo_name in QUADRATIC_ALGORITHMS and size > quadratic_limit:
+                continue
+            print(f"Сравниваем представления: {algo_name}, size {size}...")
+            by_type = results.setdefault(algo_name, {}).setdefault(size, {})
+            for data_type, data in datasets.items():
+                by_type[data_type] = {
+                    # Алгоритмы не меняют вход, поэтому копия не нужна
+                    backend: timeit.Timer(lambda: algo_func(arr)).timeit(number=1)
+                    for backend, arr in make_backends(data).items()
+                }
+    return results
+
+
+def print_backend_results(results, data_type="random"):
+    """Печатает сравнение представлений и ускорение относительно list"""
+    backends = ["list", "array"] + (["numpy"] if np is not None else [])
+    print(f"\nСРАВНЕНИЕ ПРЕДСТАВЛЕНИЙ ({data_type}):")
+    header = " | ".join(f"{name:<10}" for name in backends)
+    print(f"{'Algorithm':<14} | {'Size':<6} | {header} | {'Speedup':<8}")
+    print("-" * (40 + 13 * len(backends)))
+
+    for algo_name, by_size in results.items():
+        for size, by_type in by_size.items():
+            times = by_type[data_type]
+            columns = " | ".join(f"{times[name]:8.4f}s" for name in backends)
+            fastest = min(times[name] for name in backends)
+            speedup = times["list"] / fastest if fastest > 0 else 0
+            print(f"{algo_name:<14} | {size:<6} | {columns} | {speedup:7.1f}x")
+
+
+def measure_parallel_scaling(size=1_000_000, workers_list=(1, 2, 4, 8)):
+    """
+    Масштабирование parallel_merge_sort по числу процессов
+
+    Returns:
+        dict: {число процессов: (время, ускорение относительно 1 процесса)}
+    """
+    data = generate_random_array(size)
+    results = {}
+    for workers in workers_list:
+        time_taken = timeit.Timer(
+            lambda: parallel_merge_sort(data, workers=workers)
+        ).timeit(number=1)
+        base = results[workers_list[0]][0] if results else time_taken
+        results[workers] = (time_taken, base / time_taken)
+        print(f"  workers {workers}: {time_taken:.3f}s, ускорение {base / time_taken:.2f}x")
+    return results
+
+
+def run_operation_counts(sizes=(100, 500, 1000), data_types=None):
+    """
+    Подсчет сравнений, перемещений и выделений памяти вместе со временем
+
+    Время замеряется на обычных данных, счетчики - отдельным
+    инструментированным запуском на тех же данных.
+
+    Returns:
+        dict: {алгоритм: {размер: {тип данных: {"time", "comparisons",
+            "moves", "allocations", "peak_bytes"}}}}
+    """
+    generators = {
+        "random": generate_random_array,
+        "sorted": generate_sorted_array,
+        "reversed": generate_reversed_array,
+        "almost": generate_almost_sorted_array,
+    }
+    data_types = data_types or list(generators)
+    datasets = {
+        (data_type, size): generators[data_type](size)
+        for data_type in data_types
+        for size in sizes
+    }
+
+    results = {}
+    for algo_name, algo_func in algorithms.items():
+        for (data_type, size), data in datasets.items():
+            counts = count_operations(algo_func, data)
+            cell = counts._asdict()
+            cell["time"] = test_one_algorithm(algo_name, algo_func, data)
+            results.setdefault(algo_name, {}).setdefault(size, {})[data_type] = cell
+    return results
+
+
+def print_operation_counts(results, data_type="random"):
+    """
+    Печатает счетчики операций и их отношение к n² и n·log2(n) -
+    для проверки оценок сложности в комментариях sorts.py
+    """
+    print(f"\nСЧЕТЧИКИ ОПЕРАЦИЙ ({data_type}):")
+    print(
+        f"{'Algorithm':<14} | {'Size':<6} | {'Time':<10} | {'Compares':<10} | "
+        f"{'Moves':<10} | {'Allocs':<6} | {'Peak KB':<8} | {'C/n²':<7} | {'C/nlogn':<7}"
+    )
+    print("-" * 105)
+    for algo_name, by_size in results.items():
+        for size, by_type in sorted(by_size.items()):
+            cell = by_type[data_type]
+            n_log_n = size * math.log2(size) if size > 1 else 1
+            print(
+                f"{algo_name:<14} | {size:<6} | {cell['time']:8.4f}s | "
+                f"{cell['comparisons']:<10} | {cell['moves']:<10} | "
+                f"{cell['allocations']:<6} | {cell['peak_bytes'] / 1024:<8.1f} | "
+                f"{cell['comparisons'] / size ** 2:<7.3f} | "
+                f"{cell['comparisons'] / n_log_n:<7.3f}"
+            )
+
+
 def run_all_tests():
     """Запускает все тесты"""
     sizes = [100, 500, 1000, 2000]
@@ -89,7 +242,13 @@ def analyze_theoretical_vs_practical(results: dict):
         "selection": {"best": "O(n²)", "avg": "O(n²)", "worst": "O(n²)"},
         "insertion": {"best": "O(n)", "avg": "O(n²)", "worst": "O(n²)"},
         "merge": {"best": "O(n log n)", "avg": "O(n log n)", "worst": "O(n log n)"},
-        "quick": {"best": "O(n log n)", "avg": "O(n log n)", "worst": "O(n²)"},
+        "natural_merge": {"best": "O(n)", "avg": "O(n log n)", "worst": "O(n log n)"},
+        "quick": {"best": "O(n)", "avg": "O(n log n)", "worst": "O(n log n)"},
+        "counting": {"best": "O(n + k)", "avg": "O(n + k)", "worst": "O(n + k)"},
+        "radix": {"best": "O(d·n)", "avg": "O(d·n)", "worst": "O(d·n)"},
+        "bucket": {"best": "O(n)", "avg": "O(n)", "worst": "O(n²)"},
+        "integer": {"best": "O(n + k)", "avg": "O(d·n)", "worst": "O(n log n)"},
+        "adaptive": {"best": "O(n)", "avg": "O(n log n)", "worst": "O(n log n)"},
     }
 
     for algo_name in results.keys():
@@ -1,8 +1,38 @@
+import csv
+import json
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import Dict
 
 
+def load_grid_results(path: str) -> Dict:
+    """
+    Загрузка результатов benchmark_grid (CSV или JSON) в формат
+    {алгоритм: {размер: {тип данных: медиана времени}}}
+
+    Ячейки с тайм-аутом и пропущенные ячейки получают NaN - на графиках
+    они не отображаются, в сводной таблице не участвуют.
+    """
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as file:
+            rows = json.load(file)["results"]
+    else:
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+
+    sizes = sorted({int(row["size"]) for row in rows})
+    data_types = {"random", "sorted", "reversed", "almost"}
+    data_types |= {row["distribution"] for row in rows}
+    results = {}
+    for row in rows:
+        algo_data = results.setdefault(row["algorithm"], {
+            size: dict.fromkeys(data_types, float("nan")) for size in sizes
+        })
+        if row["status"] == "ok":
+            algo_data[int(row["size"])][row["distribution"]] = float(row["median"])
+    return results
+
+
 def plot_time_vs_size(results: Dict, data_type: str = "random"):
     """
     График зависимости времени от размера массива для одного типа данных
@@ -43,7 +73,7 @@ def plot_time_vs_datatype(results: Dict, size: int = 1000):
 
     data_types = ["random", "sorted", "reversed", "almost"]
     x_pos = np.arange(len(data_types))
-    width = 0.15
+    width = 0.8 / len(results)  # Все столбцы группы занимают 0.8 деления
 
     for i, (algo_name, algo_data) in enumerate(results.items()):
         times = []
@@ -58,7 +88,7 @@ def plot_time_vs_datatype(results: Dict, size: int = 1000):
     plt.xlabel("Тип данных")
     plt.ylabel("Время (секунды)")
     plt.title(f"Время сортировки для разных типов данных (размер {size})")
-    plt.xticks(x_pos + width * 2, data_types)
+    plt.xticks(x_pos + width * (len(results) - 1) / 2, data_types)
     plt.legend()
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
@@ -75,7 +105,7 @@ def create_summary_table(results: Dict):
     print("=" * 90)
 
     data_types = ["random", "sorted", "reversed", "almost"]
-    sizes = [100, 500, 1000, 2000]
+    sizes = sorted({size for algo_data in results.values() for size in algo_data})
 
     best_per_type = {}
 
@@ -98,9 +128,7 @@ def create_summary_table(results: Dict):
             else:
                 best_per_type[data_type][size] = ("N/A", float("inf"))
 
-    print(
-        f"{'Тип данных':<14} | {'100':<20} | {'500':<20} | {'1000':<20} | {'2000':<20}"
-    )
+    print(f"{'Тип данных':<14} | " + " | ".join(f"{size:<20}" for size in sizes))
     print("-" * 90)
 
     for data_type in data_types:
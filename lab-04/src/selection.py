@@ -0,0 +1,218 @@
+"""
+Частичная сортировка и выбор порядковой статистики без полной сортировки
+
+- nth_element / select - k-я порядковая статистика (introselect): быстрый
+  выбор с опорным элементом из sorts.py, а при вырождении разбиений -
+  медиана медиан, поэтому O(n) и в худшем случае;
+- partial_sort - k наименьших элементов по возрастанию за O(n + k log k);
+- top_k - k наименьших (наибольших) элементов потока за O(n log k)
+  с памятью O(k): поток не материализуется.
+"""
+
+import heapq
+from array import array
+from typing import Callable, Iterable, List
+
+from sorts import (
+    INSERTION_THRESHOLD,
+    choose_pivot,
+    insertion_sort_range,
+    partition_three_way,
+    quick_sort_range,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не установлен - доступны списки и array.array
+    np = None
+
+# Размер группы в медиане медиан
+_MEDIAN_GROUP_SIZE = 5
+
+
+def _working_copy(arr, inplace: bool):
+    """Изменяемая последовательность для перестановок: arr или его копия"""
+    if inplace:
+        return arr
+    if isinstance(arr, (list, array)):
+        return arr[:]  # O(n) - тот же тип и typecode
+    if np is not None and isinstance(arr, np.ndarray):
+        return arr.copy()  # O(n)
+    return list(arr)  # O(n)
+
+
+def _check_index(k: int, n: int) -> int:
+    """Индекс порядковой статистики; отрицательный считается с конца"""
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError(f"Индекс {k} вне диапазона для {n} элементов")
+    return k
+
+
+def _introselect(arr, lo: int, hi: int, k: int):
+    """
+    Перестановка arr[lo..hi] так, что arr[k] стоит на своем месте
+    в отсортированном порядке, слева не больше, справа не меньше
+    """
+    depth_limit = 2 * (hi - lo + 1).bit_length()  # O(1)
+    while hi - lo + 1 > INSERTION_THRESHOLD:  # O(log n) итераций в среднем
+        if depth_limit > 0:
+            depth_limit -= 1  # O(1)
+            pivot = choose_pivot(arr, lo, hi)  # O(1)
+        else:  # Разбиения вырождаются - опорный с гарантией
+            pivot = _median_of_medians(arr, lo, hi)  # O(hi - lo)
+        lt, gt = partition_three_way(arr, lo, hi, pivot)  # O(hi - lo)
+
+        # Продолжаем только в части, содержащей k
+        if k < lt:
+            hi = lt - 1  # O(1)
+        elif k > gt:
+            lo = gt + 1  # O(1)
+        else:
+            return  # arr[k] == pivot - на своем месте
+
+    insertion_sort_range(arr, lo, hi)  # O(1) - отрезок не длиннее порога
+    # Общая сложность: O(n) в среднем и в худшем
+
+
+def _median_of_medians(arr, lo: int, hi: int):
+    """Медиана медиан групп по пять: не меньше 30% и не больше 70% отрезка"""
+    medians = []
+    for start in range(lo, hi + 1, _MEDIAN_GROUP_SIZE):  # O(n / 5) групп
+        group = list(arr[start:min(start + _MEDIAN_GROUP_SIZE, hi + 1)])  # O(1)
+        insertion_sort_range(group, 0, len(group) - 1)  # O(1)
+        medians.append(group[(len(group) - 1) // 2])  # O(1)
+    middle = (len(medians) - 1) // 2  # O(1)
+    _introselect(medians, 0, len(medians) - 1, middle)  # O(n / 5)
+    return medians[middle]  # O(1)
+    # Общая сложность: O(n)
+
+
+def nth_element(arr, k: int, *, inplace: bool = False):
+    """
+    Частичное упорядочивание по k-й порядковой статистике (introselect)
+
+    После вызова result[k] - элемент, стоящий на позиции k в
+    отсортированном массиве; result[:k] не больше его, result[k+1:] -
+    не меньше. Порядок внутри частей не определен.
+
+    Args:
+        arr: list, array.array или numpy.ndarray
+        k (int): Индекс (отрицательный - с конца)
+        inplace (bool): Переставлять элементы arr вместо копии
+
+    Returns:
+        Переставленный массив (для inplace - сам arr)
+
+    Time Complexity: O(n) в среднем и в худшем
+    Space Complexity: O(1) для inplace, иначе O(n) на копию
+    """
+    k = _check_index(k, len(arr))
+    if np is not None and isinstance(arr, np.ndarray):
+        if inplace:
+            arr.partition(k)  # O(n)
+            return arr
+        return np.partition(arr, k)  # O(n)
+
+    result = _working_copy(arr, inplace)  # O(n) или O(1)
+    _introselect(result, 0, len(result) - 1, k)  # O(n)
+    return result  # O(1)
+
+
+def select(values, k: int):
+    """
+    k-я порядковая статистика (k-й наименьший элемент, с нуля) без
+    изменения values; медиана - select(values, (len(values) - 1) // 2)
+
+    Time Complexity: O(n)
+    """
+    return nth_element(values, k)[_check_index(k, len(values))]  # O(n)
+
+
+def partial_sort(arr, k: int, *, inplace: bool = False):
+    """
+    Частичная сортировка: result[:k] - k наименьших элементов по
+    возрастанию, остальные элементы - в неопределенном порядке
+
+    Args:
+        arr: list, array.array или numpy.ndarray
+        k (int): Сколько наименьших элементов упорядочить (ограничивается len(arr))
+        inplace (bool): Переставлять элементы arr вместо копии
+
+    Returns:
+        Переставленный массив (для inplace - сам arr)
+
+    Time Complexity: O(n + k log k)
+    Space Complexity: O(log k) - стек сортировки, плюс O(n) на копию
+    """
+    n = len(arr)  # O(1)
+    if k < 0:
+        raise ValueError("k должен быть неотрицательным")
+    k = min(k, n)  # O(1)
+    result = _working_copy(arr, inplace)  # O(n) или O(1)
+    if k == 0:
+        return result
+
+    if k < n:
+        result = nth_element(result, k - 1, inplace=True)  # O(n)
+    if np is not None and isinstance(result, np.ndarray):
+        result[:k].sort()  # O(k log k) - срез является представлением
+    else:
+        quick_sort_range(result, 0, k - 1)  # O(k log k)
+    return result  # O(1)
+
+
+class _Reversed(tuple):
+    """Запись кучи с обратным порядком: min-куча heapq из них - max-куча"""
+
+    __slots__ = ()
+
+    def __lt__(self, other):
+        return tuple.__lt__(other, self)
+
+
+def top_k(items: Iterable, k: int, *, key: Callable = None,
+          largest: bool = False) -> List:
+    """
+    k наименьших (или наибольших) элементов потока с ограниченной памятью
+
+    Поддерживается куча heapq из k лучших элементов: корень - худший из них,
+    новый элемент сравнивается с корнем и либо отбрасывается, либо
+    заменяет его. Элементы с равными ключами берутся в порядке появления.
+
+    Args:
+        items: Любой итерируемый объект, в том числе генератор
+        k (int): Количество элементов
+        key (callable): Функция ключа (вычисляется один раз на элемент)
+        largest (bool): Искать наибольшие вместо наименьших
+
+    Returns:
+        list: Не более k элементов, по возрастанию (по убыванию для largest)
+
+    Time Complexity: O(n log k)
+    Space Complexity: O(k)
+    """
+    if k < 0:
+        raise ValueError("k должен быть неотрицательным")
+    if k == 0:
+        return []
+
+    # Записи (ключ, номер, элемент): номера различны, поэтому сами элементы
+    # не сравниваются. Для наибольших худший - меньший ключ и более поздний
+    # номер, для наименьших - больший ключ и более поздний номер
+    heap = []
+    for order, item in enumerate(items):  # O(n) итераций
+        item_key = item if key is None else key(item)  # O(1)
+        if largest:
+            entry = (item_key, -order, item)  # O(1)
+        else:
+            entry = _Reversed((item_key, order, item))  # O(1)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)  # O(log k)
+        elif heap[0] < entry:  # Новый элемент лучше худшего из k
+            heapq.heapreplace(heap, entry)  # O(log k)
+
+    heap.sort(reverse=True)  # O(k log k) - от лучшего к худшему
+    return [entry[2] for entry in heap]  # O(k)
+    # Общая сложность: O(n log k)
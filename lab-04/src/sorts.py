@@ -1,11 +1,137 @@
+import heapq
+import os
+import random
+import time
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import wraps
+from itertools import chain
+from multiprocessing import shared_memory
 from typing import List, Callable
 
+try:
+    import numpy as np
+    from numpy_sorts import NUMPY_SORTING_ALGORITHMS
+except ImportError:  # NumPy не установлен - доступны списки и array.array
+    np = None
+    NUMPY_SORTING_ALGORITHMS = {}
 
+
+def _sort_interface(stable: bool, in_place: bool = False, by_keys: bool = False):
+    """
+    Общий интерфейс алгоритмов сортировки:
+
+        sort(arr, *, key=None, reverse=False, inplace=False, **options)
+
+    - arr: list, array.array или numpy.ndarray; для ndarray без key
+      вызывается векторная реализация из numpy_sorts, для array.array
+      и для ndarray с key - списковая, результат того же типа и typecode/dtype;
+    - key: ключи вычисляются один раз на элемент (decorate-sort-undecorate);
+      элементы сортируются как пары (ключ, индекс), поэтому сортировка
+      по key устойчива для любого алгоритма;
+    - reverse: вход разворачивается, сортируется и разворачивается обратно -
+      для устойчивого алгоритма равные элементы сохраняют исходный порядок;
+    - inplace: результат записывается в arr и arr же возвращается; для
+      алгоритмов, переставляющих элементы на месте, копия не создается.
+
+    Args:
+        stable (bool): Алгоритм устойчив на элементах без key
+        in_place (bool): Функция переставляет элементы переданного списка
+            (защитную копию делает обертка)
+        by_keys (bool): Распределяющий алгоритм, принимающий список целых
+            или вещественных ключей keys= вместо сравнения элементов
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.in_place = in_place
+        func.by_keys = by_keys
+
+        @wraps(func)
+        def wrapper(arr, *, key=None, reverse=False, inplace=False, **options):
+            if np is not None and isinstance(arr, np.ndarray):
+                if key is None:
+                    impl = NUMPY_SORTING_ALGORITHMS.get(func.__name__, func)
+                    result = impl(arr[::-1] if reverse else arr, **options)
+                    result = result[::-1].copy() if reverse else result  # O(n)
+                else:
+                    values = _sort_list(func, arr.tolist(), key, reverse, True, options)
+                    result = np.array(values, dtype=arr.dtype)  # O(n)
+            elif isinstance(arr, array):
+                values = _sort_list(func, arr.tolist(), key, reverse, True, options)
+                result = array(arr.typecode, values)  # O(n)
+            else:
+                return _sort_list(func, arr, key, reverse, inplace, options)
+
+            if inplace:
+                arr[:] = result  # O(n)
+                return arr
+            return result
+
+        wrapper.stable = stable
+        return wrapper
+
+    return decorator
+
+
+def _sort_list(func: Callable, items: list, key, reverse: bool, inplace: bool,
+               options: dict) -> list:
+    """Сортировка списка алгоритмом func с учетом key, reverse и inplace"""
+    data = items[::-1] if reverse else items  # O(n) - копия только при reverse
+    if key is not None:
+        keys = [key(item) for item in data]  # O(n) - каждый ключ один раз
+        result = _sort_by_keys(func, data, keys, options)
+    else:
+        if func.in_place and not (inplace or reverse):
+            data = data.copy()  # O(n) - защитная копия
+        result = func(data, **options)
+
+    if reverse:
+        result.reverse()  # O(n)
+    if inplace and result is not items:
+        items[:] = result  # O(n)
+        return items
+    return result
+
+
+def _sort_by_keys(func: Callable, items: list, keys: list, options: dict) -> list:
+    """
+    Перестановка items в порядке keys (устойчиво)
+
+    Распределяющие алгоритмы получают ключи напрямую; сравнивающие
+    сортируют пары (ключ, индекс) и по индексам восстанавливают элементы.
+    """
+    if func.by_keys:
+        return func(items, keys=keys, **options)
+    decorated = [(k, i) for i, k in enumerate(keys)]  # O(n)
+    return [items[i] for _, i in func(decorated, **options)]  # O(n)
+
+
+def _empty_like(arr: list, n: int, fill=None) -> list:
+    """
+    Буфер из n ячеек со значением fill для результата, слияния, счетчиков
+    или корзины (n = 0)
+
+    Инструментированные списки (instrumentation.CountingList) создают буфер
+    своего типа, чтобы запись в него тоже учитывалась.
+    """
+    empty_like = getattr(arr, "empty_like", None)  # O(1)
+    return [fill] * n if empty_like is None else empty_like(n, fill)  # O(n)
+
+
+def _buffer_from(arr: list, items) -> list:
+    """Новый буфер (см. _empty_like) с элементами items"""
+    buffer = _empty_like(arr, 0)  # O(1)
+    buffer.extend(items)  # O(len(items))
+    return buffer  # O(1)
+
+
+@_sort_interface(stable=True, in_place=True)
 def bubble_sort(arr: List[int]) -> List[int]:
     """
     Сортировка пузырьком
     """
-    arr = arr.copy()  # O(n)
     n = len(arr)  # O(1)
 
     for i in range(n):  # O(n)
@@ -22,11 +148,11 @@ def bubble_sort(arr: List[int]) -> List[int]:
     # Глубина: O(1) - не рекурсивная
 
 
+@_sort_interface(stable=False, in_place=True)
 def selection_sort(arr: List[int]) -> List[int]:
     """
     Сортировка выбором
     """
-    arr = arr.copy()  # O(n)
     n = len(arr)  # O(1)
 
     for i in range(n):  # O(n)
@@ -41,12 +167,11 @@ def selection_sort(arr: List[int]) -> List[int]:
     # Глубина: O(1) - не рекурсивная
 
 
+@_sort_interface(stable=True, in_place=True)
 def insertion_sort(arr: List[int]) -> List[int]:
     """
     Сортировка вставками
     """
-    arr = arr.copy()  # O(n)
-
     for i in range(1, len(arr)):  # O(n) итераций
         key = arr[i]  # O(1)
         j = i - 1  # O(1)
@@ -60,78 +185,802 @@ def insertion_sort(arr: List[int]) -> List[int]:
     # Глубина: O(1) - не рекурсивная
 
 
+@_sort_interface(stable=True)
 def merge_sort(arr: List[int]) -> List[int]:
     """
-    Сортировка слиянием
+    Сортировка слиянием (восходящая, bottom-up)
+
+    Вместо рекурсивного деления со срезами сливаются соседние отрезки
+    ширины 1, 2, 4, ... Один буфер размера n выделяется заранее, и проходы
+    поочередно переливают данные между ним и рабочим массивом.
     """
-    if len(arr) <= 1:  # O(1)
-        return arr.copy()  # O(n)
+    src = arr.copy()  # O(n)
+    n = len(src)  # O(1)
+    if n <= 1:  # O(1)
+        return src  # O(1)
+
+    dst = _empty_like(src, n)  # O(n) - единственный дополнительный буфер
+    width = 1  # O(1)
+    while width < n:  # O(log n) проходов
+        for lo in range(0, n, 2 * width):  # O(n) элементов за проход
+            mid = min(lo + width, n)  # O(1)
+            hi = min(lo + 2 * width, n)  # O(1)
+            _merge_into(src, dst, lo, mid, hi)  # O(hi - lo)
+        src, dst = dst, src  # O(1) - смена ролей буферов
+        width *= 2  # O(1)
+    return src  # O(1)
+    # Общая временная сложность: O(n log n)
+    # Пространственная сложность: O(n) - один буфер на всю сортировку
+    # Глубина: O(1) - не рекурсивная
 
-    mid = len(arr) // 2  # O(1)
-    left = merge_sort(arr[:mid])  # O(n log n) - рекурсивный вызов
-    right = merge_sort(arr[mid:])  # O(n log n) - рекурсивный вызов
 
-    return _merge(left, right)  # O(n)
+@_sort_interface(stable=True)
+def natural_merge_sort(arr: List[int]) -> List[int]:
+    """
+    Естественная сортировка слиянием (как в Timsort)
 
+    Сливаются не отрезки фиксированной ширины, а уже упорядоченные серии
+    входных данных; строго убывающие серии разворачиваются. Отсортированный
+    массив - одна серия, почти отсортированный - мало серий.
+    """
+    src = arr.copy()  # O(n)
+    n = len(src)  # O(1)
+    if n <= 1:  # O(1)
+        return src  # O(1)
+
+    bounds = _find_runs(src)  # O(n) - границы серий [0, ..., n]
+    dst = _empty_like(src, n)  # O(n) - единственный дополнительный буфер
+    while len(bounds) > 2:  # O(log r) проходов, r - число серий
+        merged = [0]  # O(1)
+        for i in range(0, len(bounds) - 1, 2):  # O(n) элементов за проход
+            lo = bounds[i]  # O(1)
+            if i + 2 < len(bounds):
+                mid, hi = bounds[i + 1], bounds[i + 2]  # O(1)
+                _merge_into(src, dst, lo, mid, hi)  # O(hi - lo)
+            else:
+                hi = bounds[i + 1]  # O(1) - серия без пары
+                dst[lo:hi] = src[lo:hi]  # O(hi - lo)
+            merged.append(hi)  # O(1)
+        bounds = merged  # O(1)
+        src, dst = dst, src  # O(1) - смена ролей буферов
+    return src  # O(1)
+    # Общая временная сложность: O(n log r), O(n) на отсортированных данных
+    # Пространственная сложность: O(n)
+    # Глубина: O(1) - не рекурсивная
 
-def _merge(left: List[int], right: List[int]) -> List[int]:
-    """Вспомогательная функция для слияния двух отсортированных массивов"""
-    result = []  # O(1)
-    i = j = 0  # O(1)
 
-    while i < len(left) and j < len(right):  # O(n) итераций
-        if left[i] <= right[j]:  # O(1)
-            result.append(left[i])  # O(1)
-            i += 1  # O(1)
-        else:
-            result.append(right[j])  # O(1)
+def _find_runs(arr: List[int]) -> List[int]:
+    """
+    Поиск упорядоченных серий; строго убывающие серии разворачиваются
+    на месте (строгость сохраняет устойчивость)
+
+    Возвращает границы серий: [0, конец первой, ..., n]
+    """
+    n = len(arr)  # O(1)
+    bounds = [0]  # O(1)
+    start = 0  # O(1)
+    while start < n:  # O(n) итераций суммарно
+        end = start + 1  # O(1)
+        if end < n and arr[end] < arr[start]:  # Строго убывающая серия
+            while end < n and arr[end] < arr[end - 1]:  # O(длина серии)
+                end += 1  # O(1)
+            arr[start:end] = arr[start:end][::-1]  # O(длина серии)
+        else:  # Неубывающая серия
+            while end < n and arr[end] >= arr[end - 1]:  # O(длина серии)
+                end += 1  # O(1)
+        bounds.append(end)  # O(1)
+        start = end  # O(1)
+    return bounds  # O(1)
+    # Общая сложность: O(n)
+
+
+def _merge_into(src: List[int], dst: List[int], lo: int, mid: int, hi: int):
+    """
+    Слияние отсортированных отрезков src[lo:mid] и src[mid:hi] в dst[lo:hi]
+    """
+    if mid >= hi or src[mid - 1] <= src[mid]:  # O(1) - отрезки уже по порядку
+        dst[lo:hi] = src[lo:hi]  # O(hi - lo)
+        return
+
+    i, j, k = lo, mid, lo  # O(1)
+    left, right = src[i], src[j]  # O(1) - текущие головы отрезков
+    while True:  # O(hi - lo) итераций
+        if right < left:  # O(1) - при равенстве берем левый (устойчивость)
+            dst[k] = right  # O(1)
+            k += 1  # O(1)
             j += 1  # O(1)
+            if j == hi:
+                break
+            right = src[j]  # O(1)
+        else:
+            dst[k] = left  # O(1)
+            k += 1  # O(1)
+            i += 1  # O(1)
+            if i == mid:
+                break
+            left = src[i]  # O(1)
 
-    result.extend(left[i:])  # O(n)
-    result.extend(right[j:])  # O(n)
-    return result  # O(1)
-    # Общая временная сложность merge_sort: O(n log n)
-    # Пространственная сложность: O(n)
-    # Глубина рекурсии: O(log n)
+    if i < mid:
+        dst[k:hi] = src[i:mid]  # O(mid - i)
+    else:
+        dst[k:hi] = src[j:hi]  # O(hi - j)
+    # Общая сложность: O(hi - lo)
+
+
+# Отрезки не длиннее порога досортировываются вставками
+INSERTION_THRESHOLD = 16
+# Для отрезков длиннее порога опорный элемент выбирается как ninther
+_NINTHER_THRESHOLD = 40
 
 
+@_sort_interface(stable=False, in_place=True)
 def quick_sort(arr: List[int]) -> List[int]:
     """
-    Быстрая сортировка
+    Быстрая сортировка (интроспективная, на месте)
+
+    Трехпутевое разбиение на месте (<, ==, > опорного), опорный элемент -
+    медиана трех или ninther, короткие отрезки досортировываются вставками.
+    При превышении глубины 2*log2(n) отрезок сортируется кучей (introsort),
+    поэтому худший случай - O(n log n).
     """
-    if len(arr) <= 1:  # O(1)
-        return arr.copy()  # O(n)
+    quick_sort_range(arr, 0, len(arr) - 1)  # O(n log n)
+    return arr  # O(1)
+    # Общая временная сложность: O(n log n) в среднем и в худшем,
+    # O(n) при малом числе различных значений
+    # Пространственная сложность: O(log n) - стек рекурсии
+    # Глубина рекурсии: O(log n) - рекурсия только по меньшей части
+
 
-    pivot = _median_of_three(arr)  # O(1)
+def quick_sort_range(arr: List[int], lo: int, hi: int):
+    """
+    Интроспективная сортировка отрезка arr[lo..hi] (включительно) на месте
+    с лимитом глубины 2*log2(длины отрезка)
+    """
+    if hi > lo:
+        _introsort(arr, lo, hi, 2 * (hi - lo + 1).bit_length())  # O(k log k)
+
+
+def _introsort(arr: List[int], lo: int, hi: int, depth_limit: int):
+    """Интроспективная сортировка отрезка arr[lo..hi] (включительно)"""
+    while hi - lo + 1 > INSERTION_THRESHOLD:  # O(log n) итераций в среднем
+        if depth_limit == 0:  # O(1) - разбиения вырождаются
+            _heap_sort_range(arr, lo, hi)  # O(k log k)
+            return
+        depth_limit -= 1  # O(1)
+
+        pivot = choose_pivot(arr, lo, hi)  # O(1)
+        lt, gt = partition_three_way(arr, lo, hi, pivot)  # O(hi - lo)
+
+        # Рекурсия по меньшей части, цикл по большей - стек O(log n)
+        if lt - lo < hi - gt:
+            _introsort(arr, lo, lt - 1, depth_limit)
+            lo = gt + 1  # O(1)
+        else:
+            _introsort(arr, gt + 1, hi, depth_limit)
+            hi = lt - 1  # O(1)
+
+    insertion_sort_range(arr, lo, hi)  # O(1) - отрезок не длиннее порога
 
-    left = [x for x in arr if x < pivot]  # O(n)
-    middle = [x for x in arr if x == pivot]  # O(n)
-    right = [x for x in arr if x > pivot]  # O(n)
 
-    return quick_sort(left) + middle + quick_sort(right)
-    # O(n log n) в среднем, O(n²) в худшем
+def choose_pivot(arr: List[int], lo: int, hi: int) -> int:
+    """Опорный элемент: медиана трех или ninther (медиана трех медиан)"""
+    mid = (lo + hi) // 2  # O(1)
+    if hi - lo + 1 <= _NINTHER_THRESHOLD:
+        return _median_of_three(arr[lo], arr[mid], arr[hi])  # O(1)
 
+    step = (hi - lo + 1) // 8  # O(1)
+    return _median_of_three(  # O(1)
+        _median_of_three(arr[lo], arr[lo + step], arr[lo + 2 * step]),
+        _median_of_three(arr[mid - step], arr[mid], arr[mid + step]),
+        _median_of_three(arr[hi - 2 * step], arr[hi - step], arr[hi]),
+    )
 
-def _median_of_three(arr: List[int]) -> int:
-    """Выбор медианы из первого, среднего и последнего элементов"""
-    first = arr[0]  # O(1)
-    middle = arr[len(arr) // 2]  # O(1)
-    last = arr[-1]  # O(1)
 
+def _median_of_three(first: int, middle: int, last: int) -> int:
+    """Медиана трех значений"""
     if first <= middle <= last or last <= middle <= first:  # O(1)
         return middle  # O(1)
     elif middle <= first <= last or last <= first <= middle:  # O(1)
         return first  # O(1)
     else:
         return last  # O(1)
-    # Общая временная сложность quick_sort: O(n log n) в среднем,
-    # O(n²) в худшем
-    # Пространственная сложность: O(n) в худшем, O(log n) в среднем
-    # Глубина рекурсии: O(n) в худшем, O(log n) в среднем
+
+
+def partition_three_way(arr: List[int], lo: int, hi: int, pivot: int):
+    """
+    Трехпутевое разбиение Дейкстры отрезка arr[lo..hi]
+
+    Возвращает (lt, gt): arr[lo:lt] < pivot, arr[lt:gt+1] == pivot,
+    arr[gt+1:hi+1] > pivot
+    """
+    lt, i, gt = lo, lo, hi  # O(1)
+    while i <= gt:  # O(hi - lo) итераций
+        value = arr[i]  # O(1)
+        if value < pivot:
+            arr[i] = arr[lt]  # O(1)
+            arr[lt] = value  # O(1)
+            lt += 1  # O(1)
+            i += 1  # O(1)
+        elif pivot < value:
+            arr[i] = arr[gt]  # O(1)
+            arr[gt] = value  # O(1)
+            gt -= 1  # O(1)
+        else:
+            i += 1  # O(1)
+    return lt, gt  # O(1)
+    # Общая сложность: O(hi - lo)
+
+
+def insertion_sort_range(arr: List[int], lo: int, hi: int):
+    """Сортировка вставками отрезка arr[lo..hi]"""
+    for i in range(lo + 1, hi + 1):  # O(k) итераций
+        key = arr[i]  # O(1)
+        j = i - 1  # O(1)
+        while j >= lo and key < arr[j]:  # O(k) итераций в худшем случае
+            arr[j + 1] = arr[j]  # O(1)
+            j -= 1  # O(1)
+        arr[j + 1] = key  # O(1)
+    # Общая сложность: O(k²), k = hi - lo + 1 <= INSERTION_THRESHOLD
+
+
+def _heap_sort_range(arr: List[int], lo: int, hi: int):
+    """Пирамидальная сортировка отрезка arr[lo..hi] на месте"""
+    size = hi - lo + 1  # O(1)
+    for root in range(size // 2 - 1, -1, -1):  # O(k) - построение кучи
+        _sift_down(arr, lo, root, size)
+    for end in range(size - 1, 0, -1):  # O(k log k)
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]  # O(1)
+        _sift_down(arr, lo, 0, end)  # O(log k)
+    # Общая сложность: O(k log k), k = hi - lo + 1
+
+
+def _sift_down(arr: List[int], offset: int, root: int, size: int):
+    """Просеивание вниз в max-куче arr[offset:offset + size]"""
+    value = arr[offset + root]  # O(1)
+    while True:  # O(log size) итераций
+        child = 2 * root + 1  # O(1)
+        if child >= size:
+            break
+        if child + 1 < size and arr[offset + child] < arr[offset + child + 1]:
+            child += 1  # O(1)
+        if not value < arr[offset + child]:
+            break
+        arr[offset + root] = arr[offset + child]  # O(1)
+        root = child  # O(1)
+    arr[offset + root] = value  # O(1)
+
+
+# Сортировка подсчетом выбирается, если диапазон ключей не больше factor * n
+_COUNTING_RANGE_FACTOR = 2
+# Поразрядная сортировка выбирается, если хватает стольких байтовых проходов
+_RADIX_MAX_PASSES = 4
+
+
+@_sort_interface(stable=True, by_keys=True)
+def counting_sort(arr: List[int], keys: List[int] = None) -> List[int]:
+    """
+    Сортировка подсчетом для целых чисел (в том числе отрицательных)
+
+    Подсчитывается количество каждого значения в диапазоне [min, max],
+    затем значения выписываются по возрастанию. Если заданы целые ключи
+    keys, элементы arr расставляются по префиксным суммам счетчиков
+    (устойчиво).
+    """
+    if len(arr) <= 1:  # O(1)
+        return arr.copy()  # O(n)
+
+    values = arr if keys is None else keys  # O(1)
+    lo, hi = min(values), max(values)  # O(n)
+    counts = _empty_like(arr, hi - lo + 1, 0)  # O(k), k - диапазон ключей
+    for value in values:  # O(n)
+        counts[value - lo] += 1  # O(1)
+
+    if keys is None:
+        result = _empty_like(arr, 0)  # O(1)
+        for offset, count in enumerate(counts):  # O(k)
+            if count:
+                result.extend([lo + offset] * count)  # O(count)
+        return result  # O(1)
+
+    total = 0  # O(1)
+    for offset, count in enumerate(counts):  # O(k) - начало каждого ключа
+        counts[offset] = total  # O(1)
+        total += count  # O(1)
+    result = _empty_like(arr, len(arr))  # O(n)
+    for key, item in zip(keys, arr):  # O(n)
+        position = counts[key - lo]  # O(1)
+        result[position] = item  # O(1)
+        counts[key - lo] = position + 1  # O(1)
+    return result  # O(1)
+    # Общая временная сложность: O(n + k)
+    # Пространственная сложность: O(n + k)
+    # Глубина: O(1) - не рекурсивная
+
+
+@_sort_interface(stable=True, by_keys=True)
+def radix_sort(arr: List[int], keys: List[int] = None) -> List[int]:
+    """
+    Поразрядная сортировка LSD по байтам для целых чисел
+
+    Отрицательные числа поддерживаются сдвигом ключей на минимум: все
+    ключи x - min неотрицательны и упорядочены так же, как x. Каждый проход
+    устойчиво распределяет ключи по 256 корзинам очередного байта. Если
+    заданы целые ключи keys, вместе с ними распределяются индексы элементов.
+    """
+    if len(arr) <= 1:  # O(1)
+        return arr.copy()  # O(n)
+
+    if keys is None:
+        lo = min(arr)  # O(n)
+        shifted = _buffer_from(arr, (value - lo for value in arr))  # O(n)
+        for shift in _radix_shifts(shifted):  # O(d) проходов, d = log256(k)
+            buckets = [_empty_like(arr, 0) for _ in range(256)]  # O(1)
+            for key in shifted:  # O(n)
+                buckets[(key >> shift) & 0xFF].append(key)  # O(1)
+            shifted = _buffer_from(arr, chain.from_iterable(buckets))  # O(n)
+        return _buffer_from(arr, (key + lo for key in shifted))  # O(n)
+
+    lo = min(keys)  # O(n)
+    shifted = _buffer_from(arr, (key - lo for key in keys))  # O(n)
+    order = range(len(arr))  # O(1) - индексы в текущем порядке
+    for shift in _radix_shifts(shifted):  # O(d) проходов
+        buckets = [_empty_like(arr, 0) for _ in range(256)]  # O(1)
+        for index in order:  # O(n)
+            buckets[(shifted[index] >> shift) & 0xFF].append(index)  # O(1)
+        order = _buffer_from(arr, chain.from_iterable(buckets))  # O(n)
+    return _buffer_from(arr, (arr[index] for index in order))  # O(n)
+    # Общая временная сложность: O(d * n), d = ceil(log256(max - min + 1))
+    # Пространственная сложность: O(n)
+    # Глубина: O(1) - не рекурсивная
+
+
+def _radix_shifts(shifted: List[int]) -> range:
+    """Сдвиги байтов неотрицательных ключей: 0, 8, ..., 8 * (d - 1)"""
+    passes = (max(shifted).bit_length() + 7) // 8  # O(n) - число байтов ключа
+    return range(0, 8 * passes, 8)
+
+
+@_sort_interface(stable=True, by_keys=True)
+def bucket_sort(arr: List[float], keys: List[float] = None) -> List[float]:
+    """
+    Блочная (карманная) сортировка
+
+    Диапазон [min, max] делится на n равных корзин, элементы устойчиво
+    распределяются по корзинам, каждая корзина досортировывается вставками.
+    Подходит и для целых, и для вещественных ключей; на равномерно
+    распределенных данных в корзине в среднем O(1) элементов. Если заданы
+    ключи keys, в корзины попадают пары (ключ, индекс).
+    """
+    n = len(arr)  # O(1)
+    if n <= 1:  # O(1)
+        return arr.copy()  # O(n)
+
+    values = arr if keys is None else keys  # O(1)
+    lo, hi = min(values), max(values)  # O(n)
+    if lo == hi:  # O(1) - все ключи равны
+        return arr.copy()  # O(n)
+
+    scale = (n - 1) / (hi - lo)  # O(1)
+    buckets = [_empty_like(arr, 0) for _ in range(n)]  # O(n)
+    if keys is None:
+        for value in arr:  # O(n)
+            buckets[int((value - lo) * scale)].append(value)  # O(1)
+    else:
+        for index, key in enumerate(keys):  # O(n)
+            buckets[int((key - lo) * scale)].append((key, index))  # O(1)
+
+    result = _empty_like(arr, 0)  # O(1)
+    for bucket in buckets:  # O(n)
+        start = len(result)  # O(1)
+        result.extend(bucket)  # O(len(bucket))
+        if len(bucket) > 1:
+            insertion_sort_range(result, start, len(result) - 1)  # O(len²)
+    return result if keys is None else _buffer_from(arr, (arr[i] for _, i in result))
+    # Общая временная сложность: O(n) в среднем, O(n²) в худшем
+    # Пространственная сложность: O(n)
+    # Глубина: O(1) - не рекурсивная
+
+
+def choose_integer_sort(n: int, lo: int, hi: int) -> str:
+    """
+    Выбор алгоритма для n целых ключей из диапазона [lo, hi]
+
+    - диапазон не больше _COUNTING_RANGE_FACTOR * n - подсчет, O(n + k);
+    - ключ помещается в _RADIX_MAX_PASSES байтов - поразрядная, O(d * n);
+    - иначе - сравнительная quick_sort, O(n log n).
+    """
+    span = hi - lo + 1  # O(1)
+    if span <= _COUNTING_RANGE_FACTOR * n:
+        return "counting_sort"
+    if (span - 1).bit_length() <= 8 * _RADIX_MAX_PASSES:
+        return "radix_sort"
+    return "quick_sort"
+
+
+@_sort_interface(stable=False, by_keys=True)
+def integer_sort(arr: List[int], keys: List[int] = None) -> List[int]:
+    """
+    Сортировка целых чисел с автоматическим выбором алгоритма
+    по диапазону ключей (см. choose_integer_sort)
+
+    Принимает те же типы, что и остальные алгоритмы; выбранный алгоритм
+    сам переходит к реализации для numpy.ndarray или array.array.
+    Устойчива, если выбран подсчет или поразрядная сортировка,
+    и всегда - при сортировке по key.
+    """
+    if len(arr) <= 1:  # O(1)
+        return counting_sort(arr)  # O(1)
+    values = arr if keys is None else keys  # O(1)
+    if np is not None and isinstance(values, np.ndarray):
+        lo, hi = int(values.min()), int(values.max())  # O(n) векторно
+    else:
+        lo, hi = min(values), max(values)  # O(n)
+    algorithm = SORTING_ALGORITHMS[choose_integer_sort(len(arr), lo, hi)]  # O(1)
+    if keys is None:
+        return algorithm(arr)  # O(n + k), O(d * n) или O(n log n)
+    return _sort_by_keys(algorithm, arr, keys, {})  # То же по ключам
+
+
+# Массивы короче порога parallel_merge_sort сортирует в текущем процессе
+_PARALLEL_MIN_SIZE = 1 << 16
+# Типы целых и вещественных array.array, которые помещаются в 'q' и 'd'
+_INT_TYPECODES = "bBhHiIlq"
+_FLOAT_TYPECODES = "fd"
+
+
+@_sort_interface(stable=True)
+def parallel_merge_sort(arr: List[int], workers: int = None) -> List[int]:
+    """
+    Параллельная сортировка слиянием в пуле процессов
+
+    1. Данные копируются в разделяемую память (целые - int64 'q',
+       вещественные - double 'd'), процессам передается только ее имя.
+    2. Каждый процесс сортирует свой блок на месте (merge_sort).
+    3. По регулярной выборке из отсортированных блоков выбираются
+       workers - 1 разделителей (как в PSRS); процесс j k-путевым слиянием
+       сливает из всех блоков значения между разделителями j - 1 и j
+       и пишет их сразу на их место в выходном буфере.
+
+    Обе фазы выполняются параллельно. Если элементы не помещаются
+    в 'q'/'d' (большие целые, строки и т.п.), блоки передаются процессам
+    сериализацией, а сливаются в текущем процессе через heapq.merge.
+
+    Args:
+        arr: list, array.array или numpy.ndarray
+        workers (int): Количество процессов (по умолчанию - число ядер)
+
+    Returns:
+        Отсортированная копия того же типа, что и arr
+    """
+    n = len(arr)  # O(1)
+    workers = workers or os.cpu_count() or 1  # O(1)
+    if workers <= 1 or n < _PARALLEL_MIN_SIZE:
+        return merge_sort(arr)  # O(n log n)
+
+    typecode = _shared_typecode(arr)  # O(n)
+    if typecode is not None:
+        try:
+            return _parallel_merge_sort_shared(arr, typecode, workers)
+        except OverflowError:  # Целые вне диапазона int64
+            pass
+    return _parallel_merge_sort_pickled(arr, workers)
+    # Общая временная сложность: O((n log n) / p + n log p) при p процессах
+    # Пространственная сложность: O(n) - входной и выходной буферы
+    # Глубина: O(1) - не рекурсивная
+
+
+def _shared_typecode(arr) -> str:
+    """Код типа array для разделяемой памяти или None, если не подходит"""
+    if np is not None and isinstance(arr, np.ndarray):
+        if np.issubdtype(arr.dtype, np.floating):
+            return "d"
+        if np.issubdtype(arr.dtype, np.signedinteger) or (
+            np.issubdtype(arr.dtype, np.unsignedinteger) and arr.dtype.itemsize < 8
+        ):
+            return "q"
+        return None
+    if isinstance(arr, array):
+        if arr.typecode in _INT_TYPECODES:
+            return "q"
+        return "d" if arr.typecode in _FLOAT_TYPECODES else None
+    if all(type(value) is int for value in arr):  # O(n)
+        return "q"
+    if all(type(value) is float for value in arr):  # O(n)
+        return "d"
+    return None
+
+
+def _parallel_merge_sort_shared(arr, typecode: str, workers: int):
+    """Обе фазы parallel_merge_sort над разделяемой памятью"""
+    n = len(arr)  # O(1)
+    itemsize = array(typecode).itemsize  # O(1)
+    source = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    target = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    try:
+        if np is not None and isinstance(arr, np.ndarray):
+            view = np.frombuffer(source.buf, dtype=typecode, count=n)  # O(1)
+            view[:] = arr  # O(n)
+            del view  # Представление держит буфер - освобождаем до close()
+        else:
+            source.buf[:n * itemsize] = array(typecode, arr).tobytes()  # O(n)
+
+        bounds = [n * i // workers for i in range(workers + 1)]  # Границы блоков
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Фаза 1: сортировка блоков на месте
+            list(pool.map(
+                _sort_shared_block,
+                [source.name] * workers, [typecode] * workers,
+                bounds[:-1], bounds[1:],
+            ))
+
+            # Фаза 2: разделители и границы частей каждого блока
+            with source.buf[:n * itemsize].cast(typecode) as data:
+                splitters = _choose_splitters(data, bounds, workers)  # O(p² log p)
+                cuts = [  # cuts[i][j] - начало части j в блоке i
+                    [lo] + [bisect_left(data, s, lo, hi) for s in splitters] + [hi]
+                    for lo, hi in zip(bounds, bounds[1:])
+                ]  # O(p² log n)
+
+            tasks = []  # (отрезки блоков для слияния, смещение в выходном буфере)
+            offset = 0  # O(1)
+            for j in range(workers):
+                ranges = [(block[j], block[j + 1]) for block in cuts]  # O(p)
+                tasks.append((ranges, offset))  # O(1)
+                offset += sum(hi - lo for lo, hi in ranges)  # O(p)
+
+            # Фаза 3: k-путевое слияние частей в выходной буфер
+            list(pool.map(
+                _merge_shared_ranges,
+                [source.name] * workers, [target.name] * workers,
+                [typecode] * workers, *zip(*tasks),
+            ))
+
+        with target.buf[:n * itemsize].cast(typecode) as result:
+            return _same_type_as(arr, result, typecode)  # O(n)
+    finally:
+        for block in (source, target):
+            block.close()
+            block.unlink()
+
+
+def _choose_splitters(data, bounds: List[int], workers: int) -> list:
+    """
+    Разделители по регулярной выборке (PSRS): из каждого отсортированного
+    блока берется workers равноотстоящих элементов
+    """
+    sample = sorted(  # O(p² log p)
+        data[lo + (hi - lo) * k // workers]
+        for lo, hi in zip(bounds, bounds[1:])
+        if hi > lo
+        for k in range(workers)
+    )
+    return [sample[j * len(sample) // workers] for j in range(1, workers)]
+
+
+def _sort_shared_block(name: str, typecode: str, lo: int, hi: int):
+    """Процесс пула: сортировка блока [lo, hi) разделяемой памяти на месте"""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf.cast(typecode) as data:
+            if np is not None:
+                view = np.frombuffer(data, dtype=typecode)[lo:hi]  # O(1)
+                view[:] = merge_sort(view)  # O(k log k) - векторное слияние
+                del view
+            else:
+                data[lo:hi] = array(typecode, merge_sort(data[lo:hi].tolist()))
+    finally:
+        block.close()
+
+
+def _merge_shared_ranges(source_name: str, target_name: str, typecode: str,
+                         ranges: list, offset: int):
+    """
+    Процесс пула: k-путевое слияние отсортированных отрезков source
+    в target[offset:offset + суммарная длина]
+    """
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    try:
+        with source.buf.cast(typecode) as data, target.buf.cast(typecode) as out:
+            total = sum(hi - lo for lo, hi in ranges)  # O(p)
+            if np is not None:
+                # Серии подряд - векторное попарное слияние серий, O(k log p)
+                values = np.frombuffer(data, dtype=typecode)  # O(1)
+                runs = np.concatenate([values[lo:hi] for lo, hi in ranges])  # O(k)
+                merged = np.frombuffer(out, dtype=typecode)  # O(1)
+                merged[offset:offset + total] = natural_merge_sort(runs)
+                del values, merged
+            else:
+                out[offset:offset + total] = array(  # O(k log p) - куча из p голов
+                    typecode, heapq.merge(*(data[lo:hi] for lo, hi in ranges))
+                )
+    finally:
+        source.close()
+        target.close()
+
+
+def _parallel_merge_sort_pickled(arr, workers: int):
+    """Запасной путь: блоки сериализуются в процессы, слияние - heapq.merge"""
+    n = len(arr)  # O(1)
+    bounds = [n * i // workers for i in range(workers + 1)]  # O(p)
+    blocks = [list(arr[lo:hi]) for lo, hi in zip(bounds, bounds[1:])]  # O(n)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        runs = list(pool.map(merge_sort, blocks))  # O((n log n) / p)
+    return _same_type_as(arr, list(heapq.merge(*runs)), None)  # O(n log p)
+
+
+def _same_type_as(arr, values, typecode: str):
+    """Копия values в виде того же типа, что и arr (list, array или ndarray)"""
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.array(values, dtype=typecode).astype(arr.dtype)  # O(n)
+    if isinstance(arr, array):
+        return array(arr.typecode, values)  # O(n)
+    return values.tolist() if isinstance(values, memoryview) else values  # O(n)
+
+
+# Характеристики входа, по которым adaptive_sort выбирает алгоритм
+InputStats = namedtuple(
+    "InputStats", ["size", "runs", "inversions", "min", "max", "integer_keys"]
+)
+# Решение adaptive_sort: имя алгоритма, причина, характеристики входа
+# и время их вычисления в секундах
+SortDecision = namedtuple("SortDecision", ["algorithm", "reason", "stats", "cost"])
+
+# Сколько случайных пар элементов проверяется для оценки числа инверсий
+_INVERSION_SAMPLE = 1024
+# Вставки выбираются, если инверсий не больше factor * n (время O(n + I))
+_INSERTION_MAX_INVERSIONS_FACTOR = 4
+# Естественное слияние выбирается при средней длине серии не меньше порога
+_NATURAL_MIN_RUN_LENGTH = 64
+
+
+def _count_runs(values: list) -> int:
+    """
+    Количество серий в том же смысле, что у _find_runs: неубывающих
+    и строго убывающих (без разворота серий)
+    """
+    n = len(values)  # O(1)
+    runs = 0  # O(1)
+    start = 0  # O(1)
+    while start < n:  # O(n) итераций суммарно
+        end = start + 1  # O(1)
+        if end < n and values[end] < values[start]:
+            while end < n and values[end] < values[end - 1]:  # O(длина серии)
+                end += 1  # O(1)
+        else:
+            while end < n and values[end] >= values[end - 1]:  # O(длина серии)
+                end += 1  # O(1)
+        runs += 1  # O(1)
+        start = end  # O(1)
+    return runs  # O(1)
+
+
+def _estimate_inversions(values: list) -> int:
+    """
+    Оценка числа инверсий по случайной выборке пар: доля инвертированных
+    пар среди _INVERSION_SAMPLE случайных, умноженная на n(n-1)/2
+
+    Выборка не различает значения меньше n(n-1)/2 / _INVERSION_SAMPLE
+    (при n > ~8000 это больше порога вставок), поэтому малая оценка
+    проверяется точным подсчетом с ограничением (_count_inversions_up_to).
+    Генератор с фиксированным зерном делает оценку воспроизводимой.
+    """
+    n = len(values)  # O(1)
+    pairs = n * (n - 1) // 2  # O(1)
+    if pairs <= _INVERSION_SAMPLE:  # Маленький вход - точный подсчет
+        return sum(  # O(n²) = O(_INVERSION_SAMPLE)
+            values[j] < values[i] for i in range(n) for j in range(i + 1, n)
+        )
+    rng = random.Random(n)  # O(1)
+    inverted = 0  # O(1)
+    for _ in range(_INVERSION_SAMPLE):  # O(1) - выборка фиксированного размера
+        # Равномерная пара; i == j (вероятность 1/n) считается неинвертированной
+        i, j = rng.randrange(n), rng.randrange(n)  # O(1)
+        if j < i:
+            i, j = j, i  # O(1)
+        inverted += values[j] < values[i]  # O(1)
+    estimate = inverted * pairs // _INVERSION_SAMPLE  # O(1)
+
+    limit = _INSERTION_MAX_INVERSIONS_FACTOR * n  # O(1)
+    if estimate <= limit:  # Выборка не опровергла "мало инверсий" - проверяем
+        exact = _count_inversions_up_to(values, limit)  # O(n + limit) = O(n)
+        return exact if exact <= limit else max(estimate, exact)
+    return estimate  # O(1)
+
+
+def _count_inversions_up_to(values: list, limit: int) -> int:
+    """
+    Точное число инверсий, если оно не больше limit, иначе limit + 1:
+    сортировка вставками копии, прерываемая после limit + 1 сдвигов
+    """
+    work = list(values)  # O(n)
+    inversions = 0  # O(1)
+    for i in range(1, len(work)):  # O(n) итераций
+        key = work[i]  # O(1)
+        j = i - 1  # O(1)
+        while j >= 0 and key < work[j]:  # Суммарно не больше limit + 1 сдвигов
+            work[j + 1] = work[j]  # O(1)
+            j -= 1  # O(1)
+            inversions += 1  # O(1)
+            if inversions > limit:
+                return inversions  # O(1) - вставки не подходят
+        work[j + 1] = key  # O(1)
+    return inversions  # O(1)
+    # Общая сложность: O(n + limit)
+
+
+def input_stats(values) -> InputStats:
+    """Характеристики входа за O(n): серии, инверсии, диапазон, тип ключей"""
+    if np is not None and isinstance(values, np.ndarray):
+        values = values.tolist()  # O(n)
+    if not values:
+        return InputStats(0, 0, 0, None, None, True)
+    return InputStats(
+        size=len(values),
+        runs=_count_runs(values),  # O(n)
+        inversions=_estimate_inversions(values),  # O(n)
+        min=min(values),  # O(n)
+        max=max(values),  # O(n)
+        integer_keys=all(type(value) is int for value in values),  # O(n)
+    )
+
+
+def choose_sort_algorithm(values) -> SortDecision:
+    """
+    Выбор алгоритма по характеристикам входа
+
+    1. n <= INSERTION_THRESHOLD - вставки (меньше накладных расходов);
+    2. одна серия (отсортирован или развернут) - естественное слияние, O(n);
+    3. инверсий не больше _INSERTION_MAX_INVERSIONS_FACTOR * n - вставки,
+       O(n + I);
+    4. средняя серия не короче _NATURAL_MIN_RUN_LENGTH - естественное
+       слияние, O(n log r);
+    5. целые ключи в подходящем диапазоне - подсчет или поразрядная;
+    6. иначе - интроспективная быстрая сортировка.
+    """
+    started = time.perf_counter()  # O(1)
+    stats = input_stats(values)  # O(n)
+    n = stats.size  # O(1)
+
+    if n <= INSERTION_THRESHOLD:
+        algorithm, reason = "insertion_sort", f"маленький вход (n = {n})"
+    elif stats.runs == 1:
+        algorithm, reason = "natural_merge_sort", "вход уже упорядочен (одна серия)"
+    elif stats.inversions <= _INSERTION_MAX_INVERSIONS_FACTOR * n:
+        algorithm, reason = "insertion_sort", f"мало инверсий (~{stats.inversions})"
+    elif n // stats.runs >= _NATURAL_MIN_RUN_LENGTH:
+        algorithm, reason = "natural_merge_sort", f"длинные серии (серий: {stats.runs})"
+    elif stats.integer_keys and (
+        choice := choose_integer_sort(n, stats.min, stats.max)
+    ) != "quick_sort":
+        algorithm, reason = choice, f"целые ключи в диапазоне [{stats.min}, {stats.max}]"
+    else:
+        algorithm, reason = "quick_sort", "случайный порядок"
+    return SortDecision(algorithm, reason, stats, time.perf_counter() - started)
+
+
+@_sort_interface(stable=False, by_keys=True)
+def adaptive_sort(arr: List[int], keys: list = None, on_decision: Callable = None):
+    """
+    Сортировка с выбором алгоритма по характеристикам входа
+    (см. choose_sort_algorithm)
+
+    Args:
+        on_decision (callable): Получает SortDecision - для инструментирования
+    """
+    decision = choose_sort_algorithm(arr if keys is None else keys)  # O(n)
+    if on_decision is not None:
+        on_decision(decision)
+    algorithm = SORTING_ALGORITHMS[decision.algorithm]  # O(1)
+    if keys is None:
+        return algorithm(arr)  # Сложность выбранного алгоритма
+    return _sort_by_keys(algorithm, arr, keys, {})
 
 
 def is_sorted(arr: List[int]) -> bool:
     """Проверка, отсортирован ли массив"""
+    if np is not None and isinstance(arr, np.ndarray):
+        return bool(np.all(arr[:-1] <= arr[1:]))  # O(n) векторно
     return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))  # O(n)
 
 
@@ -155,5 +1004,18 @@ SORTING_ALGORITHMS = {
     "selection_sort": selection_sort,
     "insertion_sort": insertion_sort,
     "merge_sort": merge_sort,
+    "natural_merge_sort": natural_merge_sort,
     "quick_sort": quick_sort,
+    "counting_sort": counting_sort,
+    "radix_sort": radix_sort,
+    "bucket_sort": bucket_sort,
+    "integer_sort": integer_sort,
+    "parallel_merge_sort": parallel_merge_sort,
+    "adaptive_sort": adaptive_sort,
+}
+
+# Устойчивые алгоритмы - для многоколоночной сортировки последовательными
+# проходами по ключам от младшего к старшему
+STABLE_ALGORITHMS = {
+    name: func for name, func in SORTING_ALGORITHMS.items() if func.stable
 }
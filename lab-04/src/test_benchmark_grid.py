@@ -0,0 +1,65 @@
+import os
+import unittest
+import benchmark_grid
+from benchmark_grid import run_grid
+
+
+def crashing_sort(arr):
+    """Алгоритм, аварийно завершающий рабочий процесс"""
+    os._exit(1)
+
+
+class TestRunGrid(unittest.TestCase):
+    """
+    Тестирование прогона сетки замеров
+    """
+
+    def setUp(self):
+        """Регистрация падающего алгоритма на время теста - O(1)"""
+        benchmark_grid.algorithms["crash"] = crashing_sort  # O(1)
+        self.addCleanup(benchmark_grid.algorithms.pop, "crash")
+
+    def run_small_grid(self, algorithms, workers=1):
+        """Маленькая сетка: два размера, одно распределение - O(1)"""
+        return run_grid(
+            {
+                "algorithms": algorithms,
+                "sizes": [10, 20],
+                "distributions": ["random"],
+                "repeats": 2,
+                "timeout": 30.0,
+                "workers": workers,
+            },
+            progress=None,
+        )
+
+    def test_ok_cells(self):
+        """Тест обычного прогона - все ячейки со статусом ok"""
+        results = self.run_small_grid(["quick", "merge"])  # O(ячеек)
+        self.assertEqual(len(results), 4)  # O(1)
+        for row in results:  # O(ячеек)
+            self.assertEqual(row["status"], "ok")  # O(1)
+            self.assertEqual(row["repeats"], 2)  # O(1)
+
+    def test_worker_crash(self):
+        """Тест гибели процесса: ячейка error, остальные замеры сохранены"""
+        for workers in (1, 2):
+            results = self.run_small_grid(["crash", "quick"], workers)
+            statuses = {
+                (row["algorithm"], row["size"]): row["status"] for row in results
+            }
+            self.assertEqual(statuses, {
+                ("crash", 10): "error",
+                ("crash", 20): "error",
+                ("quick", 10): "ok",
+                ("quick", 20): "ok",
+            })  # O(1)
+
+
+def run_tests():
+    """Запуск всех тестов - O(все тесты)"""
+    unittest.main(argv=[""], verbosity=2, exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()  # O(все тесты)
@@ -0,0 +1,187 @@
+import random
+import unittest
+from operator import itemgetter
+from array import array
+from selection import nth_element, select, partial_sort, top_k
+from sorts import np
+
+
+def random_values(n, high=1000, seed=0):
+    """Случайный список из n целых чисел - O(n)"""
+    rng = random.Random(seed)  # O(1)
+    return [rng.randint(0, high) for _ in range(n)]  # O(n)
+
+
+class TestNthElement(unittest.TestCase):
+    """
+    Тестирование nth_element и select
+    """
+
+    def check_partitioned(self, result, values, k):
+        """Проверка разбиения по k-й статистике - O(n log n)"""
+        expected = sorted(values)  # O(n log n)
+        self.assertEqual(sorted(result), expected)  # O(n log n) - перестановка
+        self.assertEqual(result[k], expected[k])  # O(1)
+        self.assertTrue(all(x <= result[k] for x in result[:k]))  # O(k)
+        self.assertTrue(all(x >= result[k] for x in result[k + 1:]))  # O(n - k)
+
+    def test_every_index(self):
+        """Тест всех индексов на случайных данных - O(n²)"""
+        values = random_values(200)  # O(n)
+        for k in range(len(values)):  # O(n) итераций
+            self.check_partitioned(nth_element(values, k), values, k)  # O(n)
+
+    def test_duplicates(self):
+        """Тест массива из нескольких повторяющихся значений - O(n)"""
+        values = random_values(500, high=3)  # O(n)
+        for k in (0, 250, 499):
+            self.check_partitioned(nth_element(values, k), values, k)  # O(n)
+
+    def test_negative_index(self):
+        """Тест отрицательного индекса - отсчет с конца"""
+        values = random_values(50)  # O(n)
+        self.assertEqual(select(values, -1), max(values))  # O(n)
+        self.assertEqual(select(values, 0), min(values))  # O(n)
+
+    def test_index_out_of_range(self):
+        """Тест индекса вне диапазона - IndexError"""
+        with self.assertRaises(IndexError):
+            nth_element([1, 2, 3], 3)  # O(1)
+        with self.assertRaises(IndexError):
+            select([], 0)  # O(1)
+
+    def test_inplace(self):
+        """Тест inplace: переставляется сам массив, иначе вход не меняется"""
+        values = random_values(100)  # O(n)
+        original = values[:]  # O(n)
+        nth_element(values, 10)  # O(n)
+        self.assertEqual(values, original)  # O(n) - вход не изменен
+
+        result = nth_element(values, 10, inplace=True)  # O(n)
+        self.assertIs(result, values)  # O(1)
+        self.check_partitioned(values, original, 10)  # O(n log n)
+
+    def test_array_and_numpy(self):
+        """Тест array.array и numpy.ndarray - результат того же типа"""
+        values = random_values(300)  # O(n)
+        result = nth_element(array("q", values), 150)  # O(n)
+        self.assertIsInstance(result, array)  # O(1)
+        self.check_partitioned(list(result), values, 150)  # O(n log n)
+        if np is not None:
+            result = nth_element(np.array(values), 150)  # O(n)
+            self.assertIsInstance(result, np.ndarray)  # O(1)
+            self.check_partitioned(result.tolist(), values, 150)  # O(n log n)
+
+    def test_select_median(self):
+        """Тест медианы через select - O(n)"""
+        values = random_values(101)  # O(n)
+        self.assertEqual(select(values, 50), sorted(values)[50])  # O(n log n)
+
+
+class TestPartialSort(unittest.TestCase):
+    """
+    Тестирование partial_sort
+    """
+
+    def test_prefix_sorted(self):
+        """Тест: первые k элементов - k наименьших по возрастанию"""
+        values = random_values(300)  # O(n)
+        for k in (1, 10, 150, 299):
+            result = partial_sort(values, k)  # O(n + k log k)
+            self.assertEqual(result[:k], sorted(values)[:k])  # O(n log n)
+            self.assertEqual(sorted(result), sorted(values))  # O(n log n)
+
+    def test_k_zero(self):
+        """Тест k = 0 - массив не упорядочивается и не теряет элементы"""
+        values = random_values(20)  # O(n)
+        self.assertEqual(partial_sort(values, 0), values)  # O(n)
+
+    def test_k_at_least_n(self):
+        """Тест k >= n - полная сортировка"""
+        values = random_values(40)  # O(n)
+        self.assertEqual(partial_sort(values, 40), sorted(values))  # O(n log n)
+        self.assertEqual(partial_sort(values, 100), sorted(values))  # O(n log n)
+
+    def test_duplicates(self):
+        """Тест повторяющихся значений - O(n)"""
+        values = random_values(200, high=2)  # O(n)
+        result = partial_sort(values, 120)  # O(n + k log k)
+        self.assertEqual(result[:120], sorted(values)[:120])  # O(n log n)
+
+    def test_negative_k(self):
+        """Тест отрицательного k - ValueError"""
+        with self.assertRaises(ValueError):
+            partial_sort([1, 2], -1)  # O(1)
+
+    def test_numpy(self):
+        """Тест numpy.ndarray: срез сортируется на месте"""
+        if np is None:
+            self.skipTest("NumPy не установлен")
+        values = random_values(200)  # O(n)
+        result = partial_sort(np.array(values), 50)  # O(n + k log k)
+        self.assertEqual(result[:50].tolist(), sorted(values)[:50])  # O(n log n)
+
+
+class TestTopK(unittest.TestCase):
+    """
+    Тестирование top_k
+    """
+
+    def test_smallest_and_largest(self):
+        """Тест k наименьших и k наибольших - O(n log k)"""
+        values = random_values(500)  # O(n)
+        self.assertEqual(top_k(values, 10), sorted(values)[:10])  # O(n log k)
+        self.assertEqual(
+            top_k(values, 10, largest=True), sorted(values, reverse=True)[:10]
+        )  # O(n log k)
+
+    def test_k_zero(self):
+        """Тест k = 0 - пустой результат, поток не читается"""
+        self.assertEqual(top_k(iter([3, 1, 2]), 0), [])  # O(1)
+        self.assertEqual(top_k([3, 1, 2], 0, largest=True), [])  # O(1)
+
+    def test_k_at_least_n(self):
+        """Тест k >= n - все элементы по порядку"""
+        values = random_values(30)  # O(n)
+        self.assertEqual(top_k(values, 30), sorted(values))  # O(n log n)
+        self.assertEqual(
+            top_k(values, 100, largest=True), sorted(values, reverse=True)
+        )  # O(n log n)
+
+    def test_generator(self):
+        """Тест потока-генератора - элементы читаются один раз"""
+        stream = (x * 7 % 101 for x in range(1000))  # O(1)
+        self.assertEqual(top_k(stream, 3), [0, 0, 0])  # O(n log k)
+
+    def test_key_stable_ties(self):
+        """Тест key: равные ключи - в порядке появления, как sorted"""
+        items = [(value, i) for i, value in enumerate(random_values(200, high=5))]
+        by_value = itemgetter(0)  # O(1)
+        for k in (1, 7, 50, 200):
+            self.assertEqual(
+                top_k(items, k, key=by_value), sorted(items, key=by_value)[:k]
+            )  # O(n log k)
+            self.assertEqual(
+                top_k(items, k, key=by_value, largest=True),
+                sorted(items, key=by_value, reverse=True)[:k],
+            )  # O(n log k)
+
+    def test_incomparable_items(self):
+        """Тест элементов без сравнения - сравниваются только ключи"""
+        items = [{"id": i, "score": i % 4} for i in range(20)]  # O(n)
+        result = top_k(items, 3, key=lambda item: item["score"], largest=True)
+        self.assertEqual([item["id"] for item in result], [3, 7, 11])  # O(k)
+
+    def test_negative_k(self):
+        """Тест отрицательного k - ValueError"""
+        with self.assertRaises(ValueError):
+            top_k([1, 2], -1)  # O(1)
+
+
+def run_tests():
+    """Запуск всех тестов - O(все тесты)"""
+    unittest.main(argv=[""], verbosity=2, exit=False)
+
+
+if __name__ == "__main__":
+    run_tests()  # O(все тесты)
@@ -39,3 +39,17 @@ HASH_FUNCTIONS = {  # O(1)
     "polynomial": polynomial_hash,
     "djb2": djb2_hash,
 }
+
+
+# Полный хеш ключа вычисляется один раз по этому модулю и хранится вместе
+# с элементом (помещается в array('q')); индекс в таблице размера 2^k -
+# младшие k бит полного хеша: full_hash & (size - 1)
+FULL_HASH_MODULUS = 1 << 63
+
+
+def table_capacity(size):
+    """
+    Размер таблицы - ближайшая сверху степень двойки
+    (индекс ячейки вычисляется маской вместо деления)
+    """
+    return 1 << max(size - 1, 0).bit_length()  # O(1)
@@ -1,35 +1,46 @@
-from hash_functions import HASH_FUNCTIONS
+from hash_functions import HASH_FUNCTIONS, FULL_HASH_MODULUS, table_capacity
 
 
 class HashTableChaining:
     """
     Хеш-таблица с методом цепочек
+
+    Цепочки хранят тройки (полный хеш, ключ, значение): хеш ключа
+    вычисляется один раз на операцию, при поиске в цепочке сначала
+    сравниваются хеши, при увеличении таблицы хеши не пересчитываются.
+    Размер таблицы - степень двойки, индекс цепочки - маска полного хеша.
     """
 
     def __init__(self, size=10, hash_function="polynomial", load_factor_threshold=0.7):
-        self.size = size  # O(1)
+        self.size = table_capacity(size)  # O(1) - степень двойки не меньше size
+        self.mask = self.size - 1  # O(1)
         self.hash_function = HASH_FUNCTIONS[hash_function]  # O(1)
         self.load_factor_threshold = load_factor_threshold  # O(1)
-        self.table = [[] for _ in range(size)]  # O(size)
+        self.table = [[] for _ in range(self.size)]  # O(size)
         self.count = 0  # O(1)
         # Общая сложность инициализации: O(size)
 
     def _hash(self, key):
-        return self.hash_function(key, self.size)  # O(len(key))
+        """
+        Полный хеш ключа (не зависит от размера таблицы)
+        Сложность: O(len(key))
+        """
+        return self.hash_function(key, FULL_HASH_MODULUS)  # O(len(key))
 
     def _resize(self, new_size):
         """
-        Увеличивает размер таблицы и перехеширует все элементы
+        Увеличивает размер таблицы и распределяет элементы по новым цепочкам
         Сложность: O(n) где n - количество элементов
+        Хеши ключей не пересчитываются - берутся из цепочек
         """
         old_table = self.table  # O(1)
         self.size = new_size  # O(1)
+        self.mask = new_size - 1  # O(1)
         self.table = [[] for _ in range(new_size)]  # O(new_size)
-        self.count = 0  # O(1)
 
         for bucket in old_table:  # O(old_size) итераций
-            for key, value in bucket:  # O(длина цепочки) итераций
-                self.insert(key, value)  # O(1) в среднем
+            for entry in bucket:  # O(длина цепочки) итераций
+                self.table[entry[0] & self.mask].append(entry)  # O(1)
         # Общая сложность: O(n)
 
     def insert(self, key, value):
@@ -41,17 +52,17 @@ class HashTableChaining:
         if self.load_factor > self.load_factor_threshold:  # O(1)
             self._resize(self.size * 2)  # O(n) в худшем случае
 
-        index = self._hash(key)  # O(len(key))
-        bucket = self.table[index]  # O(1)
+        full_hash = self._hash(key)  # O(len(key)) - один раз
+        bucket = self.table[full_hash & self.mask]  # O(1)
 
         # Проверяем, нет ли уже такого ключа - O(длина цепочки)
-        for i, (k, v) in enumerate(bucket):
+        for i, (h, k, v) in enumerate(bucket):
             # O(α) где α - коэффициент заполнения
-            if k == key:  # O(1)
-                bucket[i] = (key, value)  # O(1)
+            if h == full_hash and k == key:  # O(1)
+                bucket[i] = (full_hash, key, value)  # O(1)
                 return  # O(1)
 
-        bucket.append((key, value))  # O(1)
+        bucket.append((full_hash, key, value))  # O(1)
         self.count += 1  # O(1)
         # Средняя сложность: O(1)
         # Худшая сложность: O(n)
@@ -62,11 +73,11 @@ class HashTableChaining:
         Средняя сложность: O(1)
         Худшая сложность: O(n)
         """
-        index = self._hash(key)  # O(len(key))
-        bucket = self.table[index]  # O(1)
+        full_hash = self._hash(key)  # O(len(key))
+        bucket = self.table[full_hash & self.mask]  # O(1)
 
-        for k, v in bucket:  # O(α) итераций
-            if k == key:  # O(1)
+        for h, k, v in bucket:  # O(α) итераций
+            if h == full_hash and k == key:  # O(1)
                 return v  # O(1)
         return None  # O(1)
         # Средняя сложность: O(1)
@@ -78,11 +89,11 @@ class HashTableChaining:
         Средняя сложность: O(1)
         Худшая сложность: O(n)
         """
-        index = self._hash(key)  # O(len(key))
-        bucket = self.table[index]  # O(1)
+        full_hash = self._hash(key)  # O(len(key))
+        bucket = self.table[full_hash & self.mask]  # O(1)
 
-        for i, (k, v) in enumerate(bucket):  # O(α) итераций
-            if k == key:  # O(1)
+        for i, (h, k, v) in enumerate(bucket):  # O(α) итераций
+            if h == full_hash and k == key:  # O(1)
                 del bucket[i]  # O(длина цепочки)
                 self.count -= 1  # O(1)
                 return True  # O(1)
@@ -1,9 +1,54 @@
-from hash_functions import HASH_FUNCTIONS
+from array import array
+from collections import Counter
+
+from hash_functions import HASH_FUNCTIONS, FULL_HASH_MODULUS, table_capacity
+
+# Множитель фибоначчиева хеширования (2^64 / золотое сечение): шаг двойного
+# хеширования берется из старших бит произведения, зависящих от всех бит хеша
+_STEP_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# Управляющие байты ячеек (bytearray states): занятая ячейка хранит 7 младших
+# бит хеша ключа (0..127), свободная и удаленная - значения со старшим битом
+EMPTY = 0x80
+DELETED = 0xFE
+_TAG_MASK = 0x7F
+
+# Ширина группы управляющих байтов, просматриваемой за один шаг (swiss)
+_GROUP_WIDTH = 16
+
+PROBING_METHODS = ("linear", "double", "robin_hood", "swiss")
 
 
 class HashTableOpenAddressing:
     """
     Хеш-таблица с открытой адресацией
+
+    Компактное хранение в параллельных массивах вместо кортежа на ячейку:
+    keys и values - списки ключей и значений, hashes - array('q') полных
+    хешей, states - bytearray управляющих байтов (EMPTY, DELETED или
+    7 младших бит хеша занятой ячейки). Полный хеш ключа вычисляется один
+    раз на операцию; при пробировании сначала сравниваются управляющий байт
+    и хеш, и только при совпадении - ключи; при увеличении таблицы хеши
+    берутся из hashes, а не вычисляются заново.
+
+    Размер таблицы - степень двойки: начальная ячейка - младшие биты хеша
+    (маска), шаг двойного хеширования - нечетное число из других бит хеша,
+    поэтому последовательность проб обходит всю таблицу.
+
+    Методы пробирования:
+    - linear, double - линейное пробирование и двойное хеширование
+      с маркерами удаления;
+    - robin_hood - линейное пробирование, при котором ключ, ушедший дальше
+      от своей ячейки, вытесняет более близкий; поиск останавливается, как
+      только встречен ключ ближе к своей ячейке, чем искомый; удаление
+      сдвигает следующие ключи назад, маркеры удаления не нужны;
+    - swiss - таблица из групп по 16 ячеек: группа проверяется целиком
+      поиском управляющего байта (bytearray.find), группы перебираются
+      квадратичным пробированием.
+
+    Маркеры удаления учитываются в заполнении: когда занятые ячейки вместе
+    с ними достигают порога, таблица перестраивается - в прежнем размере,
+    если живых элементов мало, иначе с увеличением вдвое.
     """
 
     def __init__(
@@ -13,67 +58,237 @@ class HashTableOpenAddressing:
         probing_method="linear",
         load_factor_threshold=0.7,
     ):
-        self.size = size  # O(1)
+        if probing_method not in PROBING_METHODS:
+            raise ValueError(f"Неизвестный метод пробирования: {probing_method}")
         self.hash_function = HASH_FUNCTIONS[hash_function]  # O(1)
         self.probing_method = probing_method  # O(1)
         self.load_factor_threshold = load_factor_threshold  # O(1)
-        self.table = [None] * size  # O(size)
-        self.count = 0  # O(1)
-        self.DELETED = object()  # O(1)
+        size = table_capacity(size)  # O(1) - степень двойки не меньше size
+        if probing_method == "swiss":
+            size = max(size, _GROUP_WIDTH)  # O(1) - хотя бы одна группа
+        self._allocate(size)  # O(size)
         # Общая сложность инициализации: O(size)
 
-    def _hash(self, key, attempt=0):
+    def _allocate(self, size):
+        """
+        Пустые массивы таблицы размера size (степень двойки)
+        Сложность: O(size)
         """
-        Вычисляет хеш с учетом номера попытки
+        self.size = size  # O(1)
+        self.mask = size - 1  # O(1)
+        self.keys = [None] * size  # O(size)
+        self.values = [None] * size  # O(size)
+        self.hashes = array("q", bytes(8 * size))  # O(size) - 8 байт на ячейку
+        self.states = bytearray([EMPTY]) * size  # O(size) - 1 байт на ячейку
+        self.count = 0  # O(1)
+        self.deleted = 0  # O(1) - ячейки с маркером DELETED
+
+    def _full_hash(self, key):
+        """
+        Полный хеш ключа (не зависит от размера таблицы)
         Сложность: O(len(key))
         """
-        if self.probing_method == "linear":  # O(1)
-            return (
-                self.hash_function(key, self.size) + attempt
-            ) % self.size  # O(len(key))
-        elif self.probing_method == "double":  # O(1)
-            h1 = self.hash_function(key, self.size)  # O(len(key))
-            h2 = 1 + (self.hash_function(key, self.size - 1))  # O(len(key))
-            return (h1 + attempt * h2) % self.size  # O(1)
-        # Общая сложность: O(len(key))
+        return self.hash_function(key, FULL_HASH_MODULUS)  # O(len(key))
 
-    def _resize(self, new_size):
+    def _step(self, full_hash):
         """
-        Увеличивает размер таблицы
-        Сложность: O(n) где n - количество элементов
+        Шаг пробирования, вычисляемый один раз на операцию
+        Сложность: O(1)
         """
-        old_table = self.table  # O(1)
-        self.size = new_size  # O(1)
-        self.table = [None] * new_size  # O(new_size)
-        self.count = 0  # O(1)
+        if self.probing_method == "double":  # O(1)
+            # Нечетный шаг взаимно прост с размером 2^k
+            return ((full_hash * _STEP_MULTIPLIER) >> 32) & self.mask | 1  # O(1)
+        return 1  # O(1) - linear и robin_hood
 
-        for item in old_table:  # O(old_size) итераций
-            if item is not None and item is not self.DELETED:  # O(1)
-                key, value = item  # O(1)
-                # Используем внутренний метод вставки без ресайза
-                self._insert_without_resize(key, value)  # O(1/(1-α))
-        # Общая сложность: O(n)
+    def _find(self, key, full_hash):
+        """
+        Поиск ячейки ключа
 
-    def _insert_without_resize(self, key, value):
+        Возвращает (индекс ключа или -1, первая свободная ячейка на пути
+        пробирования или -1, число пробирований; для swiss - число
+        просмотренных групп)
+        Сложность: O(1/(1-α)) в среднем
         """
-        Внутренний метод вставки без проверки ресайза
+        if self.probing_method == "swiss":
+            return self._find_in_groups(key, full_hash)  # O(1/(1-α))
+        if self.probing_method == "robin_hood":
+            return self._find_robin_hood(key, full_hash)  # O(1/(1-α))
+
+        states, hashes, keys = self.states, self.hashes, self.keys  # O(1)
+        mask, step = self.mask, self._step(full_hash)  # O(1)
+        tag = full_hash & _TAG_MASK  # O(1)
+        index = full_hash & mask  # O(1)
+        free = -1  # O(1)
+        for attempt in range(self.size):  # O(1/(1-α)) итераций в среднем
+            state = states[index]  # O(1)
+
+            if state == EMPTY:  # O(1) - ключа дальше быть не может
+                return -1, (index if free < 0 else free), attempt + 1
+            if state == DELETED:  # O(1)
+                if free < 0:
+                    free = index  # O(1)
+            elif (
+                state == tag and hashes[index] == full_hash and keys[index] == key
+            ):  # O(1)
+                return index, free, attempt + 1  # O(1)
+            index = (index + step) & mask  # O(1)
+
+        return -1, free, self.size  # O(1)
+
+    def _displacement(self, index):
+        """Расстояние ключа в ячейке index от его начальной ячейки - O(1)"""
+        return (index - self.hashes[index]) & self.mask  # O(1)
+
+    def _find_robin_hood(self, key, full_hash):
+        """
+        Поиск при пробировании Robin Hood: искомый ключ не может стоять
+        дальше ключа, который ближе к своей начальной ячейке, чем искомый
         Сложность: O(1/(1-α)) в среднем
         """
-        attempt = 0  # O(1)
-        while attempt < self.size:  # O(1/(1-α)) итераций в среднем
-            index = self._hash(key, attempt)  # O(len(key))
+        states, hashes, keys = self.states, self.hashes, self.keys  # O(1)
+        tag = full_hash & _TAG_MASK  # O(1)
+        index = full_hash & self.mask  # O(1)
+        for distance in range(self.size):  # O(1/(1-α)) итераций в среднем
+            state = states[index]  # O(1)
+            if state == EMPTY or self._displacement(index) < distance:  # O(1)
+                return -1, -1, distance + 1  # O(1)
+            if state == tag and hashes[index] == full_hash and keys[index] == key:
+                return index, -1, distance + 1  # O(1)
+            index = (index + 1) & self.mask  # O(1)
+        return -1, -1, self.size  # O(1)
+
+    def _find_in_groups(self, key, full_hash):
+        """
+        Поиск по группам управляющих байтов (swiss)
 
-            if self.table[index] is None or self.table[index] is self.DELETED:
-                self.table[index] = (key, value)  # O(1)
-                self.count += 1  # O(1)
-                return True  # O(1)
-            elif self.table[index][0] == key:  # O(1)
-                self.table[index] = (key, value)  # O(1)
-                return True  # O(1)
+        Начальная группа задается битами хеша выше 7 младших, сами 7
+        младших бит ищутся в группе вызовом bytearray.find (цикл на C);
+        группа со свободной ячейкой завершает поиск.
+        Сложность: O(1/(1-α)) групп в среднем
+        """
+        states, hashes, keys = self.states, self.hashes, self.keys  # O(1)
+        tag = full_hash & _TAG_MASK  # O(1)
+        group_mask = self.size // _GROUP_WIDTH - 1  # O(1)
+        group = (full_hash >> 7) & group_mask  # O(1)
+        free = -1  # O(1)
+        for attempt in range(group_mask + 1):  # O(1/(1-α)) итераций в среднем
+            start = group * _GROUP_WIDTH  # O(1)
+            end = start + _GROUP_WIDTH  # O(1)
+
+            match = states.find(tag, start, end)  # O(16) - поиск на C
+            while match >= 0:  # O(1) совпадений в среднем
+                if hashes[match] == full_hash and keys[match] == key:  # O(1)
+                    return match, free, attempt + 1  # O(1)
+                match = states.find(tag, match + 1, end)  # O(16)
+
+            empty = states.find(EMPTY, start, end)  # O(16)
+            if free < 0:
+                deleted = states.find(DELETED, start, end)  # O(16)
+                if empty >= 0 or deleted >= 0:
+                    free = min(i for i in (empty, deleted) if i >= 0)  # O(1)
+            if empty >= 0:  # O(1) - ключа в следующих группах быть не может
+                return -1, free, attempt + 1  # O(1)
+            group = (group + attempt + 1) & group_mask  # O(1) - квадратичный шаг
+
+        return -1, free, group_mask + 1  # O(1)
+
+    def _place(self, full_hash, key, value):
+        """
+        Вставка заведомо нового ключа без проверки на совпадение
+        (при увеличении таблицы: ключи уникальны, хеш уже известен)
+        Сложность: O(1/(1-α)) в среднем
+        """
+        if self.probing_method == "robin_hood":
+            self._place_robin_hood(full_hash, key, value)  # O(1/(1-α))
+            return
+
+        states, mask = self.states, self.mask  # O(1)
+        if self.probing_method == "swiss":
+            group_mask = self.size // _GROUP_WIDTH - 1  # O(1)
+            group = (full_hash >> 7) & group_mask  # O(1)
+            attempt = 0  # O(1)
+            while True:  # O(1/(1-α)) групп в среднем
+                start = group * _GROUP_WIDTH  # O(1)
+                index = states.find(EMPTY, start, start + _GROUP_WIDTH)  # O(16)
+                if index >= 0:
+                    break
+                attempt += 1  # O(1)
+                group = (group + attempt) & group_mask  # O(1) - квадратичный шаг
+            self._store(index, full_hash, key, value)  # O(1)
+            return
+
+        step = self._step(full_hash)  # O(1)
+        index = full_hash & mask  # O(1)
+        while states[index] < EMPTY:  # O(1/(1-α)) итераций в среднем
+            index = (index + step) & mask  # O(1)
+        self._store(index, full_hash, key, value)  # O(1)
+
+    def _place_robin_hood(self, full_hash, key, value):
+        """
+        Вставка Robin Hood: переносимый ключ занимает ячейку ключа, стоящего
+        ближе к своей начальной ячейке, и дальше переносится вытесненный
+        Сложность: O(1/(1-α)) в среднем
+        """
+        states, hashes, keys, values = self.states, self.hashes, self.keys, self.values
+        index = full_hash & self.mask  # O(1)
+        distance = 0  # O(1)
+        while states[index] != EMPTY:  # O(1/(1-α)) итераций в среднем
+            resident = self._displacement(index)  # O(1)
+            if resident < distance:  # O(1) - забираем ячейку у более близкого
+                full_hash, hashes[index] = hashes[index], full_hash  # O(1)
+                key, keys[index] = keys[index], key  # O(1)
+                value, values[index] = values[index], value  # O(1)
+                states[index] = hashes[index] & _TAG_MASK  # O(1)
+                distance = resident  # O(1)
+            index = (index + 1) & self.mask  # O(1)
+            distance += 1  # O(1)
+        self._store(index, full_hash, key, value)  # O(1)
+
+    def _store(self, index, full_hash, key, value):
+        """Запись элемента в свободную ячейку - O(1)"""
+        if self.states[index] == DELETED:  # O(1) - маркер переиспользован
+            self.deleted -= 1  # O(1)
+        self.keys[index] = key  # O(1)
+        self.values[index] = value  # O(1)
+        self.hashes[index] = full_hash  # O(1)
+        self.states[index] = full_hash & _TAG_MASK  # O(1)
+        self.count += 1  # O(1)
+
+    def _clear(self, index, state=EMPTY):
+        """Освобождение ячейки - O(1)"""
+        self.states[index] = state  # O(1)
+        self.keys[index] = None  # O(1) - освобождаем ссылки
+        self.values[index] = None  # O(1)
 
-            attempt += 1  # O(1)
+    def _resize(self, new_size):
+        """
+        Перестраивает таблицу в размере new_size (в прежнем размере -
+        чтобы убрать маркеры удаления)
+        Сложность: O(n) где n - количество элементов
+        Хеши ключей не пересчитываются - берутся из hashes
+        """
+        old_states, old_hashes = self.states, self.hashes  # O(1)
+        old_keys, old_values = self.keys, self.values  # O(1)
 
-        return False  # O(1) - не удалось вставить
+        self._allocate(new_size)  # O(new_size)
+        for i in range(len(old_states)):  # O(old_size) итераций
+            if old_states[i] < EMPTY:  # O(1) - занятая ячейка
+                self._place(old_hashes[i], old_keys[i], old_values[i])  # O(1)
+        # Общая сложность: O(n)
+
+    def _rebuild_if_needed(self):
+        """
+        Перестроение перед вставкой, если занятые ячейки вместе с маркерами
+        удаления достигли порога заполнения
+        Сложность: O(1), при перестроении O(n) (амортизированно O(1))
+        """
+        limit = self.load_factor_threshold * self.size  # O(1)
+        if self.count + self.deleted < limit:  # O(1)
+            return
+        if self.count * 2 >= limit:  # O(1) - живых элементов много
+            self._resize(self.size * 2)  # O(n)
+        else:
+            self._resize(self.size)  # O(n) - только очистка маркеров
 
     def insert(self, key, value):
         """
@@ -82,26 +297,21 @@ class HashTableOpenAddressing:
         Худшая сложность: O(n)
         """
         # Проверяем необходимость ресайза перед вставкой
-        if self.load_factor >= self.load_factor_threshold:  # O(1)
+        self._rebuild_if_needed()  # O(1) амортизированно
+
+        full_hash = self._full_hash(key)  # O(len(key)) - один раз
+        index, free, _ = self._find(key, full_hash)  # O(1/(1-α))
+
+        if index >= 0:  # O(1) - ключ уже есть, обновляем значение
+            self.values[index] = value  # O(1)
+        elif self.probing_method == "robin_hood" and self.count < self.size:
+            self._place_robin_hood(full_hash, key, value)  # O(1/(1-α))
+        elif free >= 0:  # O(1) - для robin_hood free всегда -1
+            self._store(free, full_hash, key, value)  # O(1)
+        else:
+            # Если таблица полная, увеличиваем размер и пробуем снова
             self._resize(self.size * 2)  # O(n)
-
-        attempt = 0  # O(1)
-        while attempt < self.size:  # O(1/(1-α)) итераций в среднем
-            index = self._hash(key, attempt)  # O(len(key))
-
-            if self.table[index] is None or self.table[index] is self.DELETED:
-                self.table[index] = (key, value)  # O(1)
-                self.count += 1  # O(1)
-                return  # O(1)
-            elif self.table[index][0] == key:  # O(1)
-                self.table[index] = (key, value)  # O(1)
-                return  # O(1)
-
-            attempt += 1  # O(1)
-
-        # Если таблица полная, увеличиваем размер и пробуем снова
-        self._resize(self.size * 2)  # O(n)
-        self.insert(key, value)  # O(1) рекурсивный вызов
+            self.insert(key, value)  # O(1) рекурсивный вызов
 
     def search(self, key):
         """
@@ -109,22 +319,8 @@ class HashTableOpenAddressing:
         Средняя сложность: O(1/(1-α))
         Худшая сложность: O(n)
         """
-        attempt = 0  # O(1)
-        while attempt < self.size:  # O(1/(1-α)) итераций в среднем
-            index = self._hash(key, attempt)  # O(len(key))
-
-            if self.table[index] is None:  # O(1)
-                return None  # O(1)
-            elif (
-                self.table[index] is not self.DELETED and self.table[index][0] == key
-            ):  # O(1)
-                return self.table[index][1]  # O(1)
-
-            attempt += 1  # O(1)
-
-        return None  # O(1)
-        # Средняя сложность: O(1/(1-α))
-        # Худшая сложность: O(n)
+        index, _, _ = self._find(key, self._full_hash(key))  # O(1/(1-α))
+        return self.values[index] if index >= 0 else None  # O(1)
 
     def delete(self, key):
         """
@@ -132,30 +328,65 @@ class HashTableOpenAddressing:
         Средняя сложность: O(1/(1-α))
         Худшая сложность: O(n)
         """
-        attempt = 0  # O(1)
-        while attempt < self.size:  # O(1/(1-α)) итераций в среднем
-            index = self._hash(key, attempt)  # O(len(key))
-
-            if self.table[index] is None:  # O(1)
-                return False  # O(1)
-            elif (
-                self.table[index] is not self.DELETED and self.table[index][0] == key
-            ):  # O(1)
-                self.table[index] = self.DELETED  # O(1)
-                self.count -= 1  # O(1)
-                return True  # O(1)
-
-            attempt += 1  # O(1)
-
-        return False  # O(1)
-        # Средняя сложность: O(1/(1-α))
-        # Худшая сложность: O(n)
+        index, _, _ = self._find(key, self._full_hash(key))  # O(1/(1-α))
+        if index < 0:  # O(1)
+            return False  # O(1)
+
+        if self.probing_method == "robin_hood":
+            self._backward_shift(index)  # O(1/(1-α))
+        elif self.probing_method == "swiss" and self._group_has_empty(index):
+            # Группа не была заполнена - поиск через нее не проходил дальше
+            self._clear(index)  # O(1)
+        else:
+            self._clear(index, DELETED)  # O(1) - цепочку пробирования не рвем
+            self.deleted += 1  # O(1)
+        self.count -= 1  # O(1)
+        return True  # O(1)
+
+    def _group_has_empty(self, index):
+        """Есть ли свободная ячейка в группе ячейки index - O(16)"""
+        start = index - index % _GROUP_WIDTH  # O(1)
+        return self.states.find(EMPTY, start, start + _GROUP_WIDTH) >= 0  # O(16)
+
+    def _backward_shift(self, index):
+        """
+        Удаление Robin Hood без маркера: следующие ключи, стоящие не в
+        своей начальной ячейке, сдвигаются на одну ячейку назад
+        Сложность: O(1/(1-α)) в среднем
+        """
+        states, hashes, keys, values = self.states, self.hashes, self.keys, self.values
+        following = (index + 1) & self.mask  # O(1)
+        while states[following] != EMPTY and self._displacement(following) > 0:
+            states[index] = states[following]  # O(1)
+            hashes[index] = hashes[following]  # O(1)
+            keys[index] = keys[following]  # O(1)
+            values[index] = values[following]  # O(1)
+            index = following  # O(1)
+            following = (following + 1) & self.mask  # O(1)
+        self._clear(index)  # O(1)
 
     @property
     def load_factor(self):
         """Коэффициент заполнения - O(1)"""
         return self.count / self.size  # O(1)
 
+    def _probe_lengths(self):
+        """
+        Число пробирований для поиска каждого ключа таблицы
+        Сложность: O(size) + O(n/(1-α))
+        """
+        for i in range(self.size):  # O(size) итераций
+            if self.states[i] < EMPTY:  # O(1) - занятая ячейка
+                yield self._measure_probes(self.keys[i], self.hashes[i])
+
+    def get_probe_distribution(self):
+        """
+        Распределение длины пробирования: {число пробирований: число ключей}
+        (для swiss - число просмотренных групп)
+        Сложность: O(size) + O(n/(1-α))
+        """
+        return dict(sorted(Counter(self._probe_lengths()).items()))  # O(n)
+
     def get_collision_stats(self):
         """
         Статистика коллизий и пробирований
@@ -165,14 +396,11 @@ class HashTableOpenAddressing:
         max_probes = 0  # O(1)
         occupied_cells = 0  # O(1)
 
-        for i in range(self.size):  # O(size) итераций
-            if self.table[i] is not None and self.table[i] is not self.DELETED:
-                occupied_cells += 1  # O(1)
-                key, value = self.table[i]  # O(1)
-                # Измеряем количество пробирований для поиска этого элемента
-                probes = self._measure_probes(key)  # O(1/(1-α))
-                total_probes += probes  # O(1)
-                max_probes = max(max_probes, probes)  # O(1)
+        # Измеряем количество пробирований для поиска каждого элемента
+        for probes in self._probe_lengths():  # O(size) итераций
+            occupied_cells += 1  # O(1)
+            total_probes += probes  # O(1)
+            max_probes = max(max_probes, probes)  # O(1)
 
         avg_probes = total_probes / occupied_cells if occupied_cells > 0 else 0
 
@@ -181,24 +409,14 @@ class HashTableOpenAddressing:
             "max_probes": max_probes,
             "load_factor": self.load_factor,
             "occupied_cells": occupied_cells,
+            "deleted_cells": self.deleted,
         }
 
-    def _measure_probes(self, key):
+    def _measure_probes(self, key, full_hash=None):
         """
         Измеряет количество пробирований для поиска ключа
         Сложность: O(1/(1-α)) в среднем
         """
-        attempt = 0  # O(1)
-        while attempt < self.size:  # O(1/(1-α)) итераций
-            index = self._hash(key, attempt)  # O(len(key))
-
-            if self.table[index] is None:  # O(1)
-                break  # O(1)
-            elif (
-                self.table[index] is not self.DELETED and self.table[index][0] == key
-            ):  # O(1)
-                return attempt + 1  # O(1)
-
-            attempt += 1  # O(1)
-
-        return attempt + 1  # O(1)
+        if full_hash is None:
+            full_hash = self._full_hash(key)  # O(len(key))
+        return self._find(key, full_hash)[2]  # O(1/(1-α))
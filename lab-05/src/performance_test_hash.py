@@ -1,6 +1,6 @@
 import timeit
 from hash_table_chaining import HashTableChaining
-from hash_table_open_addressing import HashTableOpenAddressing
+from hash_table_open_addressing import HashTableOpenAddressing, PROBING_METHODS
 from generate_hash_data import generate_test_data
 
 
@@ -209,6 +209,85 @@ def test_collision_performance():
     return results  # O(1)
 
 
+def _distribution_percentile(distribution, fraction):
+    """
+    Перцентиль длины пробирования по распределению {длина: число ключей}
+    Сложность: O(число различных длин)
+    """
+    total = sum(distribution.values())  # O(k)
+    threshold = fraction * total  # O(1)
+    seen = 0  # O(1)
+    for probes, keys in distribution.items():  # O(k) - длины по возрастанию
+        seen += keys  # O(1)
+        if seen >= threshold:
+            return probes  # O(1)
+    return 0  # O(1) - пустая таблица
+
+
+def compare_probe_distributions(load_factors=(0.5, 0.7, 0.8, 0.9, 0.95), table_size=4096):
+    """
+    Сравнение распределений длины пробирования всех методов открытой
+    адресации при высоком коэффициенте заполнения
+
+    Таблица не увеличивается (порог 1.0), поэтому заполнение равно
+    заданному. Для swiss длина пробирования - число просмотренных групп
+    по 16 ячеек.
+    Сложность: O(нагрузки * методы * table_size)
+    """
+    results = {}  # O(1)
+    for target_lf in load_factors:  # O(нагрузки) итераций
+        print(f"Распределение пробирований при заполнении {target_lf}")  # O(1)
+        num_items = int(table_size * target_lf)  # O(1)
+        test_data = generate_test_data(num_items)  # O(num_items * 10)
+
+        results[target_lf] = {}  # O(1)
+        for probing_method in PROBING_METHODS:  # O(4) итераций
+            ht = HashTableOpenAddressing(
+                size=table_size,
+                probing_method=probing_method,
+                load_factor_threshold=1.0,
+            )  # O(table_size)
+            for key, value in test_data:  # O(num_items)
+                ht.insert(key, value)  # O(1/(1-α))
+
+            distribution = ht.get_probe_distribution()  # O(table_size)
+            total = sum(distribution.values())  # O(k)
+            results[target_lf][probing_method] = {  # O(k)
+                "distribution": distribution,
+                "average_probes": sum(
+                    probes * keys for probes, keys in distribution.items()
+                ) / total,
+                "p50": _distribution_percentile(distribution, 0.5),
+                "p90": _distribution_percentile(distribution, 0.9),
+                "p99": _distribution_percentile(distribution, 0.99),
+                "max_probes": max(distribution),
+                "load_factor": ht.load_factor,
+            }
+
+    return results  # O(1)
+
+
+def print_probe_distributions(results):
+    """
+    Вывод сравнения распределений длины пробирования
+    Сложность: O(результаты)
+    """
+    print("\nРАСПРЕДЕЛЕНИЕ ДЛИНЫ ПРОБИРОВАНИЯ (swiss - в группах по 16 ячеек):")
+    print(
+        f"{'Заполнение':<12} {'Метод':<12} {'Среднее':<10} {'p50':<6} "
+        f"{'p90':<6} {'p99':<6} {'Максимум':<8}"
+    )  # O(1)
+    print("-" * 64)  # O(1)
+
+    for target_lf, methods in results.items():  # O(нагрузки) итераций
+        for probing_method, data in methods.items():  # O(4) итераций
+            print(
+                f"{data['load_factor']:<12.3f} {probing_method:<12} "
+                f"{data['average_probes']:<10.2f} {data['p50']:<6} "
+                f"{data['p90']:<6} {data['p99']:<6} {data['max_probes']:<8}"
+            )  # O(1)
+
+
 def print_results_table(results):
     """
     Вывод результатов в виде таблицы
@@ -264,8 +343,12 @@ def run_all_performance_tests():
     print("\n3. Тестирование производительности при коллизиях...")  # O(1)
     results["collisions"] = test_collision_performance()  # O(3 * 50)
 
+    print("\n4. Распределение длины пробирования при высоком заполнении...")
+    results["probe_distributions"] = compare_probe_distributions()  # O(5 * 4 * 4096)
+
     # Вывод результатов
     print_results_table(results)  # O(результаты)
+    print_probe_distributions(results["probe_distributions"])  # O(результаты)
 
     return results  # O(1)
 
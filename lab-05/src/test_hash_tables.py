@@ -1,9 +1,36 @@
 import unittest
+from array import array
 from hash_table_chaining import HashTableChaining
-from hash_table_open_addressing import HashTableOpenAddressing
+from hash_table_open_addressing import (
+    HashTableOpenAddressing, EMPTY, DELETED, PROBING_METHODS
+)
 from hash_functions import simple_hash, polynomial_hash, djb2_hash
 
 
+def check_resize_reuses_hashes(test, ht, num_items=100):
+    """
+    Проверка для любой хеш-таблицы: при увеличении хеши ключей не
+    вычисляются заново - ровно один вызов хеш-функции на вставку
+    Сложность: O(num_items)
+    """
+    calls = []
+    hash_function = ht.hash_function
+
+    def counting_hash(key, table_size):
+        calls.append(key)  # O(1)
+        return hash_function(key, table_size)  # O(len(key))
+
+    ht.hash_function = counting_hash  # O(1)
+    for i in range(num_items):  # O(n)
+        ht.insert(f"key{i}", i)  # O(1) амортизированно
+
+    test.assertGreater(ht.size, num_items)  # O(1) - таблица увеличивалась
+    test.assertEqual(len(calls), num_items)  # O(1) - один хеш на вставку
+    test.assertEqual(ht.count, num_items)  # O(1)
+    for i in range(num_items):  # O(n)
+        test.assertEqual(ht.search(f"key{i}"), i)  # O(1)
+
+
 class TestHashFunctions(unittest.TestCase):
     """
     Тестирование хеш-функций
@@ -79,6 +106,15 @@ class TestHashTableChaining(unittest.TestCase):
         self.assertEqual(self.ht.search("a"), 1)  # O(1)
         self.assertEqual(self.ht.search("k"), 2)  # O(1)
 
+    def test_resize_reuses_hashes(self):
+        """Тест увеличения таблицы без повторного вычисления хешей - O(n)"""
+        check_resize_reuses_hashes(self, self.ht)  # O(n)
+
+    def test_power_of_two_size(self):
+        """Тест размера таблицы - степень двойки для индекса по маске"""
+        self.assertEqual(self.ht.size, 16)  # O(1) - size=10 округлен вверх
+        self.assertEqual(self.ht.mask, 15)  # O(1)
+
 
 class TestHashTableOpenAddressing(unittest.TestCase):
     """
@@ -113,6 +149,120 @@ class TestHashTableOpenAddressing(unittest.TestCase):
         self.assertIsNone(ht.search("key1"))  # O(1)
         self.assertEqual(ht.search("key2"), "value2")  # O(1)
 
+    def test_compact_layout(self):
+        """Тест компактного хранения в параллельных массивах - O(n)"""
+        ht = HashTableOpenAddressing(size=10)  # O(10)
+        ht.insert("key1", "value1")  # O(1)
+
+        self.assertIsInstance(ht.hashes, array)  # O(1)
+        self.assertEqual(ht.hashes.typecode, "q")  # O(1)
+        self.assertIsInstance(ht.states, bytearray)  # O(1)
+        index = ht.keys.index("key1")  # O(size)
+        self.assertEqual(ht.states[index], ht.hashes[index] & 0x7F)  # O(1)
+        self.assertLess(ht.states[index], EMPTY)  # O(1) - ячейка занята
+        self.assertEqual(ht.values[index], "value1")  # O(1)
+
+    def test_reinsert_after_delete(self):
+        """Тест повторной вставки после удаления - без дубликатов"""
+        for probing_method in ("linear", "double"):
+            ht = HashTableOpenAddressing(size=10, probing_method=probing_method)
+            for i in range(6):  # O(n)
+                ht.insert(f"key{i}", i)  # O(1)
+            ht.delete("key0")  # O(1)
+            ht.insert("key5", "new")  # O(1) - ключ за удаленной ячейкой
+
+            self.assertEqual(ht.search("key5"), "new")  # O(1)
+            self.assertEqual(ht.count, 5)  # O(1)
+            self.assertEqual(ht.keys.count("key5"), 1)  # O(size)
+
+    def test_resize_reuses_hashes(self):
+        """Тест увеличения таблицы без повторного вычисления хешей - O(n)"""
+        for probing_method in PROBING_METHODS:
+            ht = HashTableOpenAddressing(size=4, probing_method=probing_method)
+            check_resize_reuses_hashes(self, ht)  # O(n)
+
+    def test_double_hashing_full_cycle(self):
+        """Тест нечетного шага: двойное хеширование обходит всю таблицу"""
+        ht = HashTableOpenAddressing(
+            size=8, probing_method="double", load_factor_threshold=1.0
+        )  # O(8)
+        for i in range(8):  # O(n)
+            ht.insert(f"key{i}", i)  # O(size) в худшем случае
+
+        self.assertEqual(ht.size, 8)  # O(1) - заполнена без увеличения
+        for i in range(8):  # O(n)
+            self.assertEqual(ht.search(f"key{i}"), i)  # O(size)
+
+    def test_robin_hood(self):
+        """Тест Robin Hood: удаление сдвигом назад, без маркеров - O(n)"""
+        ht = HashTableOpenAddressing(size=16, probing_method="robin_hood")
+        for i in range(50):  # O(n)
+            ht.insert(f"key{i}", i)  # O(1) в среднем
+        for i in range(0, 50, 2):  # O(n)
+            self.assertTrue(ht.delete(f"key{i}"))  # O(1) в среднем
+
+        self.assertEqual(ht.count, 25)  # O(1)
+        self.assertNotIn(DELETED, ht.states)  # O(size) - маркеров нет
+        for i in range(50):  # O(n)
+            expected = None if i % 2 == 0 else i
+            self.assertEqual(ht.search(f"key{i}"), expected)  # O(1) в среднем
+
+    def test_swiss_groups(self):
+        """Тест группового пробирования с управляющими байтами - O(n)"""
+        ht = HashTableOpenAddressing(size=4, probing_method="swiss")  # O(16)
+        self.assertEqual(ht.size, 16)  # O(1) - не меньше одной группы
+        for i in range(200):  # O(n)
+            ht.insert(f"key{i}", i)  # O(1) в среднем
+        for i in range(0, 200, 3):  # O(n)
+            self.assertTrue(ht.delete(f"key{i}"))  # O(1) в среднем
+
+        for i in range(200):  # O(n)
+            expected = None if i % 3 == 0 else i
+            self.assertEqual(ht.search(f"key{i}"), expected)  # O(1) в среднем
+        self.assertEqual(ht.deleted, ht.states.count(DELETED))  # O(size)
+
+    def test_tombstones_cleanup(self):
+        """Тест очистки маркеров удаления при постоянной нагрузке - O(n)"""
+        ht = HashTableOpenAddressing(size=64, probing_method="linear")  # O(64)
+        for i in range(2000):  # O(n)
+            ht.insert(f"key{i}", i)  # O(1) амортизированно
+            if i >= 10:
+                ht.delete(f"key{i - 10}")  # O(1) в среднем
+
+        self.assertEqual(ht.count, 10)  # O(1)
+        self.assertEqual(ht.size, 64)  # O(1) - таблица не росла
+        self.assertLess(ht.count + ht.deleted, ht.size)  # O(1) - есть EMPTY
+        self.assertEqual(ht.search("key1995"), 1995)  # O(1)
+
+    def test_probe_distribution(self):
+        """Тест распределения длины пробирования - O(n)"""
+        for probing_method in PROBING_METHODS:
+            ht = HashTableOpenAddressing(size=64, probing_method=probing_method)
+            for i in range(40):  # O(n)
+                ht.insert(f"key{i}", i)  # O(1) в среднем
+
+            distribution = ht.get_probe_distribution()  # O(size)
+            self.assertEqual(sum(distribution.values()), 40)  # O(1)
+            self.assertGreaterEqual(min(distribution), 1)  # O(1)
+
+    def test_threshold_above_one(self):
+        """Тест порога заполнения больше 1: полная таблица увеличивается"""
+        for probing_method in PROBING_METHODS:
+            ht = HashTableOpenAddressing(
+                size=4, probing_method=probing_method, load_factor_threshold=1.5
+            )  # O(4)
+            for i in range(20):  # O(n)
+                ht.insert(f"key{i}", i)  # O(n) в худшем случае
+
+            self.assertEqual(ht.count, 20)  # O(1)
+            for i in range(20):  # O(n)
+                self.assertEqual(ht.search(f"key{i}"), i)  # O(1) в среднем
+
+    def test_unknown_probing_method(self):
+        """Тест неизвестного метода пробирования - O(1)"""
+        with self.assertRaises(ValueError):
+            HashTableOpenAddressing(probing_method="quadratic")  # O(1)
+
 
 def run_tests():
     """Запуск всех тестов - O(все тесты)"""
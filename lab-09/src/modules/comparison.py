@@ -3,7 +3,7 @@ import os
 import tracemalloc
 import matplotlib.pyplot as plt
 from typing import List, Tuple, Callable
-from modules.dynamic_programming import fib_memo, fib_tabulation
+from modules.dynamic_programming import fib_memo, fib_tabulation, fib_fast_doubling
 from modules.dynamic_programming import knapsack_01_with_items
 
 
@@ -37,6 +37,7 @@ def compare_fibonacci_algorithms(n_values: List[int]) -> None:
     Сравнивает производительность алгоритмов Фибоначчи:
     - С мемоизацией (top-down)
     - С табуляцией (bottom-up)
+    - Быстрым удвоением (fast doubling, O(log n))
 
     Строит графики времени и памяти, выводит данные в консоль.
 
@@ -45,6 +46,7 @@ def compare_fibonacci_algorithms(n_values: List[int]) -> None:
     """
     memo_times, memo_mem = [], []
     tabu_times, tabu_mem = [], []
+    fast_times, fast_mem = [], []
 
     for n in n_values:
         # Измерение для fib_memo
@@ -57,11 +59,18 @@ def compare_fibonacci_algorithms(n_values: List[int]) -> None:
         tabu_times.append(t2)
         tabu_mem.append(m2)
 
+        # Измерение для fib_fast_doubling
+        t3, m3 = measure_performance(fib_fast_doubling, n)
+        fast_times.append(t3)
+        fast_mem.append(m3)
+
     # Вывод в консоль
     print("Время выполнения (Top-Down):", memo_times)
     print("Время выполнения (Bottom-Up):", tabu_times)
+    print("Время выполнения (Fast Doubling):", fast_times)
     print("Память (Top-Down):", memo_mem)
     print("Память (Bottom-Up):", tabu_mem)
+    print("Память (Fast Doubling):", fast_mem)
 
     # Построение графиков
     plt.figure(figsize=(12, 5))
@@ -70,6 +79,7 @@ def compare_fibonacci_algorithms(n_values: List[int]) -> None:
     plt.subplot(1, 2, 1)
     plt.plot(n_values, memo_times, label="Top-Down (Memoization)", marker="o")
     plt.plot(n_values, tabu_times, label="Bottom-Up (Tabulation)", marker="o")
+    plt.plot(n_values, fast_times, label="Fast Doubling", marker="o")
     plt.title("Время выполнения Фибоначчи vs n")
     plt.xlabel("n")
     plt.ylabel("Время (мс)")
@@ -80,6 +90,7 @@ def compare_fibonacci_algorithms(n_values: List[int]) -> None:
     plt.subplot(1, 2, 2)
     plt.plot(n_values, memo_mem, label="Top-Down (Memoization)", marker="o")
     plt.plot(n_values, tabu_mem, label="Bottom-Up (Tabulation)", marker="o")
+    plt.plot(n_values, fast_mem, label="Fast Doubling", marker="o")
     plt.title("Потребление памяти Фибоначчи vs n")
     plt.xlabel("n")
     plt.ylabel("Память (КБ)")
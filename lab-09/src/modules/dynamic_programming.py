@@ -96,6 +96,39 @@ def fib_optimized(n: int) -> int:
     return curr
 
 
+def fib_fast_doubling(n: int, mod: Optional[int] = None) -> int:
+    """
+    Возвращает n-е число Фибоначчи методом быстрого удвоения (fast doubling).
+
+    Использует тождества F(2k) = F(k) * (2F(k+1) - F(k)) и
+    F(2k+1) = F(k)^2 + F(k+1)^2, проходя по битам n от старшего к младшему.
+
+    Args:
+        n (int): Позиция числа Фибоначчи.
+        mod (int, опционально): Модуль для вычисления F(n) mod mod.
+
+    Returns:
+        int: n-е число Фибоначчи (или его остаток по модулю mod).
+
+    Временная сложность: O(log n) умножений
+    Пространственная сложность: O(1)
+    """
+    if n <= 1:
+        return n if mod is None else n % mod
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+        if mod is not None:
+            a %= mod
+            b %= mod
+    return a
+
+
 def knapsack_01(weights: List[int], values: List[int], capacity: int) -> int:
     """
     Решает задачу 0/1 рюкзака: максимизация стоимости при ограниченной вместимости.